@@ -0,0 +1,185 @@
+import mmap
+import os
+import random
+import struct
+from logica_sodoku import *
+
+# ==============================
+# Banco de partidas en formato binario compacto
+# ==============================
+#
+# Estructura del archivo:
+#   Encabezado (ENCABEZADO):  firma b"SDKB", versión, tamaño de registro, cantidad de dificultades
+#   Índice (una entrada por dificultad, ENTRADA_INDICE): nombre, primer registro, cantidad de registros
+#   Registros de tamaño fijo, agrupados por dificultad. Cada registro tiene:
+#       sudoku        41 bytes (81 celdas de 4 bits, 0 = vacía)
+#       tablero_lleno 41 bytes (81 celdas de 4 bits)
+#
+# Cada byte guarda dos celdas (la primera en los 4 bits altos), así que el texto hexadecimal
+# de los 41 bytes es directamente el texto de 81 dígitos de tablero_a_texto (más un 0 de relleno).
+# Como los registros son de tamaño fijo, la partida i se ubica en O(1) sin leer el resto del archivo.
+#
+# El juego usa el banco solo a través del pool de partidas (ver pool_partidas.usar_banco): con un banco
+# activo, generar_partida_completa saca las partidas de acá en lugar de generarlas. generar_sudoku y
+# generar_sudoku_calificado no lo consultan; siempre generan.
+
+FIRMA = b"SDKB"
+VERSION = 1
+BYTES_TABLERO = 41
+TAMANIO_REGISTRO = 2 * BYTES_TABLERO
+ENCABEZADO = struct.Struct("<4sHHH")        # firma, versión, tamaño de registro, cantidad de dificultades
+ENTRADA_INDICE = struct.Struct("<8sII")     # nombre de la dificultad, primer registro, cantidad
+
+
+def empaquetar_tablero(tablero:list[list]) -> bytes:
+    """
+    Empaqueta un tablero 9x9 en 41 bytes (4 bits por celda).
+
+    Recibe:
+        tablero (list[list]): Tablero a empaquetar.
+
+    Retorno:
+        bytes: Los 41 bytes del tablero.
+    """
+    return bytes.fromhex(tablero_a_texto(tablero) + "0")
+
+
+def desempaquetar_tablero(datos:bytes) -> list[list]:
+    """
+    Convierte 41 bytes generados por empaquetar_tablero en un tablero 9x9.
+
+    Recibe:
+        datos (bytes): Los 41 bytes del tablero.
+
+    Retorno:
+        list[list]: El tablero 9x9.
+    """
+    return texto_a_tablero(datos.hex())
+
+
+def escribir_banco(ruta:str, partidas_por_dificultad:dict) -> None:
+    """
+    Escribe un banco binario. Las partidas se escriben a medida que se recorren, así que se pueden
+    pasar generadores y no hace falta tener todo el banco en memoria.
+
+    Recibe:
+        ruta (str): Archivo a crear.
+        partidas_por_dificultad (dict): {dificultad: iterable de (tablero_lleno, sudoku)}.
+    """
+    dificultades = list(partidas_por_dificultad)
+    inicio_registros = ENCABEZADO.size + ENTRADA_INDICE.size * len(dificultades)
+    indice = []
+
+    with open(ruta, "wb") as archivo:
+        archivo.seek(inicio_registros)  # El encabezado se escribe al final, cuando se conocen las cantidades
+        registro = 0
+        for dificultad in dificultades:
+            primero = registro
+            for tablero_lleno, sudoku in partidas_por_dificultad[dificultad]:
+                archivo.write(empaquetar_tablero(sudoku))
+                archivo.write(empaquetar_tablero(tablero_lleno))
+                registro += 1
+            indice.append((dificultad, primero, registro - primero))
+
+        archivo.seek(0)
+        archivo.write(ENCABEZADO.pack(FIRMA, VERSION, TAMANIO_REGISTRO, len(dificultades)))
+        for dificultad, primero, cantidad in indice:
+            archivo.write(ENTRADA_INDICE.pack(dificultad.encode("ascii"), primero, cantidad))
+
+
+def abrir_banco(ruta:str) -> dict:
+    """
+    Abre un banco binario con mmap. Solo se lee el encabezado; las partidas se leen cuando se piden.
+
+    Recibe:
+        ruta (str): Archivo del banco.
+
+    Retorno:
+        dict: {"archivo", "datos" (el mmap), "inicio" (byte del primer registro),
+               "indice" ({dificultad: (primer registro, cantidad)})}.
+
+    Excepciones:
+        ValueError: Si el archivo no es un banco válido: otra firma o versión, o un archivo cortado
+                    (más corto que el encabezado, el índice o los registros que el índice anuncia).
+    """
+    archivo = open(ruta, "rb")
+    tamanio_archivo = os.fstat(archivo.fileno()).st_size
+    if tamanio_archivo < ENCABEZADO.size:
+        archivo.close()
+        raise ValueError(f"{ruta} no es un banco de partidas válido (el archivo está cortado).")
+    datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    firma, version, tamanio_registro, cantidad_dificultades = ENCABEZADO.unpack_from(datos, 0)
+    inicio = ENCABEZADO.size + cantidad_dificultades * ENTRADA_INDICE.size
+    valido = (firma == FIRMA and version == VERSION and tamanio_registro == TAMANIO_REGISTRO
+              and inicio <= tamanio_archivo)
+
+    indice = {}
+    i = 0
+    while valido and i < cantidad_dificultades:
+        nombre, primero, cantidad = ENTRADA_INDICE.unpack_from(datos, ENCABEZADO.size + i * ENTRADA_INDICE.size)
+        valido = inicio + (primero + cantidad) * TAMANIO_REGISTRO <= tamanio_archivo
+        indice[nombre.rstrip(b"\0").decode("ascii", errors="replace")] = (primero, cantidad)
+        i += 1
+
+    if not valido:
+        datos.close()
+        archivo.close()
+        raise ValueError(f"{ruta} no es un banco de partidas válido.")
+    return {"archivo": archivo, "datos": datos, "inicio": inicio, "indice": indice}
+
+
+def cerrar_banco(banco:dict) -> None:
+    """
+    Cierra el mmap y el archivo de un banco abierto con abrir_banco.
+    """
+    banco["datos"].close()
+    banco["archivo"].close()
+
+
+def cantidad_partidas(banco:dict, dificultad:str) -> int:
+    """
+    Devuelve cuántas partidas de la dificultad indicada tiene el banco (0 si no tiene ninguna).
+    """
+    return banco["indice"].get(dificultad, (0, 0))[1]
+
+
+def leer_partida(banco:dict, dificultad:str, i:int) -> tuple[list[list], list[list]]:
+    """
+    Lee y decodifica la partida número i de una dificultad, en O(1).
+
+    Recibe:
+        banco (dict): Banco abierto con abrir_banco.
+        dificultad (str): "Facil", "Medio" o "Dificil".
+        i (int): Número de partida dentro de la dificultad (empieza en 0).
+
+    Retorno:
+        tuple[list[list], list[list]]: (tablero_lleno, sudoku).
+
+    Excepciones:
+        IndexError: Si i está fuera de rango para esa dificultad.
+    """
+    primero, cantidad = banco["indice"].get(dificultad, (0, 0))
+    if not 0 <= i < cantidad:
+        raise IndexError(f"El banco no tiene la partida {i} de {dificultad}.")
+
+    posicion = banco["inicio"] + (primero + i) * TAMANIO_REGISTRO
+    datos = banco["datos"]
+    sudoku = desempaquetar_tablero(datos[posicion:posicion + BYTES_TABLERO])
+    tablero_lleno = desempaquetar_tablero(datos[posicion + BYTES_TABLERO:posicion + TAMANIO_REGISTRO])
+    return tablero_lleno, sudoku
+
+
+def partida_aleatoria(banco:dict, dificultad:str, generador = random) -> tuple[list[list], list[list]]:
+    """
+    Devuelve una partida al azar de la dificultad indicada.
+
+    Recibe:
+        banco (dict): Banco abierto con abrir_banco.
+        dificultad (str): "Facil", "Medio" o "Dificil".
+        generador: Fuente de azar (el módulo random o una instancia de random.Random).
+
+    Retorno:
+        tuple[list[list], list[list]]: (tablero_lleno, sudoku).
+    """
+    return leer_partida(banco, dificultad, generador.randrange(cantidad_partidas(banco, dificultad)))
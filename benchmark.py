@@ -0,0 +1,389 @@
+import os
+import random
+import time
+import copy
+import sys
+from logica_sodoku import *
+from calificador import *
+from sesion_juego import *
+
+# ==============================
+# Benchmark de generación de tableros
+# Uso: python benchmark.py (desde la carpeta del juego, para que encuentre las imágenes y fuentes)
+# ==============================
+#
+# Las mediciones de dibujo usan pygame sin ventana ni sonido reales (drivers "dummy" de SDL), así se
+# pueden repetir en cualquier máquina. Se importan recién en iniciar_pygame: configuraciones abre la
+# ventana y arranca el hilo del pool, que no tienen que competir con las otras mediciones.
+
+def llenar_tablero_escaneo(tablero: list[list]) -> bool:
+    """
+    Versión original de llenar_tablero (antes de las máscaras de bits), se conserva solo para comparar.
+    Busca la celda vacía desde (0, 0) en cada nivel y verifica cada candidato con es_valido.
+
+    Recibe:
+        tablero: Una matriz 9x9 con celdas vacías (0).
+
+    Retorno:
+        True si el tablero fue llenado completamente, False si no se pudo llenar.
+    """
+    tablero_lleno = True
+
+    for fila in range(9):
+        for col in range(9):
+            if tablero[fila][col] == 0:
+                numeros = list(range(1, 10))
+                random.shuffle(numeros)
+                tablero_lleno = False
+
+                for num in numeros:
+                    if es_valido(tablero, fila, col, num):
+                        tablero[fila][col] = num
+                        if llenar_tablero_escaneo(tablero):
+                            tablero_lleno = True
+                            break
+                        tablero[fila][col] = 0
+                break
+
+        if not tablero_lleno:
+            break
+
+    return tablero_lleno
+
+
+def medir(nombre: str, funcion, repeticiones: int) -> float:
+    """
+    Ejecuta `funcion` la cantidad de veces indicada e imprime cuántas ejecuciones por segundo logra.
+
+    Recibe:
+        nombre: Texto que se muestra en el reporte.
+        funcion: Función sin parámetros a medir.
+        repeticiones: Cantidad de ejecuciones.
+
+    Retorno:
+        Las ejecuciones por segundo.
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    duracion = time.perf_counter() - inicio
+    por_segundo = repeticiones / duracion
+    print(f"{nombre:<40} {por_segundo:>10.1f} /s   ({duracion * 1000 / repeticiones:.3f} ms c/u)")
+    return por_segundo
+
+
+def benchmark_tableros(repeticiones: int = 300) -> None:
+    """
+    Compara tableros por segundo entre el llenado original (escaneo) y generar_tablero.
+    """
+    random.seed(0)
+    antes = medir("llenar_tablero (escaneo, original)",
+                  lambda: llenar_tablero_escaneo(inicializar_matriz(9, 9, 0)), repeticiones)
+    random.seed(0)
+    despues = medir("generar_tablero (MRV iterativo)", generar_tablero, repeticiones)
+    print(f"Mejora: x{despues / antes:.1f}")
+
+
+def benchmark_sudoku_unico(repeticiones: int = 200) -> None:
+    """
+    Mide generar_sudoku con solución única para cada dificultad (sin contar generar_tablero).
+    """
+    random.seed(0)
+    tableros = [generar_tablero() for _ in range(repeticiones)]
+    for dificultad in ("Facil", "Medio", "Dificil"):
+        pendientes = list(tableros)
+        medir(f"generar_sudoku unico ({dificultad})",
+              lambda: generar_sudoku(pendientes.pop(), dificultad, solucion_unica=True), repeticiones)
+
+
+def benchmark_resolvedor(repeticiones: int = 200) -> None:
+    """
+    Mide resolver (Dancing Links) contra el backtracking de llenar_tablero sobre los mismos sudokus difíciles.
+    """
+    random.seed(0)
+    sudokus = [generar_sudoku(generar_tablero(), "Dificil", solucion_unica=True) for _ in range(repeticiones)]
+    pendientes = [copy.deepcopy(s) for s in sudokus]
+    medir("llenar_tablero sobre sudoku Dificil", lambda: llenar_tablero(pendientes.pop()), repeticiones)
+    pendientes = list(sudokus)
+    medir("resolver (Dancing Links)", lambda: resolver(pendientes.pop()), repeticiones)
+    pendientes = list(sudokus)
+    medir("contar_soluciones(limite=2)", lambda: contar_soluciones(pendientes.pop(), 2), repeticiones)
+
+
+def benchmark_calificador(repeticiones: int = 200) -> None:
+    """
+    Mide calificar_texto (sin caché) y la generación calificada por dificultad.
+    """
+    random.seed(0)
+    sudokus = [tablero_a_texto(generar_sudoku(generar_tablero(), "Dificil", solucion_unica=True)) for _ in range(repeticiones)]
+    medir("calificar_texto (Dificil)", lambda: calificar_texto(sudokus.pop()), repeticiones)
+    for dificultad in ("Facil", "Medio", "Dificil"):
+        medir(f"generar_sudoku_calificado ({dificultad})",
+              lambda: generar_sudoku_calificado(generar_tablero(), dificultad, presupuesto_ms=None), 30)
+
+
+def benchmark_tablero(repeticiones: int = 20000) -> None:
+    """
+    Compara la memoria y el costo de copia de un tablero como lista de listas y como Tablero plano.
+    """
+    random.seed(0)
+    matriz = generar_sudoku(generar_tablero(), "Medio")
+    tablero = Tablero.desde_matriz(matriz, marcar_fijas=True)
+    bytes_matriz = sys.getsizeof(matriz) + sum(sys.getsizeof(fila) for fila in matriz)
+    bytes_tablero = sys.getsizeof(tablero) + sys.getsizeof(tablero.celdas) + sys.getsizeof(tablero.fijas)
+    print(f"Memoria por tablero: lista de listas {bytes_matriz} bytes, Tablero {bytes_tablero} bytes")
+    medir("copy.deepcopy (lista de listas)", lambda: copy.deepcopy(matriz), repeticiones)
+    medir("copia por filas (lista de listas)", lambda: [fila[:] for fila in matriz], repeticiones)
+    medir("Tablero.copia", tablero.copia, repeticiones)
+
+
+
+def simular_partida(tablero_lleno:list[list], sudoku:list[list], dificultad:str, generador:random.Random) -> SesionJuego:
+    """
+    Juega una partida completa con SesionJuego, sin pygame: selecciona cada celda vacía en orden
+    aleatorio y la completa, equivocándose antes una de cada diez veces.
+    """
+    sesion = SesionJuego(tablero_lleno, sudoku, dificultad)
+    lado = len(sudoku)
+    vacias = [(fila, col) for fila in range(lado) for col in range(lado) if sudoku[fila][col] == 0]
+    generador.shuffle(vacias)
+    for fila, col in vacias:
+        sesion.seleccionar(fila, col)
+        correcto = tablero_lleno[fila][col]
+        if generador.random() < 0.1:
+            sesion.colocar(correcto % lado + 1)  # Un número equivocado
+        sesion.colocar(correcto)
+        sesion.avanzar_reloj(5)
+    return sesion
+
+
+def benchmark_sesiones(cantidad: int = 5000) -> None:
+    """
+    Mide cuántas partidas completas por segundo se pueden simular con SesionJuego (sin ventana).
+    Las partidas se generan antes de medir, así solo se mide el juego.
+    """
+    partidas = [generar_partida(semilla, "Medio") for semilla in range(20)]
+    generador = random.Random(0)
+    terminadas = 0
+    inicio = time.perf_counter()
+    for i in range(cantidad):
+        tablero_lleno, sudoku = partidas[i % len(partidas)]
+        sesion = simular_partida(tablero_lleno, sudoku, "Medio", generador)
+        terminadas += sesion.terminado()
+    duracion = time.perf_counter() - inicio
+    print(f"SesionJuego: {cantidad} partidas en {duracion:.2f} s ({cantidad / duracion:,.0f} partidas/s), "
+          f"{terminadas} terminadas")
+
+
+def iniciar_pygame():
+    """
+    Prepara pygame con los drivers "dummy" de SDL (salvo que ya se haya elegido otro con las variables
+    de entorno), importa configuraciones (que crea la ventana y arranca el pool de partidas) y espera a
+    que el pool se llene, para que su hilo no le robe tiempo a las mediciones.
+
+    Retorno:
+        El módulo configuraciones.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import configuraciones
+    import pool_partidas
+    while any(pool["profundidad"] < pool_partidas.TAMANIO_POOL for pool in pool_partidas.metricas_pool().values()):
+        time.sleep(0.05)
+    return configuraciones
+
+
+def uso_de_cpu(nombre: str, paso, segundos: float) -> None:
+    """
+    Repite `paso` durante `segundos` e imprime cuántas vueltas por segundo dio y qué porcentaje de un
+    núcleo ocupó (tiempo de CPU del proceso sobre tiempo real).
+    """
+    vueltas = 0
+    inicio = time.perf_counter()
+    inicio_cpu = time.process_time()
+    while time.perf_counter() - inicio < segundos:
+        paso()
+        vueltas += 1
+    duracion = time.perf_counter() - inicio
+    cpu = time.process_time() - inicio_cpu
+    print(f"{nombre:<40} {vueltas / duracion:>10.1f} /s   CPU {100 * cpu / duracion:.0f}%")
+
+
+def benchmark_pantalla_juego(cuadros: int = 200, segundos: float = 2) -> None:
+    """
+    Compara un cuadro de la pantalla de juego dibujado entero (mostrar_pantalla_juego, que actualiza toda
+    la ventana, como antes de PantallaJuego) y por regiones (PantallaJuego.dibujar), para cada tamaño de
+    tablero y cuatro tipos de cuadro: sin cambios, con el temporizador avanzando, con una celda que se
+    escribe o se borra y con la selección moviéndose. También muestra cuántos píxeles actualiza cada
+    cuadro por regiones y, con la pantalla quieta, el uso de CPU del bucle sin tope de cuadros y con
+    reloj.tick(FPS_MAXIMOS).
+    """
+    c = iniciar_pygame()
+    import pygame
+    from biblioteca import mostrar_pantalla_juego
+    from dibujo_por_regiones import PantallaJuego
+    from recursos import cargar_fondo
+
+    fondo = cargar_fondo(c.RUTA_FONDO_JUEGO)
+    for lado in TAMANIOS_VALIDOS:
+        generador = random.Random(0)
+        tablero_lleno = generar_tablero(generador, lado)
+        sudoku = generar_sudoku(tablero_lleno, "Medio", solucion_unica=True, generador=generador)
+        vacias = [(fila, col) for fila in range(lado) for col in range(lado) if sudoku[fila][col] == 0]
+        tamanio_celda = c.TABLERO_ANCHO // lado
+        fuente_numeros = c.FUENTES_NUMEROS[lado]
+        fuente_marcas = c.fuente_marcas if lado == 9 else None
+
+        def celda(sesion, i):
+            fila, col = vacias[i // 2 % len(vacias)]
+            if i % 2 == 0:
+                sesion.colocar(tablero_lleno[fila][col], fila, col)
+            else:
+                sesion.borrar(fila, col)
+
+        escenarios = (("sin cambios", lambda sesion, i: None),
+                      ("temporizador", lambda sesion, i: sesion.avanzar_reloj(1)),
+                      ("celda", celda),
+                      ("selección", lambda sesion, i: sesion.seleccionar(i % lado, (i * 2) % lado)))
+
+        for nombre, cambio in escenarios:
+            for por_regiones in (False, True):
+                sesion = SesionJuego(tablero_lleno, sudoku, "Medio", candidatos=True)
+                sesion.seleccionar(lado // 2, lado // 2)
+                pantalla = PantallaJuego()
+                pantalla.dibujar(c.ventana, sesion, fuente_numeros, c.fuente_texto, c.BLANCO, fondo, c.TABLERO_ANCHO,
+                                 c.TABLERO_ALTO, c.MARGEN_IZQUIERDO, c.MARGEN_SUPERIOR, c.CELESTE, c.AMARILLO_CLARO,
+                                 c.GRIS_OSCURO, c.ROSA, c.ROSA_CLARO, tamanio_celda, lado, c.NEGRO, c.ROJO, c.AZUL,
+                                 c.VALOR_BORDER_RADIUS, c.AMARILLO_OSCURO, fuente_marcas)
+                contador = iter(range(cuadros))
+                pixeles = [0]
+
+                def cuadro():
+                    cambio(sesion, next(contador))
+                    if por_regiones:
+                        rects = pantalla.dibujar(c.ventana, sesion, fuente_numeros, c.fuente_texto, c.BLANCO, fondo,
+                                                 c.TABLERO_ANCHO, c.TABLERO_ALTO, c.MARGEN_IZQUIERDO, c.MARGEN_SUPERIOR,
+                                                 c.CELESTE, c.AMARILLO_CLARO, c.GRIS_OSCURO, c.ROSA, c.ROSA_CLARO,
+                                                 tamanio_celda, lado, c.NEGRO, c.ROJO, c.AZUL, c.VALOR_BORDER_RADIUS,
+                                                 c.AMARILLO_OSCURO, fuente_marcas)
+                        pixeles[0] += sum(rect.width * rect.height for rect in rects)
+                    else:
+                        mostrar_pantalla_juego(sesion.sudoku, c.ventana, sesion.solucion, sesion.seleccionada,
+                                               fuente_numeros, sesion.segundos, sesion.errores, c.fuente_texto, c.BLANCO,
+                                               fondo, c.TABLERO_ANCHO, c.TABLERO_ALTO, c.MARGEN_IZQUIERDO,
+                                               c.MARGEN_SUPERIOR, c.CELESTE, c.AMARILLO_CLARO, c.GRIS_OSCURO, c.ROSA,
+                                               c.ROSA_CLARO, tamanio_celda, lado, c.NEGRO, c.ROJO, c.AZUL,
+                                               c.VALOR_BORDER_RADIUS, c.AMARILLO_OSCURO, fuente_marcas)
+
+                forma = "por regiones" if por_regiones else "entero"
+                medir(f"{lado}x{lado} {nombre} ({forma})", cuadro, cuadros)
+                if por_regiones:
+                    print(f"{'':<40} {pixeles[0] // cuadros:>10} píxeles actualizados por cuadro")
+
+    # Bucle con la pantalla quieta: antes sin tope y dibujando todo, ahora por regiones y con tope
+    sesion = SesionJuego(*generar_partida(0, "Medio"), "Medio", candidatos=True)
+    pantalla = PantallaJuego()
+
+    def cuadro_entero():
+        pygame.event.get()
+        mostrar_pantalla_juego(sesion.sudoku, c.ventana, sesion.solucion, sesion.seleccionada, c.fuente_numeros,
+                               sesion.segundos, sesion.errores, c.fuente_texto, c.BLANCO, fondo, c.TABLERO_ANCHO,
+                               c.TABLERO_ALTO, c.MARGEN_IZQUIERDO, c.MARGEN_SUPERIOR, c.CELESTE, c.AMARILLO_CLARO,
+                               c.GRIS_OSCURO, c.ROSA, c.ROSA_CLARO, c.tamanio_celda, 9, c.NEGRO, c.ROJO, c.AZUL,
+                               c.VALOR_BORDER_RADIUS, c.AMARILLO_OSCURO)
+
+    def cuadro_por_regiones():
+        pygame.event.get()
+        pantalla.dibujar(c.ventana, sesion, c.fuente_numeros, c.fuente_texto, c.BLANCO, fondo, c.TABLERO_ANCHO,
+                         c.TABLERO_ALTO, c.MARGEN_IZQUIERDO, c.MARGEN_SUPERIOR, c.CELESTE, c.AMARILLO_CLARO,
+                         c.GRIS_OSCURO, c.ROSA, c.ROSA_CLARO, c.tamanio_celda, 9, c.NEGRO, c.ROJO, c.AZUL,
+                         c.VALOR_BORDER_RADIUS, c.AMARILLO_OSCURO)
+        c.reloj.tick(c.FPS_MAXIMOS)
+
+    uso_de_cpu("bucle quieto, entero y sin tope", cuadro_entero, segundos)
+    uso_de_cpu("bucle quieto, por regiones con tope", cuadro_por_regiones, segundos)
+
+
+def benchmark_imagenes(repeticiones: int = 200) -> None:
+    """
+    Mide la carga de los fondos con recursos.cargar_fondo: la primera vez (se decodifica, se escala y
+    se convierte) y las siguientes (salen de la caché), y compara el blit de cada fondo a la ventana
+    tal como lo devuelve pygame.image.load (sin convertir, como antes de recursos) y ya convertido.
+    """
+    c = iniciar_pygame()
+    import pygame
+    from recursos import cargar_imagen, cargar_fondo
+
+    rutas = (c.RUTA_FONDO, c.RUTA_FONDO_JUEGO, c.RUTA_FONDO_PANTALLA_GANADORES)
+    cargar_imagen.cache_clear()
+    for ruta in rutas:
+        inicio = time.perf_counter()
+        cargar_fondo(ruta)
+        print(f"{'carga en frío ' + os.path.basename(ruta):<40} {(time.perf_counter() - inicio) * 1000:>10.1f} ms")
+    medir("cargar_fondo en caché", lambda: cargar_fondo(c.RUTA_FONDO_JUEGO), repeticiones * 50)
+
+    for ruta in rutas:
+        sin_convertir = pygame.image.load(ruta)
+        convertida = cargar_fondo(ruta)
+        nombre = os.path.basename(ruta)
+        medir(f"blit sin convertir {nombre}", lambda: c.ventana.blit(sin_convertir, (0, 0)), repeticiones)
+        medir(f"blit convertida {nombre}", lambda: c.ventana.blit(convertida, (0, 0)), repeticiones)
+
+
+def benchmark_reposo(segundos: float = 3, esperas: int = 10) -> None:
+    """
+    Compara cuántas veces por segundo se despierta el bucle principal con la pantalla quieta y cuánta
+    CPU usa, tomando los eventos con pygame.event.get (antes) y con obtener_eventos (ahora), los dos con
+    reloj.tick(FPS_MAXIMOS). Después mide cuánto tarda obtener_eventos en volver cuando otro hilo publica
+    un evento mientras duerme.
+
+    Con el driver "dummy" de SDL, pygame.event.wait revisa la cola cada milisegundo en lugar de
+    bloquearse, así que la CPU de los dos bucles sale parecida; con un driver de video real la espera
+    no gasta CPU. Las vueltas por segundo sí se comparan bien en los dos casos.
+    """
+    c = iniciar_pygame()
+    import threading
+    import pygame
+    from biblioteca import obtener_eventos
+
+    def vuelta_antes():
+        pygame.event.get()
+        c.reloj.tick(c.FPS_MAXIMOS)
+
+    def vuelta_ahora():
+        obtener_eventos(True, c.ESPERA_REPOSO_MS)
+        c.reloj.tick(c.FPS_MAXIMOS)
+
+    uso_de_cpu("bucle quieto con event.get", vuelta_antes, segundos)
+    uso_de_cpu("bucle quieto con obtener_eventos", vuelta_ahora, segundos)
+
+    demoras = []
+    for _ in range(esperas):
+        pygame.event.clear()
+        publicado = []
+
+        def publicar():
+            publicado.append(time.perf_counter())
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_1, mod=0))
+
+        temporizador = threading.Timer(0.1, publicar)
+        temporizador.start()
+        eventos = []
+        while not any(evento.type == pygame.KEYDOWN for evento in eventos):
+            eventos = obtener_eventos(True, c.ESPERA_REPOSO_MS)
+        demoras.append((time.perf_counter() - publicado[0]) * 1000)
+        temporizador.join()
+    print(f"{'obtener_eventos despierta con un evento':<40} {sum(demoras) / len(demoras):>10.2f} ms de media, "
+          f"{max(demoras):.2f} ms como máximo")
+
+
+if __name__ == "__main__":
+    benchmark_tableros()
+    benchmark_sudoku_unico()
+    benchmark_resolvedor()
+    benchmark_calificador()
+    benchmark_tablero()
+    benchmark_sesiones()
+    benchmark_pantalla_juego()
+    benchmark_imagenes()
+    benchmark_reposo()
@@ -1,45 +1,93 @@
 import pygame
+from functools import lru_cache
 from configuraciones import *
 from puntaje import *
 from logica_sodoku import *
+from pool_partidas import *
+from sesion_juego import *
 
 #------------------------------------------------------------------------------------------------------------------------
 #FUNCIONES MOVIDAS DEL MAIN A LA BIBLIOTECA
+# Teclas de cada número: del 1 al 9 las teclas numéricas y del 10 al 25 las letras A a P (como en SIMBOLOS)
+TECLAS_NUMEROS = (None,) + tuple(pygame.K_1 + i for i in range(9)) + tuple(pygame.K_a + i for i in range(16))
+
+
+@lru_cache(maxsize=None)
+def celdas_resaltadas_de_tamanio(lado:int) -> tuple:
+    '''
+    Celdas a resaltar para cada celda seleccionada de un tablero de lado x lado: sus vecinos y ella
+    misma, sin repetir. Se arma una sola vez por tamaño, así el resaltado no crea ninguna lista en cada cuadro.
+    '''
+    vecinos_fila_col = tablas_de_tamanio(lado)["vecinos_fila_col"]
+    return tuple(vecinos_fila_col[celda] + (divmod(celda, lado),) for celda in range(lado * lado))
+
 # Función para calcular celdas a resaltar
-def calcular_resaltado(fila:int, col:int) -> list:
+def calcular_resaltado(fila:int, col:int, lado:int = 9) -> tuple:
     '''
-    Esta funcion calcula las celdas resaltadas de un tablero basandose en una fila, una columna y un bloque 3x3
+    Esta funcion devuelve las celdas resaltadas de un tablero basandose en una fila, una columna y un bloque
     Verifica previamente si la selección está dentro del tablero.
         Recibe:
         fila (int) sería la fila seleccionada del tablero.
         col (int) sería la columna seleccionada del tablero.
+        lado (int) el tamaño del tablero (9, 16 o 25).
         Devuelve:
-        celdas_resaltadas (list) una lista con las coordenadas de las celdas resaltadas.
+        celdas_resaltadas (tuple) las coordenadas (fila, col) de las celdas resaltadas (21 en el 9x9; tupla precalculada, no se debe modificar).
     '''
     # Verificar si la celda seleccionada está dentro del área válida
-    if 0 <= fila < 9 and 0 <= col < 9:
-        celdas_resaltadas = []
-
-        # Resaltar la fila completa
-        for c in range(9):
-            celdas_resaltadas.append((fila, c))
-
-        # Resaltar la columna completa
-        for f in range(9):
-            celdas_resaltadas.append((f, col))
-
-        # Resaltar el bloque 3x3
-        bloque_fila = (fila // 3) * 3
-        bloque_col = (col // 3) * 3
-        for f in range(bloque_fila, bloque_fila + 3):
-            for c in range(bloque_col, bloque_col + 3):
-                celdas_resaltadas.append((f, c))
+    if 0 <= fila < lado and 0 <= col < lado:
+        celdas_resaltadas = celdas_resaltadas_de_tamanio(lado)[fila * lado + col]
     else:
-        celdas_resaltadas = []  # Si está fuera del tablero, no hay resaltado
+        celdas_resaltadas = ()  # Si está fuera del tablero, no hay resaltado
     
     return celdas_resaltadas
 
 
+@lru_cache(maxsize=4)
+def rectangulos_celdas(MARGEN_IZQUIERDO:int, MARGEN_SUPERIOR:int, tamanio_celda:int, lado:int = 9) -> tuple:
+    '''
+    Devuelve los rectángulos en pantalla de las celdas (índice fila * lado + col). Se calculan una vez
+    por cada posición y tamaño del tablero y después se reutilizan en cada cuadro.
+
+    Parámetros:
+    MARGEN_IZQUIERDO (int): El margen izquierdo donde comienza el tablero en la ventana.
+    MARGEN_SUPERIOR (int): El margen superior donde comienza el tablero en la ventana.
+    tamanio_celda (int): El tamaño de cada celda del tablero en píxeles.
+    lado (int): Cantidad de celdas por fila y por columna.
+
+    Devuelve:
+    tuple: Los lado * lado pygame.Rect de las celdas.
+    '''
+    return tuple(pygame.Rect(MARGEN_IZQUIERDO + col * tamanio_celda, MARGEN_SUPERIOR + fila * tamanio_celda,
+                             tamanio_celda, tamanio_celda) for fila in range(lado) for col in range(lado))
+
+
+@lru_cache(maxsize=16)
+def atlas_glifos(fuente:pygame.font.Font, tamanio:int, colores:tuple, cantidad:int = 9) -> dict:
+    '''
+    Dibuja una sola vez los números del 1 a `cantidad` (con SIMBOLOS) en cada color, y calcula cuánto
+    hay que correr cada uno desde la esquina de una celda de `tamanio` píxeles para que quede centrado.
+    Así el tablero se dibuja solo con blits, sin volver a rasterizar la fuente en cada cuadro.
+
+    Queda guardado por fuente, tamaño de celda, colores y cantidad: si cambia la fuente o el tamaño de
+    las celdas (por ejemplo, al pasar al 16x16), se arma otro atlas sin tener que borrar nada.
+
+    Parámetros:
+    fuente (pygame.font.Font): La fuente de los números.
+    tamanio (int): Lado en píxeles del cuadrado donde se centra cada número (una celda, o un tercio de celda para las marcas).
+    colores (tuple): Los colores en formato RGB en que se dibuja cada número.
+    cantidad (int): Hasta qué número se dibuja (el lado del tablero).
+
+    Devuelve:
+    dict: {(num, color): (superficie, dx, dy)}, donde (dx, dy) es la posición del número dentro del cuadrado.
+    '''
+    atlas = {}
+    for color in colores:
+        for num in range(1, cantidad + 1):
+            superficie = fuente.render(SIMBOLOS[num], True, color)
+            atlas[num, color] = (superficie, tamanio // 2 - superficie.get_width() // 2, tamanio // 2 - superficie.get_height() // 2)
+    return atlas
+
+
 def crear_fondo_transparente(TABLERO_ANCHO:int, TABLERO_ALTO:int, BLANCO:tuple) -> pygame.Surface:
     '''
     Crea un fondo semi-transparente para el tablero.
@@ -85,10 +133,11 @@ def dibujar_lineas(ventana: pygame.display, TAMANIO_TABLERO:int, NEGRO:tuple,
     Devuelve:
     None: Esta función no devuelve ningún valor.
     '''
+    subcuadro = isqrt(TAMANIO_TABLERO)  # Lado de cada bloque: 3 en el 9x9, 4 en el 16x16 y 5 en el 25x25
     # Este bucle dibuja las líneas horizontales y las verticales
     for i in range(TAMANIO_TABLERO + 1):
-        # Si el índice de la línea es múltiplo de 3 (líneas más gruesas para los bloques principales)
-        grosor = 4 if i % 3 == 0 else 1
+        # Si el índice de la línea es múltiplo del lado del bloque (líneas más gruesas para los bloques principales)
+        grosor = 4 if i % subcuadro == 0 else 1
         # Dibuja una línea horizontal:
         pygame.draw.line(ventana, NEGRO, (MARGEN_IZQUIERDO, MARGEN_SUPERIOR + i * tamanio_celda), 
                          (MARGEN_IZQUIERDO + TABLERO_ANCHO, MARGEN_SUPERIOR + i * tamanio_celda), grosor) # Empieza en el margen izquierdo y se extiende horizontalmente según el ancho del tablero.
@@ -97,9 +146,44 @@ def dibujar_lineas(ventana: pygame.display, TAMANIO_TABLERO:int, NEGRO:tuple,
                          (MARGEN_IZQUIERDO + i * tamanio_celda, MARGEN_SUPERIOR + TABLERO_ALTO), grosor)
 
 
+@lru_cache(maxsize=4)
+def capa_tablero(FONDO_JUEGO:pygame.Surface, BLANCO:tuple, NEGRO:tuple, MARGEN_IZQUIERDO:int, MARGEN_SUPERIOR:int,
+                 tamanio_celda:int, TAMANIO_TABLERO:int) -> tuple:
+    '''
+    Arma una sola vez la parte de la pantalla de juego que no cambia durante la partida: el fondo, el
+    panel semitransparente del tablero y la cuadrícula, todo en una superficie. Se guarda por fondo,
+    colores, posición y tamaño del tablero, así al cambiar de tamaño se arma la capa nueva sola.
+
+    Como el resaltado de las celdas se pinta debajo de las líneas, también devuelve la cuadrícula sola,
+    sobre fondo transparente, para volver a ponerla encima cuando hay celdas resaltadas.
+
+    Parámetros:
+    FONDO_JUEGO (pygame.Surface): La imagen de fondo de la pantalla de juego.
+    BLANCO (tuple): Color del panel semitransparente.
+    NEGRO (tuple): Color de las líneas.
+    MARGEN_IZQUIERDO (int): El margen izquierdo donde comienza el tablero en la ventana.
+    MARGEN_SUPERIOR (int): El margen superior donde comienza el tablero en la ventana.
+    tamanio_celda (int): El tamaño de cada celda del tablero en píxeles.
+    TAMANIO_TABLERO (int): Cantidad de celdas por fila y por columna.
+
+    Devuelve:
+    tuple: (capa, lineas, posicion_lineas): la capa del tamaño del fondo, la cuadrícula sola y dónde va la cuadrícula en la ventana.
+    '''
+    lado_pixeles = TAMANIO_TABLERO * tamanio_celda
+    capa = pygame.Surface(FONDO_JUEGO.get_size())  # Con el formato de la ventana, para que la mezcla del panel dé lo mismo que sobre ella
+    capa.blit(FONDO_JUEGO, (0, 0))
+    capa.blit(crear_fondo_transparente(lado_pixeles, lado_pixeles, BLANCO), (MARGEN_IZQUIERDO, MARGEN_SUPERIOR))
+    dibujar_lineas(capa, TAMANIO_TABLERO, NEGRO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda, lado_pixeles, lado_pixeles)
+
+    # Las líneas gruesas del borde se salen un poco del tablero: la cuadrícula sola tiene un margen de 4 píxeles
+    posicion_lineas = (MARGEN_IZQUIERDO - 4, MARGEN_SUPERIOR - 4)
+    lineas = pygame.Surface((lado_pixeles + 8, lado_pixeles + 8), pygame.SRCALPHA)
+    dibujar_lineas(lineas, TAMANIO_TABLERO, NEGRO, 4, 4, tamanio_celda, lado_pixeles, lado_pixeles)
+    return capa, lineas, posicion_lineas
+
+
 def dibujar_numero(ventana: pygame.display, num: int, fila: int, col: int,
-                    matriz_booleana: list[list[bool]], sudoku:list[list[int]],
-                      tablero_lleno:list[list[int]], fuente_numeros: pygame.font, NEGRO:tuple,
+                    sudoku:Tablero, tablero_lleno:Tablero, fuente_numeros: pygame.font, NEGRO:tuple,
                         ROJO:tuple, AZUL:tuple, MARGEN_IZQUIERDO:int, MARGEN_SUPERIOR:int, tamanio_celda:int) -> None:
     '''
     Esta función renderiza un número en la celda correspondiente del tablero de Sudoku y lo colorea 
@@ -110,9 +194,8 @@ def dibujar_numero(ventana: pygame.display, num: int, fila: int, col: int,
     num (int): El número que se va a dibujar. Si es 0, no se dibuja nada.
     fila (int): La fila del tablero donde se dibuja el número (índice basado en 0).
     col (int): La columna del tablero donde se dibuja el número (índice basado en 0).
-    matriz_booleana (list[list[bool]]): Una matriz que indica si el número fue ingresado por el usuario (True) o es parte del tablero inicial (False).
-    sudoku (list[list[int]]): La matriz actual del Sudoku con los números ingresados hasta el momento.
-    tablero_lleno (list[list[int]]): La solución completa del Sudoku, utilizada para verificar errores.
+    sudoku (Tablero): El Sudoku actual con los números ingresados hasta el momento; sus celdas fijas son las del tablero inicial.
+    tablero_lleno (Tablero): La solución completa del Sudoku, utilizada para verificar errores.
     fuente_numeros (pygame.font): La fuente de texto utilizada para renderizar los números.
     NEGRO (tuple): El color negro en formato RGB, utilizado para dibujar números ingresados por el usuario.
     ROJO (tuple): El color rojo en formato RGB, utilizado para dibujar números incorrectos.
@@ -126,31 +209,52 @@ def dibujar_numero(ventana: pygame.display, num: int, fila: int, col: int,
     '''
     if num != 0: # Si el numero es 0 no dibuja nada
         
-        if matriz_booleana[fila][col]:  # Si el número fue ingresado 
+        if sudoku.es_fija(fila, col):  # Si el número es parte del tablero inicial
             color = NEGRO  # Se pinta de negro
         else:
             if not comprobar_igualdad_celda(sudoku, tablero_lleno, fila, col):
                 color = ROJO # Si es incorrecto pinta de rojo
             else:
                 color = AZUL  # Si es correcto pinta de azul
-        # Renderiza el número con la fuente especificada y el color calculado.
-        texto = fuente_numeros.render(str(num), True, color)
+        # Toma el número ya dibujado en ese color (ver atlas_glifos) y su desplazamiento para quedar centrado:
+        # tamaño de celda / 2 - ancho del texto / 2, así el sobrante queda mitad a la izquierda y mitad a la derecha
+        texto, dx, dy = atlas_glifos(fuente_numeros, tamanio_celda, (NEGRO, ROJO, AZUL), sudoku.lado)[num, color]
         
-        # Calcula las coordenadas para centrar el texto dentro de la celda correspondiente.
-        x = (MARGEN_IZQUIERDO 
-             + col * tamanio_celda 
-             + tamanio_celda // 2           # Margen izquierdo + n° de columna * tamaño de celda +  tamaño de celda / 2 - ancho del texto / 2
-             - texto.get_width() // 2)      # Es decir que lo dibuja en la mitad del espacio sobrante, para que el sobrante quede mitad en la izquierda y mitad en la derecha
-        y = (MARGEN_SUPERIOR 
-             + fila * tamanio_celda 
-             + tamanio_celda // 2 
-             - texto.get_height() // 2)
         # Dibuja el numero en la ventana
-        ventana.blit(texto, (x, y))
+        ventana.blit(texto, (MARGEN_IZQUIERDO + col * tamanio_celda + dx, MARGEN_SUPERIOR + fila * tamanio_celda + dy))
     
 
-def resaltar_celdas(ventana: pygame.display, fila: int, col: int, cantidad:str, sudoku:list[list],
-                    tablero_lleno:list[list[int]], CELESTE:tuple, AZUL_CLARO:tuple, GRIS_OSCURO:tuple,
+def dibujar_marcas(ventana: pygame.display, fila: int, col: int, sudoku: Tablero, fuente_marcas: pygame.font,
+                   NEGRO: tuple, MARGEN_IZQUIERDO: int, MARGEN_SUPERIOR: int, tamanio_celda: int) -> None:
+    '''
+    Dibuja los candidatos (marcas de lápiz) de una celda vacía, cada número en su lugar de una grilla de 3x3
+    dentro de la celda (el 1 arriba a la izquierda y el 9 abajo a la derecha).
+
+    Parámetros:
+    ventana (pygame.display): La ventana de Pygame donde se dibujarán las marcas.
+    fila (int): La fila de la celda (índice basado en 0).
+    col (int): La columna de la celda (índice basado en 0).
+    sudoku (Tablero): El Sudoku actual, con los candidatos activados (ver Tablero.activar_candidatos).
+    fuente_marcas (pygame.font): La fuente chica para las marcas.
+    NEGRO (tuple): Color de las marcas en formato RGB.
+    MARGEN_IZQUIERDO (int): El margen izquierdo donde comienza el tablero en la ventana.
+    MARGEN_SUPERIOR (int): El margen superior donde comienza el tablero en la ventana.
+    tamanio_celda (int): El tamaño de cada celda del tablero.
+
+    Retorno:
+    None: Esta función no devuelve ningún valor.
+    '''
+    tercio = tamanio_celda // 3
+    atlas = atlas_glifos(fuente_marcas, tercio, (NEGRO,))  # Las marcas también se dibujan una sola vez
+    for num in sudoku.candidatos.de_celda(fila, col):
+        texto, dx, dy = atlas[num, NEGRO]
+        x = MARGEN_IZQUIERDO + col * tamanio_celda + (num - 1) % 3 * tercio + dx
+        y = MARGEN_SUPERIOR + fila * tamanio_celda + (num - 1) // 3 * tercio + dy
+        ventana.blit(texto, (x, y))
+
+
+def resaltar_celdas(ventana: pygame.display, fila: int, col: int, cantidad:str, sudoku:Tablero,
+                    tablero_lleno:Tablero, CELESTE:tuple, AZUL_CLARO:tuple, GRIS_OSCURO:tuple,
                     ROSA:tuple, ROSA_CLARO:tuple, MARGEN_IZQUIERDO:int, MARGEN_SUPERIOR:int, tamanio_celda:int) -> None:
     '''
     Esta función dibuja un resaltado visual sobre las celdas de la ventana del juego, dependiendo del tipo de 
@@ -164,8 +268,8 @@ def resaltar_celdas(ventana: pygame.display, fila: int, col: int, cantidad:str,
     cantidad (str): Tipo de resaltado que se aplicará. Puede ser:
                     - "todas": Resalta todas las celdas relacionadas (fila, columna, y región 3x3).
                     - "una": Resalta únicamente la celda seleccionada.
-    sudoku (list[list[int]]): La matriz que representa el tablero actual del Sudoku con los números ingresados hasta el momento.
-    tablero_lleno (list[list[int]]): La matriz que representa la solución completa y correcta del Sudoku.
+    sudoku (Tablero): El tablero actual del Sudoku con los números ingresados hasta el momento.
+    tablero_lleno (Tablero): La solución completa y correcta del Sudoku.
     CELESTE (tuple): Color en formato RGB para resaltar en celeste.
     AZUL_CLARO (tuple): Color en formato RGB para resaltar en azul claro.
     GRIS_OSCURO (tuple): Color en formato RGB para resaltar en gris oscuro.
@@ -178,97 +282,104 @@ def resaltar_celdas(ventana: pygame.display, fila: int, col: int, cantidad:str,
     Retorno:
     None: Esta función no devuelve ningún valor, realiza las operaciones gráficas directamente sobre la ventana proporcionada.
     '''
-    # Calcula las celdas a resaltar dependiendo de la fila, columna y bloque 
-    celdas_resaltadas = calcular_resaltado(fila, col)
-    # Itera todas las celdas que deben ser resaltadas
-    for f, c in celdas_resaltadas:
-        # Verifica si la celda resaltada coincide con la solución
-        if comprobar_igualdad_celda(sudoku, tablero_lleno, fila, col):
-            
-            if cantidad == "todas": # Si cantidad = "todas" resalta todo lo correspondiente
-                # Dibuja las celdas de color resltado correspondiente
-                pygame.draw.rect(ventana, CELESTE, 
-                                (MARGEN_IZQUIERDO 
-                                  + c * tamanio_celda, MARGEN_SUPERIOR 
-                                  + f * tamanio_celda, tamanio_celda, tamanio_celda))
-                # Destaca la celda principal seleccionada de otro color
-                pygame.draw.rect(ventana, AZUL_CLARO, 
-                                (MARGEN_IZQUIERDO 
-                                  + col * tamanio_celda, MARGEN_SUPERIOR 
-                                  + fila * tamanio_celda, tamanio_celda, tamanio_celda))
-            # Esto es para que puedas seleccionar fuera de las permitidas si queres que resalte alguna en particular
-            elif cantidad == "una":
-                # Resalta las que no se pueden escribir de color gris
-                pygame.draw.rect(ventana, GRIS_OSCURO, 
-                                (MARGEN_IZQUIERDO 
-                                  + col * tamanio_celda, MARGEN_SUPERIOR 
-                                  + fila * tamanio_celda, tamanio_celda, tamanio_celda))
-                # Con esto resaltaría unicamente la seleccionada
-        else:
-            # Resalta de otro color cuando el numero no coincide con la solución
-            pygame.draw.rect(ventana, ROSA, 
-                            (MARGEN_IZQUIERDO 
-                              + c * tamanio_celda, MARGEN_SUPERIOR 
-                              + f * tamanio_celda, tamanio_celda, tamanio_celda))
-            # Destaca la celda seleccionada con otro rosa
-            pygame.draw.rect(ventana, ROSA_CLARO, 
-                            (MARGEN_IZQUIERDO 
-                              + col * tamanio_celda, MARGEN_SUPERIOR 
-                              + fila * tamanio_celda, tamanio_celda, tamanio_celda))
-
-def manejar_entrada(fila: int, col: int, sudoku:list[list], matriz_booleana:list[list]) -> int:
-    '''
-    Captura las teclas presionadas para ingresar o borrar números en el tablero de Sudoku.
-    Permite asignar números del 1 al 9 a una celda seleccionada y borrar su contenido.
+    # Calcula las celdas a resaltar dependiendo de la fila, columna y bloque (tablas precalculadas)
+    lado = sudoku.lado
+    celdas_resaltadas = calcular_resaltado(fila, col, lado)
+    rectangulos = rectangulos_celdas(MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda, lado)
+    seleccionada = rectangulos[fila * lado + col]
+    # Verifica si la celda seleccionada coincide con la solución
+    if comprobar_igualdad_celda(sudoku, tablero_lleno, fila, col):
+        
+        if cantidad == "todas": # Si cantidad = "todas" resalta todo lo correspondiente
+            # Dibuja las celdas de color resltado correspondiente
+            for f, c in celdas_resaltadas:
+                pygame.draw.rect(ventana, CELESTE, rectangulos[f * lado + c])
+            # Destaca la celda principal seleccionada de otro color
+            pygame.draw.rect(ventana, AZUL_CLARO, seleccionada)
+        # Esto es para que puedas seleccionar fuera de las permitidas si queres que resalte alguna en particular
+        elif cantidad == "una":
+            # Resalta las que no se pueden escribir de color gris
+            # Con esto resaltaría unicamente la seleccionada
+            pygame.draw.rect(ventana, GRIS_OSCURO, seleccionada)
+    else:
+        # Resalta de otro color cuando el numero no coincide con la solución
+        for f, c in celdas_resaltadas:
+            pygame.draw.rect(ventana, ROSA, rectangulos[f * lado + c])
+        # Destaca la celda seleccionada con otro rosa
+        pygame.draw.rect(ventana, ROSA_CLARO, seleccionada)
+
+def dibujar_conflictos(ventana: pygame.display, sudoku: Tablero, ROSA_CLARO: tuple,
+                       MARGEN_IZQUIERDO: int, MARGEN_SUPERIOR: int, tamanio_celda: int) -> None:
+    '''
+    Pinta el fondo de cada celda cuyo número está repetido en su fila, columna o bloque. Cada celda se
+    consulta en O(1) con los contadores de Conflictos, que se actualizan al escribir (ver manejar_entrada).
+
+    Parámetros:
+    ventana (pygame.display): La ventana de Pygame donde se dibujarán las celdas.
+    sudoku (Tablero): El Sudoku actual, con los conflictos activados (ver Tablero.activar_conflictos).
+    ROSA_CLARO (tuple): Color en formato RGB del fondo de las celdas repetidas.
+    MARGEN_IZQUIERDO (int): El margen izquierdo donde comienza el tablero en la ventana.
+    MARGEN_SUPERIOR (int): El margen superior donde comienza el tablero en la ventana.
+    tamanio_celda (int): El tamaño de cada celda del tablero en píxeles.
+
+    Retorno:
+    None: Esta función no devuelve ningún valor.
+    '''
+    rectangulos = rectangulos_celdas(MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda, sudoku.lado)
+    en_conflicto = sudoku.conflictos.en_conflicto
+    for celda in range(len(sudoku.celdas)):
+        if en_conflicto(celda):
+            pygame.draw.rect(ventana, ROSA_CLARO, rectangulos[celda])
+
+
+def manejar_entrada(sesion:SesionJuego) -> int:
+    '''
+    Captura las teclas presionadas para ingresar o borrar números en la celda seleccionada de la sesión.
+    Permite asignar números del 1 al 9 (y del 10 al 25 con las letras A a P, en los tableros grandes)
+    y borrar el contenido con DELETE. Los errores los cuenta la sesión (ver SesionJuego.colocar).
 
     Parámetros:
-        fila (int): La fila de la celda seleccionada.
-        col (int): La columna de la celda seleccionada.
-        sudoku (list[list]): La matriz del tablero de Sudoku donde se ingresarán o borrarán los números.
+        sesion (SesionJuego): La partida en curso (las celdas fijas no se modifican).
 
     Retorno:
-        resultado(int): El valor de la tecla presionada
-        cambio_realizado(bool): Notifica si hubo o no cambios en la celda
+        resultado(int): El valor de la tecla presionada (0 si se borró, -1 si no se apretó ninguna)
     '''
     # Captura el estado de todas las teclas en el teclado
     teclas = pygame.key.get_pressed()
     resultado = -1  # Valor por defecto si no hay cambios
-    cambio_realizado = False # Bandera para indicar si se realizó un cambio en el tablero
 
-    # Verificar teclas numéricas del 1 al 9
-    if not matriz_booleana[fila][col]:
-        for i in range(1, 10):
-            if teclas[pygame.K_1 + (i - 1)]: # Las teclas son del K_1 al K_9
-                sudoku[fila][col] = i
+    if sesion.seleccionada is not None:
+        # Verificar las teclas de los números del 1 al lado del tablero
+        for i in range(1, sesion.sudoku.lado + 1):
+            if teclas[TECLAS_NUMEROS[i]]: # Las teclas son del K_1 al K_9 y después de la K_a en adelante
+                sesion.colocar(i)
                 resultado = i # Actualiza numero ingresado
-                cambio_realizado = True # Indica que hubo cambio
                 break # Sale del bucle para solo permitir un cambio a la vez
 
         # Verificar si se presionó la tecla DELETE
-        if teclas[pygame.K_DELETE]: 
-            sudoku[fila][col] = 0 # Se elimina el contenido
-            resultado = 0 
+        if teclas[pygame.K_DELETE]:
+            sesion.borrar() # Se elimina el contenido
+            resultado = 0
 
-    # Devuelve el número ingresado (o -1 si no hubo cambio) y el estado de cambio.
-    return resultado, cambio_realizado
+    # Devuelve el número ingresado (o -1 si no hubo cambio)
+    return resultado
 
 
-def dibujar_tablero(ventana: pygame.display, sudoku: list[list], tablero_lleno:list[list],
-                    celda_seleccionada: tuple, matriz_booleana: list[list[bool]],
+def dibujar_tablero(ventana: pygame.display, sudoku: Tablero, tablero_lleno:Tablero,
+                    celda_seleccionada: tuple,
                     fuente_numeros:pygame.font, FONDO_JUEGO:pygame.surface, TABLERO_ANCHO:int, TABLERO_ALTO:int,
                     BLANCO:tuple, MARGEN_IZQUIERDO:int, MARGEN_SUPERIOR:int, CELESTE:tuple, AZUL_CLARO:tuple,
                     GRIS_OSCURO:tuple, ROSA:tuple, ROSA_CLARO:tuple, tamanio_celda:int, TAMANIO_TABLERO:int,
-                    NEGRO:tuple, ROJO:tuple, AZUL:tuple) -> None:
+                    NEGRO:tuple, ROJO:tuple, AZUL:tuple, fuente_marcas:pygame.font = None) -> None:
     '''
     Organiza el proceso de dibujar el tablero de Sudoku en la ventana del juego, incluyendo la configuración del fondo, el resaltado de celdas seleccionadas, 
     y el dibujo de las líneas y los números del tablero. También maneja la entrada del usuario para modificar el tablero de acuerdo a su interacción.
 
     Parámetros:
         ventana (pygame.display): La ventana de Pygame donde se dibujará el tablero de Sudoku.
-        sudoku (list[list[int]]): La matriz que representa el estado actual del tablero de Sudoku, con los números ingresados por el usuario.
-        tablero_lleno (list[list[int]]): La matriz que representa el tablero completo con la solución correcta al inicio.
+        sudoku (Tablero): El estado actual del tablero de Sudoku, con los números ingresados por el usuario y las celdas fijas del tablero inicial.
+        tablero_lleno (Tablero): El tablero completo con la solución correcta al inicio.
         celda_seleccionada (tuple): Tupla (fila, col) que indica la celda actualmente seleccionada en el tablero (índice 0-based).
-        matriz_booleana (list[list[bool]]): Una matriz que indica si un número fue ingresado por el usuario (True) o es parte del tablero inicial (False).
         fuente_numeros (pygame.font): La fuente utilizada para renderizar los números en las celdas del tablero.
         FONDO_JUEGO (pygame.Surface): El fondo que se dibuja en la ventana antes de mostrar el tablero.
         TABLERO_ANCHO (int): El ancho del tablero de Sudoku.
@@ -286,75 +397,49 @@ def dibujar_tablero(ventana: pygame.display, sudoku: list[list], tablero_lleno:l
         NEGRO (tuple): Color en formato RGB para el texto en celdas (negro).
         ROJO (tuple): Color en formato RGB para resaltar celdas con errores (rojo).
         AZUL (tuple): Color en formato RGB para resaltar celdas correctas (azul).
+        fuente_marcas (pygame.font): Fuente de las marcas de lápiz. Si es None, no se dibujan.
 
     Comportamiento:
         - Dibuja el fondo y el tablero en la ventana proporcionada.
         - Resalta la celda seleccionada, con un color específico dependiendo de si se ha elegido resaltar todas las celdas relacionadas o solo la celda seleccionada.
+        - Resalta las celdas con números repetidos en su fila, columna o bloque (ver dibujar_conflictos).
         - Dibuja las líneas del tablero, la cuadrícula y los números en las celdas, dependiendo de si son parte de la entrada del usuario o de la solución completa del Sudoku.
 
     Retorno:
         None: Esta función no devuelve ningún valor. Realiza las operaciones gráficas directamente sobre la ventana proporcionada.
     '''
-    # Dibuja el fondo del juego
-    ventana.blit(FONDO_JUEGO, [0, 0])
-    
-    # Dibuja fondo semitransparente
-    fondo_transparente = crear_fondo_transparente(TABLERO_ANCHO, TABLERO_ALTO, BLANCO)
-    ventana.blit(fondo_transparente, (MARGEN_IZQUIERDO, MARGEN_SUPERIOR))
+    # Dibuja el fondo del juego, el fondo semitransparente y la cuadrícula, ya combinados en una capa (ver capa_tablero).
+    # El tablero ocupa lado * tamanio_celda píxeles (en el 16x16 y el 25x25 sobran algunos de los 540)
+    capa, lineas, posicion_lineas = capa_tablero(FONDO_JUEGO, BLANCO, NEGRO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda, TAMANIO_TABLERO)
+    ventana.blit(capa, (0, 0))
     
     # Resalta celda seleccionada y las demas correspondientes
     if celda_seleccionada:
         fila, col = celda_seleccionada
-        if not matriz_booleana[fila][col]: # Si la celda no es fija
+        if not sudoku.es_fija(fila, col): # Si la celda no es fija
             resaltar_celdas(ventana, fila, col, "todas", sudoku, tablero_lleno, CELESTE, AZUL_CLARO, GRIS_OSCURO,
                         ROSA, ROSA_CLARO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda) # Si podes escribir en la celda resalta azul o rosa la incorrecta
-            manejar_entrada(fila, col, sudoku, matriz_booleana)
         else: # Si la celda es fija
             resaltar_celdas(ventana, fila, col, "una", sudoku, tablero_lleno, CELESTE, AZUL_CLARO, GRIS_OSCURO,
                         ROSA, ROSA_CLARO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda) # Resalta con gris las que no estan permitidas modificar
-    # Dibuja las cuadriculas del tablero
-    dibujar_lineas(ventana, TAMANIO_TABLERO, NEGRO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda, TABLERO_ANCHO, TABLERO_ALTO)
+    # Resalta los números repetidos en su fila, columna o bloque (los fijos también, para ver con qué choca cada error)
+    hay_conflictos = sudoku.conflictos is not None and sudoku.conflictos.hay_conflictos()
+    if hay_conflictos: # O(1): si no hay repetidos no se recorre nada
+        dibujar_conflictos(ventana, sudoku, ROSA_CLARO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda)
+    # Si se pintó alguna celda, la cuadrícula vuelve a ir encima (sin resaltado ya está en la capa)
+    if celda_seleccionada or hay_conflictos:
+        ventana.blit(lineas, posicion_lineas)
     
-    # Dibuja los numeros en cada celda
+    # Dibuja los numeros en cada celda. Si hay un área de recorte (ver dibujo_por_regiones), se saltean las celdas
+    # lejos de ella; el margen de media celda es para los números de las celdas vecinas que se salen un poco de la suya.
+    recorte = ventana.get_clip().inflate(tamanio_celda, tamanio_celda)
+    rectangulos = rectangulos_celdas(MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda, TAMANIO_TABLERO)
     for fila in range(TAMANIO_TABLERO):
         for col in range(TAMANIO_TABLERO):
-            dibujar_numero(ventana, sudoku[fila][col], fila, col, matriz_booleana, sudoku, tablero_lleno, fuente_numeros, NEGRO, ROJO, AZUL, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda)
-
-
-def sumar_errores(celda_seleccionada: tuple, sudoku: list[list], tablero_lleno: list[list], contador_errores:int, cambio_anterior: bool, matriz_booleana:list[list]) -> int:
-    '''
-    Compara el valor ingresado en la celda seleccionada con el valor correspondiente en el tablero completo.
-
-    Parámetros:
-        celda_seleccionada (tuple): Coordenadas (fila, columna) de la celda actualmente seleccionada.
-        sudoku (list[list]): Matriz actual del tablero de Sudoku.
-        tablero_lleno (list[list]): Matriz con la solución completa del Sudoku.
-        contador_errores(int): Variable inicializada.
-        cambio_anterior (bool): Indica si hubo un cambio previo en la celda seleccionada.
-
-    Retorno:
-        contador_errores (int): Número de errores contabilizados.
-    '''
-    # Inicializar las variables de retorno
-
-    nuevo_cambio_anterior = cambio_anterior
-
-    if celda_seleccionada:  # Verifica que haya una celda seleccionada
-        fila, col = celda_seleccionada
-        
-        # Llamar a manejar_entrada y obtener resultado y cambio_realizado
-        resultado, cambio_realizado = manejar_entrada(fila, col, sudoku, matriz_booleana)
-
-        # Solo incrementar el contador de errores si se realizó un cambio y no se contaron antes
-        if cambio_realizado and not cambio_anterior:
-            if resultado != tablero_lleno[fila][col] and resultado != 0:
-                contador_errores += 1
-
-        # Actualizar el estado de cambio_anterior
-        nuevo_cambio_anterior = cambio_realizado
-
-    # Retornar el estado final de errores y cambio
-    return contador_errores, nuevo_cambio_anterior
+            if recorte.colliderect(rectangulos[fila * TAMANIO_TABLERO + col]):
+                dibujar_numero(ventana, sudoku[fila, col], fila, col, sudoku, tablero_lleno, fuente_numeros, NEGRO, ROJO, AZUL, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda)
+                if fuente_marcas is not None and TAMANIO_TABLERO == 9 and sudoku[fila, col] == 0: # Las marcas solo entran en las celdas del 9x9
+                    dibujar_marcas(ventana, fila, col, sudoku, fuente_marcas, NEGRO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda)
 
 
 def mostrar_texto(texto: str, x: int, y: int,ventana:pygame.display, fuente_texto: pygame.font, NEGRO:tuple) -> None: 
@@ -396,7 +481,7 @@ def evento_click(x: int, y: int, w: int, h: int) -> bool:
     return click
 
 
-def mostrar_menu_principal(ventana:pygame.display, dificultad:str, FONDO: pygame.surface, NEGRO:tuple, fuente_texto:pygame.font, AMARILLO_CLARO:tuple, VALOR_BORDER_RADIUS:int, AMARILLO_OSCURO:tuple,BLANCO:tuple) -> None:
+def mostrar_menu_principal(ventana:pygame.display, dificultad:str, FONDO: pygame.surface, NEGRO:tuple, fuente_texto:pygame.font, AMARILLO_CLARO:tuple, VALOR_BORDER_RADIUS:int, AMARILLO_OSCURO:tuple,BLANCO:tuple, TAMANIO_TABLERO:int = 9) -> None:
     '''
     Esta función dibuja el menú principal en la ventana del juego, mostrando el título y botones de opciones.
 
@@ -407,6 +492,7 @@ def mostrar_menu_principal(ventana:pygame.display, dificultad:str, FONDO: pygame
         FONDO(pygame.surface): Constante que contiene la imagen de fondo.
         NEGRO (tuple): Color utilizado para el texto del título.
         fuente_texto (pygame.font): Fuente utilizada para renderizar los botones del menú.
+        TAMANIO_TABLERO (int): Tamaño de tablero elegido, que se muestra en el botón de tamaño.
 
     Retorno:
         None: Esta función no devuelve ningún valor.
@@ -417,7 +503,8 @@ def mostrar_menu_principal(ventana:pygame.display, dificultad:str, FONDO: pygame
     mostrar_boton("Jugar", 565, 220, 150, 50,ventana,fuente_texto, AMARILLO_CLARO,NEGRO,VALOR_BORDER_RADIUS,1,AMARILLO_OSCURO)
     mostrar_boton("Puntajes", 565, 280, 150, 50,ventana,fuente_texto, AMARILLO_CLARO,NEGRO,VALOR_BORDER_RADIUS,1,AMARILLO_OSCURO)
     mostrar_boton(dificultad, 565, 340, 150, 50,ventana,fuente_texto, AMARILLO_CLARO,NEGRO,VALOR_BORDER_RADIUS,1,AMARILLO_OSCURO)
-    mostrar_boton("Salir", 565, 400, 150, 50,ventana,fuente_texto, AMARILLO_CLARO,NEGRO,VALOR_BORDER_RADIUS,1,AMARILLO_OSCURO)
+    mostrar_boton(f"{TAMANIO_TABLERO}x{TAMANIO_TABLERO}", 565, 400, 150, 50,ventana,fuente_texto, AMARILLO_CLARO,NEGRO,VALOR_BORDER_RADIUS,1,AMARILLO_OSCURO)
+    mostrar_boton("Salir", 565, 460, 150, 50,ventana,fuente_texto, AMARILLO_CLARO,NEGRO,VALOR_BORDER_RADIUS,1,AMARILLO_OSCURO)
     
     
     pygame.display.update()
@@ -586,6 +673,20 @@ def cambiar_dificultad(ultimo_clic_dificultad, dificultad, DELAY_CLIC: int, vent
     return dificultad
 
 
+def cambiar_tamanio(TAMANIO_TABLERO:int) -> int:
+    '''
+    Pasa al siguiente tamaño de tablero de TAMANIOS_VALIDOS (9x9, 16x16, 25x25 y vuelta al 9x9).
+
+    Parámetros:
+        TAMANIO_TABLERO (int): El tamaño elegido hasta ahora.
+
+    Retorno:
+        int: El nuevo tamaño de tablero.
+    '''
+    posicion = TAMANIOS_VALIDOS.index(TAMANIO_TABLERO)
+    return TAMANIOS_VALIDOS[(posicion + 1) % len(TAMANIOS_VALIDOS)]
+
+
 def actualizar_boton_dificultad(ventana:pygame.display, dificultad:str, BLANCO:tuple, GRIS:tuple, VALOR_BORDER_RADIUS:int, fuente_texto:pygame.font, NEGRO:tuple) -> None: 
     '''
     Esta función actualiza el botón de dificultad en la interfaz de usuario, 
@@ -652,25 +753,19 @@ def mostrar_boton(texto: str, x: int, y: int, ancho: int, alto: int, ventana:pyg
     # Dibuja el texto centrado en el boton
     ventana.blit(texto_superficie, (x + (ancho - texto_ancho) // 2, y + (alto - texto_alto) // 2))
 
-def jugar(sudoku:list[list], dificultad: str, ventana:pygame.display, tablero_lleno:list[list[int]], celda_seleccionada: tuple, matriz_booleana: list[list[bool]], fuente_numeros: pygame.font, 
-          temporizador: int, contador_errores: int, fuente_texto: pygame.font, BLANCO: tuple, FONDO: pygame.Surface, 
+def jugar(dificultad: str, ventana:pygame.display, fuente_numeros: pygame.font,
+          fuente_texto: pygame.font, BLANCO: tuple, FONDO: pygame.Surface, 
           TABLERO_ANCHO: int, TABLERO_ALTO: int, MARGEN_IZQUIERDO: int, MARGEN_SUPERIOR: int, CELESTE: tuple, 
           AMARILLO_CLARO: tuple, GRIS_OSCURO: tuple, ROSA: tuple, ROSA_CLARO: tuple, tamanio_celda: int, 
-          TAMANIO_TABLERO: int, NEGRO: tuple, ROJO: tuple, AZUL: tuple, VALOR_BORDER_RADIUS: int, AMARILLO_OSCURO:tuple) -> list[list]:
+          TAMANIO_TABLERO: int, NEGRO: tuple, ROJO: tuple, AZUL: tuple, VALOR_BORDER_RADIUS: int, AMARILLO_OSCURO:tuple) -> SesionJuego:
     '''
-    Inicia una nueva partida de Sudoku generando un tablero según la dificultad seleccionada
-    y actualiza la pantalla del juego.
+    Inicia una nueva partida de Sudoku tomando una partida ya generada del pool (ver pool_partidas)
+    según la dificultad seleccionada, y actualiza la pantalla del juego.
 
     Parámetros:
-        sudoku (list[list]): El tablero de Sudoku inicial.
         dificultad (str): Nivel de dificultad del juego ('Facil', 'Medio', 'Dificil').
         ventana (pygame.display): La ventana de Pygame donde se mostrará el juego.
-        tablero_lleno (list[list[int]]): La matriz que representa el tablero completo al inicio (sin cambios del usuario).
-        celda_seleccionada (tuple): Coordenadas de la celda seleccionada en el tablero.
-        matriz_booleana (list[list[bool]]): Matriz que indica las celdas activas o seleccionadas.
         fuente_numeros (pygame.font): Fuente utilizada para renderizar los números del tablero.
-        temporizador (int): Tiempo transcurrido o restante en el juego.
-        contador_errores (int): Cantidad de errores cometidos por el jugador.
         fuente_texto (pygame.font): Fuente utilizada para renderizar texto como botones o mensajes.
         BLANCO (tuple): Color RGB para el fondo de la ventana.
         FONDO (pygame.Surface): Superficie de fondo utilizada en la pantalla.
@@ -691,35 +786,36 @@ def jugar(sudoku:list[list], dificultad: str, ventana:pygame.display, tablero_ll
         VALOR_BORDER_RADIUS (int): Radio de redondeo de los bordes de los botones.
 
     Retorno:
-        list[list]: Un tablero de Sudoku generado de acuerdo a la dificultad seleccionada.
+        SesionJuego: La partida nueva (sudoku con sus números iniciales marcados como celdas fijas, solución,
+        errores y tiempo en 0), con los candidatos activados para las marcas de lápiz y las pistas.
     '''
 
-    # Generar un nuevo tablero basado en la dificultad
-    sudoku = generar_sudoku(tablero_lleno, dificultad)
+    # Tomar una partida ya generada del pool (no bloquea generando el tablero)
+    sesion = SesionJuego.nueva(dificultad, TAMANIO_TABLERO, candidatos=True)
     
     
     # Actualizar la pantalla del juego con el nuevo tablero
-    mostrar_pantalla_juego(sudoku,ventana, tablero_lleno, celda_seleccionada, matriz_booleana, fuente_numeros, temporizador, contador_errores, fuente_texto, BLANCO,
+    mostrar_pantalla_juego(sesion.sudoku,ventana, sesion.solucion, sesion.seleccionada, fuente_numeros, sesion.segundos, sesion.errores, fuente_texto, BLANCO,
                             FONDO, TABLERO_ANCHO, TABLERO_ALTO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, AMARILLO_CLARO, GRIS_OSCURO,
                             ROSA, ROSA_CLARO, tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, VALOR_BORDER_RADIUS, AMARILLO_OSCURO)
     
-    return sudoku
+    return sesion
 
-def mostrar_pantalla_juego(sudoku: list[list], ventana:pygame.display, tablero_lleno:list[list[int]],
-                            celda_seleccionada:tuple, matriz_booleana: list[list[bool]],
+def mostrar_pantalla_juego(sudoku: Tablero, ventana:pygame.display, tablero_lleno:Tablero,
+                            celda_seleccionada:tuple,
                               fuente_numeros:pygame.font, temporizador:int, contador_errores:int,
                                 fuente_texto:pygame.font, BLANCO: tuple,
                             FONDO_JUEGO: pygame.Surface, TABLERO_ANCHO: int, TABLERO_ALTO: int, MARGEN_IZQUIERDO: int,
                             MARGEN_SUPERIOR: int, CELESTE: tuple, AMARILLO_CLARO: tuple, GRIS_OSCURO: tuple,
                             ROSA: tuple, ROSA_CLARO: tuple, tamanio_celda: int, TAMANIO_TABLERO: int, NEGRO: tuple,
-                            ROJO: tuple, AZUL: tuple, VALOR_BORDER_RADIUS: int, AMARILLO_OSCURO:tuple) -> None:
+                            ROJO: tuple, AZUL: tuple, VALOR_BORDER_RADIUS: int, AMARILLO_OSCURO:tuple,
+                            fuente_marcas: pygame.font = None) -> None:
     '''
         Parámetros:
-        sudoku (list[list[int]]): Una matriz bidimensional que representa el estado actual del tablero de Sudoku.
+        sudoku (Tablero): El estado actual del tablero de Sudoku.
         ventana (pygame.display): La ventana donde se dibuja la interfaz del juego.
-        tablero_lleno (list[list[int]]): Una matriz bidimensional que indica las celdas llenas en el tablero.
+        tablero_lleno (Tablero): El tablero resuelto.
         celda_seleccionada (tuple): Las coordenadas de la celda seleccionada en el tablero.
-        matriz_booleana (list[list[bool]]): Una matriz que indica si una celda está activa o seleccionada.
         fuente_numeros (pygame.font): La fuente utilizada para renderizar los números en el tablero.
         temporizador (int): El valor del temporizador que se muestra en la interfaz del juego.
         contador_errores (int): El contador de errores cometidos durante el juego.
@@ -742,18 +838,19 @@ def mostrar_pantalla_juego(sudoku: list[list], ventana:pygame.display, tablero_l
         AZUL (tuple): Color en formato RGB para resaltar celdas correctas (azul).
         VALOR_BORDER_RADIUS (int): Valor del radio de borde de los botones.
         AMARILLO_OSCURO (tuple): Color del sombreado del botón.
+        fuente_marcas (pygame.font): Fuente de las marcas de lápiz. Si es None, no se dibujan.
     
     Retorno:
         None: Esta función no devuelve ningún valor.
 
     '''
-    ventana.fill(BLANCO)
-    dibujar_tablero(ventana,sudoku, tablero_lleno,celda_seleccionada, matriz_booleana, fuente_numeros,FONDO_JUEGO, TABLERO_ANCHO, TABLERO_ALTO,
+    dibujar_tablero(ventana,sudoku, tablero_lleno,celda_seleccionada, fuente_numeros,FONDO_JUEGO, TABLERO_ANCHO, TABLERO_ALTO,
                        BLANCO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, AMARILLO_CLARO, GRIS_OSCURO, ROSA, ROSA_CLARO,
-                         tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL)
+                         tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, fuente_marcas)
     
     mostrar_temporizador(temporizador,ventana,fuente_texto,NEGRO)
     mostrar_contador_errores(contador_errores, ventana,fuente_texto, NEGRO)  
+    mostrar_celdas_restantes(sudoku.celdas_restantes(), ventana, fuente_texto, NEGRO)
     mostrar_boton("Volver", 1060, 600, 170, 60,ventana,fuente_texto,AMARILLO_CLARO,NEGRO,VALOR_BORDER_RADIUS,1,AMARILLO_OSCURO)
     mostrar_boton("Reiniciar", 1060, 530, 170, 60,ventana,fuente_texto,AMARILLO_CLARO,NEGRO,VALOR_BORDER_RADIUS,1,AMARILLO_OSCURO)
 
@@ -781,6 +878,22 @@ def mostrar_contador_errores(errores:int,ventana:pygame.display,fuente_texto:pyg
     texto_errores = fuente_texto.render(f"Errores: {errores}", True, NEGRO)
     ventana.blit(texto_errores, (1070, 158))  # Mostrar el contador en la posición deseada
 
+def mostrar_celdas_restantes(restantes:int, ventana:pygame.display, fuente_texto:pygame.font, NEGRO:tuple) -> None:
+    '''
+    Muestra cuántas celdas faltan completar correctamente, debajo del contador de errores.
+
+    Parámetros:
+    restantes (int): Celdas que faltan (ver Tablero.celdas_restantes).
+    ventana (pygame.display): La ventana donde se dibuja la interfaz del juego.
+    fuente_texto (pygame.font): La fuente del texto.
+    NEGRO (tuple): Color de la letra negro
+
+    Devuelve:
+    None
+    '''
+    texto_restantes = fuente_texto.render(f"Faltan: {restantes}", True, NEGRO)
+    ventana.blit(texto_restantes, (1070, 244))
+
 def mostrar_temporizador(temporizador:int, ventana: pygame.display, fuente_texto:pygame.font, NEGRO:pygame.font) -> int:
     '''
     Esta función muestra el temporizador en la pantalla, indicando el tiempo transcurrido 
@@ -841,42 +954,27 @@ def ver_puntajes(ventana:pygame.display, fuente_texto:pygame.font, FONDO_PANTALL
 
 
 
-def calcular_puntaje(dificultad:str, PUNTOS_BASE:int, contador_errores:int, PENALIZACION_ERROR:int, minutos:int, PENALIZACION_TIEMPO:int) -> int:
-    '''
-    Calcula el puntaje dependiendo la cantidad de errores, el tiempo tardado y la dificultad seleccionada
-    
-    Puntaje = (Puntos Base - (Errores x Penalización por Error) - (Tiempo Transcurrido en Minutos x Penalización por Tiempo)) x Dificultad
-    Puntaje = (Puntos Base - (Errores x Penalización por Error) - (Tiempo Transcurrido en Minutos x
-    Penalización por Tiempo)) x Dificultad
-    Parametros:
-    PUNTOS_BASE (int): Es el puntaje inicial que se le da al jugador al comenzar la partida. Por ej 1000 puntos.
-    contador_errores(int): Es la cantidad de errores cometidos por el jugador durante la partida.
-    PENALIZACION_ERROR(int): Un valor que se resta por cada error. Por ejemplo, 50 puntos por error.
-    minutos(int): Tiempo transcurrido entre el inicio y la finalización de la partida.
-    PENALIZACION_TIEMPO(int): Un valor que se resta por cada minuto. Por ejemplo, 10 puntos por minuto.
-    dificultad(str): Un multiplicador en función de la dificultad seleccionada.
-
-    Devuelve: El calculo mencionado en la documentación
-    
-    ''' 
-
-    if dificultad == "Facil":
-        multiplicador_dificultad = 1
-    elif dificultad == "Medio":
-        multiplicador_dificultad = 1.5
-    else:
-        multiplicador_dificultad = 2
-    
-
-        
-    puntaje_final = (PUNTOS_BASE - (contador_errores * PENALIZACION_ERROR) - (minutos * PENALIZACION_TIEMPO)) * multiplicador_dificultad
-    
-    if puntaje_final < 0:
-        puntaje_final = 0
-    
-    return int(puntaje_final)
+def obtener_eventos(en_reposo:bool, ESPERA_REPOSO_MS:int) -> list:
+    """
+    Devuelve los eventos pendientes. Si no hay ninguno y la pantalla está en reposo (nada se anima ni
+    cuenta tiempo por su cuenta), en lugar de volver enseguida duerme en pygame.event.wait hasta que
+    llegue un evento: un clic, una tecla, el movimiento del mouse (para el resaltado de los botones) o
+    el USEREVENT de cada segundo que avanza el temporizador. Así el bucle principal no ocupa un núcleo
+    entero en el menú o con el juego quieto, y la entrada se atiende apenas llega.
 
+    Parámetros:
+    en_reposo (bool): Si es False (por ejemplo, con el pop-up de partida perdida, que se cierra solo), no se duerme.
+    ESPERA_REPOSO_MS (int): Tiempo máximo de espera en milisegundos, por si algo cambia sin generar eventos.
 
+    Devuelve:
+    list: Los eventos a procesar (vacía si se cumplió la espera sin que llegara ninguno).
+    """
+    eventos = pygame.event.get()
+    if not eventos and en_reposo:
+        evento = pygame.event.wait(ESPERA_REPOSO_MS)
+        if evento.type != pygame.NOEVENT:  # NOEVENT: se cumplió la espera
+            eventos = [evento]
+    return eventos
 
 
 def salir() -> None:
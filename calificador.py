@@ -0,0 +1,427 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+from logica_sodoku import *
+
+# ==============================
+# Calificador de dificultad por técnicas
+# ==============================
+#
+# Resuelve el sudoku como lo haría una persona, usando siempre la técnica más simple que sirva,
+# y califica el sudoku según la técnica más difícil que necesitó. Los candidatos de cada celda
+# se guardan como máscaras de bits (bit n encendido = el número n todavía es posible).
+
+NIVEL_SINGLE_DESNUDO = 1   # La celda tiene un solo candidato
+NIVEL_SINGLE_OCULTO = 2    # El número solo puede ir en una celda de la fila, columna o bloque
+NIVEL_PAR_DESNUDO = 3      # Dos celdas de una unidad con los mismos dos candidatos
+NIVEL_PAR_APUNTADOR = 4    # Dentro de un bloque el número está en una sola fila/columna (o al revés)
+NIVEL_X_WING = 5
+NIVEL_SIN_RESOLVER = 6     # Con estas técnicas no alcanza (hace falta prueba y error)
+
+NOMBRES_NIVELES = {
+    0: "Resuelto",
+    NIVEL_SINGLE_DESNUDO: "Single desnudo",
+    NIVEL_SINGLE_OCULTO: "Single oculto",
+    NIVEL_PAR_DESNUDO: "Par desnudo",
+    NIVEL_PAR_APUNTADOR: "Par apuntador",
+    NIVEL_X_WING: "X-Wing",
+    NIVEL_SIN_RESOLVER: "Prueba y error",
+}
+
+CAPACIDAD_CALIFICACIONES = 4096  # Calificaciones que se recuerdan (ver calificar_sudoku)
+
+calificaciones = OrderedDict()  # hash_canonico del sudoku -> nivel, de la menos a la más usada
+lock_calificaciones = threading.Lock()  # Califican tanto el juego como el hilo del pool
+
+# Rango de niveles (mínimo, máximo) que corresponde a cada dificultad del juego
+NIVELES_POR_DIFICULTAD = {"Facil": (NIVEL_SINGLE_DESNUDO, NIVEL_SINGLE_DESNUDO),
+                          "Medio": (NIVEL_SINGLE_OCULTO, NIVEL_SINGLE_OCULTO),
+                          "Dificil": (NIVEL_PAR_DESNUDO, NIVEL_SIN_RESOLVER)}
+
+def colocar(valores:list, candidatos:list, celda:int, num:int) -> None:
+    """
+    Coloca un número en una celda y lo quita de los candidatos de sus 20 vecinos.
+
+    Recibe:
+        valores (list): Los 81 valores del tablero (0 = vacía).
+        candidatos (list): Las 81 máscaras de candidatos.
+        celda (int): Índice de la celda (fila * 9 + col).
+        num (int): Número a colocar.
+    """
+    valores[celda] = num
+    candidatos[celda] = 0
+    bit = 1 << num
+    for vecino in VECINOS[celda]:
+        candidatos[vecino] &= ~bit
+
+
+def aplicar_singles_desnudos(valores:list, candidatos:list) -> bool:
+    """
+    Coloca todas las celdas que tienen un único candidato.
+
+    Retorno:
+        bool: True si colocó al menos un número.
+    """
+    hubo_cambio = False
+    for celda in range(81):
+        mascara = candidatos[celda]
+        if valores[celda] == 0 and mascara and mascara & (mascara - 1) == 0:
+            colocar(valores, candidatos, celda, mascara.bit_length() - 1)
+            hubo_cambio = True
+    return hubo_cambio
+
+
+def aplicar_singles_ocultos(valores:list, candidatos:list) -> bool:
+    """
+    Busca, en cada unidad, números que solo pueden ir en una celda y los coloca.
+
+    Retorno:
+        bool: True si colocó al menos un número.
+    """
+    hubo_cambio = False
+    for unidad in UNIDADES:
+        una_vez = 0
+        mas_de_una = 0
+        for celda in unidad:
+            mas_de_una |= una_vez & candidatos[celda]
+            una_vez |= candidatos[celda]
+        unicos = una_vez & ~mas_de_una
+        for celda in unidad:
+            bit = candidatos[celda] & unicos
+            if bit and bit & (bit - 1) == 0:
+                colocar(valores, candidatos, celda, bit.bit_length() - 1)
+                hubo_cambio = True
+    return hubo_cambio
+
+
+def aplicar_pares_desnudos(candidatos:list) -> bool:
+    """
+    Si dos celdas de una unidad tienen exactamente los mismos dos candidatos, esos números
+    se quitan del resto de la unidad.
+
+    Retorno:
+        bool: True si eliminó al menos un candidato.
+    """
+    hubo_cambio = False
+    for unidad in UNIDADES:
+        vistos = set()
+        for celda in unidad:
+            mascara = candidatos[celda]
+            if mascara.bit_count() == 2:
+                if mascara in vistos:
+                    for otra in unidad:
+                        if candidatos[otra] != mascara and candidatos[otra] & mascara:
+                            candidatos[otra] &= ~mascara
+                            hubo_cambio = True
+                vistos.add(mascara)
+    return hubo_cambio
+
+
+def aplicar_pares_apuntadores(candidatos:list) -> bool:
+    """
+    Intersección bloque-línea: si dentro de un bloque un número solo aparece en una fila (o columna),
+    se quita de esa fila fuera del bloque. Y al revés: si en una fila (o columna) un número solo
+    aparece dentro de un bloque, se quita del resto del bloque.
+
+    Retorno:
+        bool: True si eliminó al menos un candidato.
+    """
+    hubo_cambio = False
+    for bloque in UNIDADES_BLOQUES:
+        for linea in UNIDADES_FILAS[bloque[0] // 9:bloque[0] // 9 + 3] + UNIDADES_COLUMNAS[bloque[0] % 9:bloque[0] % 9 + 3]:
+            interseccion = set(bloque) & set(linea)
+            en_interseccion = 0
+            solo_bloque = 0
+            solo_linea = 0
+            for celda in bloque:
+                if celda in interseccion:
+                    en_interseccion |= candidatos[celda]
+                else:
+                    solo_bloque |= candidatos[celda]
+            for celda in linea:
+                if celda not in interseccion:
+                    solo_linea |= candidatos[celda]
+
+            # Números del bloque que están solo en la intersección: se quitan del resto de la línea
+            # Números de la línea que están solo en la intersección: se quitan del resto del bloque
+            for unidad, eliminar in ((linea, en_interseccion & ~solo_bloque), (bloque, en_interseccion & ~solo_linea)):
+                if eliminar:
+                    for celda in unidad:
+                        if celda not in interseccion and candidatos[celda] & eliminar:
+                            candidatos[celda] &= ~eliminar
+                            hubo_cambio = True
+    return hubo_cambio
+
+
+def aplicar_x_wing(candidatos:list) -> bool:
+    """
+    X-Wing: si un número solo puede ir en las mismas dos columnas en dos filas distintas, se quita
+    de esas dos columnas en las demás filas (y lo mismo intercambiando filas y columnas).
+
+    Retorno:
+        bool: True si eliminó al menos un candidato.
+    """
+    hubo_cambio = False
+    for lineas, cruzadas in ((UNIDADES_FILAS, UNIDADES_COLUMNAS), (UNIDADES_COLUMNAS, UNIDADES_FILAS)):
+        for num in range(1, 10):
+            bit = 1 << num
+            posiciones_por_linea = {}
+            for i, linea in enumerate(lineas):
+                posiciones = tuple(j for j, celda in enumerate(linea) if candidatos[celda] & bit)
+                if len(posiciones) == 2:
+                    if posiciones in posiciones_por_linea:
+                        otra = posiciones_por_linea[posiciones]
+                        for j in posiciones:
+                            for k, celda in enumerate(cruzadas[j]):
+                                if k != i and k != otra and candidatos[celda] & bit:
+                                    candidatos[celda] &= ~bit
+                                    hubo_cambio = True
+                    else:
+                        posiciones_por_linea[posiciones] = i
+    return hubo_cambio
+
+
+def calificar_sudoku(sudoku:list[list], tablero_lleno:list[list] = None) -> int:
+    """
+    Califica un sudoku según la técnica más difícil que hace falta para resolverlo.
+    Los resultados se guardan en caché por el hash de la forma canónica (ver hash_canonico): las
+    técnicas no cambian al aplicar una simetría, así que el sudoku y todas sus variantes por simetría
+    comparten una sola calificación. La caché recuerda las CAPACIDAD_CALIFICACIONES más usadas.
+
+    Recibe:
+        sudoku (list[list]): Sudoku 9x9 (0 = celda vacía).
+        tablero_lleno (list[list]): Su solución, si se conoce (si no, hash_canonico la calcula).
+
+    Retorno:
+        int: Un nivel entre 0 (ya estaba resuelto) y NIVEL_SIN_RESOLVER (ver NOMBRES_NIVELES).
+    """
+    clave = hash_canonico(sudoku, tablero_lleno)
+    with lock_calificaciones:
+        nivel = calificaciones.get(clave)
+        if nivel is not None:
+            calificaciones.move_to_end(clave)
+    if nivel is None:
+        nivel = calificar_texto(tablero_a_texto(sudoku))
+        with lock_calificaciones:
+            calificaciones[clave] = nivel
+            if len(calificaciones) > CAPACIDAD_CALIFICACIONES:
+                calificaciones.popitem(last=False)
+    return nivel
+
+
+def calificar_texto(texto:str) -> int:
+    """
+    Califica un sudoku dado como texto de 81 dígitos, sin caché (ver calificar_sudoku).
+    """
+    valores = [int(caracter) for caracter in texto]
+    candidatos = [TODOS_LOS_NUMEROS] * 81
+    for celda in range(81):
+        if valores[celda] != 0:
+            num = valores[celda]
+            valores[celda] = 0
+            colocar(valores, candidatos, celda, num)
+
+    tecnicas = ((NIVEL_SINGLE_DESNUDO, lambda: aplicar_singles_desnudos(valores, candidatos)),
+                (NIVEL_SINGLE_OCULTO, lambda: aplicar_singles_ocultos(valores, candidatos)),
+                (NIVEL_PAR_DESNUDO, lambda: aplicar_pares_desnudos(candidatos)),
+                (NIVEL_PAR_APUNTADOR, lambda: aplicar_pares_apuntadores(candidatos)),
+                (NIVEL_X_WING, lambda: aplicar_x_wing(candidatos)))
+
+    nivel = 0
+    atascado = False
+    while 0 in valores and not atascado:
+        # Una celda vacía sin candidatos significa que el sudoku no tiene solución
+        atascado = any(valores[celda] == 0 and candidatos[celda] == 0 for celda in range(81))
+        if not atascado:
+            # Usa siempre la técnica más simple que produzca algún avance
+            i = 0
+            while i < len(tecnicas) and not tecnicas[i][1]():
+                i += 1
+            if i < len(tecnicas):
+                nivel = max(nivel, tecnicas[i][0])
+            else:
+                atascado = True
+
+    if atascado:
+        nivel = NIVEL_SIN_RESOLVER
+    return nivel
+
+
+def dificultad_medida(sudoku:list[list], tablero_lleno:list[list] = None) -> str:
+    """
+    Traduce la calificación de un sudoku a las dificultades del juego.
+
+    Recibe:
+        sudoku (list[list]): Sudoku 9x9 (0 = celda vacía).
+        tablero_lleno (list[list]): Su solución, si se conoce (ver calificar_sudoku).
+
+    Retorno:
+        str: "Facil", "Medio" o "Dificil".
+    """
+    nivel = calificar_sudoku(sudoku, tablero_lleno)
+    resultado = "Facil"
+    for dificultad in ("Medio", "Dificil"):
+        if nivel >= NIVELES_POR_DIFICULTAD[dificultad][0]:
+            resultado = dificultad
+    return resultado
+
+
+def profundizar_sudoku(sudoku:list[list], nivel_minimo:int, nivel_maximo:int, generador = random,
+                       presupuesto_ms:float = None) -> int:
+    """
+    Sigue borrando celdas (en orden aleatorio y sin perder la solución única) hasta que el sudoku
+    necesite al menos una técnica de nivel_minimo. Un borrado que haría pasar el nivel por encima
+    de nivel_maximo se deshace. Si se agota presupuesto_ms, deja de borrar y el sudoku puede quedar
+    por debajo de nivel_minimo. Modifica el sudoku recibido.
+
+    Los sudokus intermedios se califican con calificar_texto, sin caché: se descartan enseguida y
+    solo desplazarían de la caché a las calificaciones que sí se vuelven a pedir.
+
+    Recibe:
+        sudoku (list[list]): Sudoku con solución única.
+        nivel_minimo (int): Nivel al que se quiere llegar.
+        nivel_maximo (int): Nivel que no se puede superar.
+        generador: Fuente de azar (el módulo random o una instancia de random.Random).
+        presupuesto_ms (float): Tiempo máximo en milisegundos (None = sin límite).
+
+    Retorno:
+        int: El nivel final del sudoku.
+    """
+    limite_tiempo = float("inf")
+    if presupuesto_ms is not None:
+        limite_tiempo = time.perf_counter() + presupuesto_ms / 1000
+    nivel = calificar_texto(tablero_a_texto(sudoku))
+    posiciones = [i for i in range(81) if sudoku[i // 9][i % 9] != 0]
+    generador.shuffle(posiciones)
+
+    i = 0
+    while nivel < nivel_minimo and i < len(posiciones) and time.perf_counter() < limite_tiempo:
+        fila = posiciones[i] // 9
+        col = posiciones[i] % 9
+        valor = sudoku[fila][col]
+        sudoku[fila][col] = 0
+        if tiene_otra_solucion(sudoku, fila, col, valor):
+            sudoku[fila][col] = valor
+        else:
+            nuevo_nivel = calificar_texto(tablero_a_texto(sudoku))
+            if nuevo_nivel > nivel_maximo:
+                sudoku[fila][col] = valor
+            else:
+                nivel = nuevo_nivel
+        i += 1
+
+    return nivel
+
+
+def generar_sudoku_calificado(tablero_lleno:list[list], dificultad:str, intentos:int = 5,
+                              presupuesto_ms:float = None, generador = random) -> list[list]:
+    """
+    Genera un sudoku con solución única cuya dificultad medida (ver dificultad_medida) coincida con la pedida.
+    Parte de generar_sudoku (que borra el porcentaje de celdas de esa dificultad) y, si el sudoku
+    resulta más fácil de lo pedido, sigue borrando celdas con profundizar_sudoku. Prueba hasta
+    `intentos` veces; si ninguna coincide, devuelve el último sudoku generado.
+
+    presupuesto_ms limita el tiempo de toda la llamada: generar_sudoku y profundizar_sudoku reciben
+    lo que queda, y cuando se agota no se prueban más intentos. Con un presupuesto corto el sudoku
+    puede quedar más fácil que la dificultad pedida; por eso el valor por omisión es sin límite (el
+    juego genera estas partidas en el hilo del pool, ver pool_partidas, no en el bucle de eventos).
+
+    Recibe:
+        tablero_lleno (list[list]): Tablero completo.
+        dificultad (str): "Facil", "Medio" o "Dificil".
+        intentos (int): Cantidad máxima de sudokus a probar.
+        presupuesto_ms (float): Límite de tiempo de toda la generación en milisegundos (None = sin límite).
+        generador: Fuente de azar (el módulo random o una instancia de random.Random).
+
+    Retorno:
+        list[list]: El sudoku generado.
+    """
+    limite_tiempo = float("inf")
+    if presupuesto_ms is not None:
+        limite_tiempo = time.perf_counter() + presupuesto_ms / 1000
+    nivel_minimo, nivel_maximo = NIVELES_POR_DIFICULTAD[dificultad]
+    intento = 0
+    coincide = False
+    restante = presupuesto_ms
+    while not coincide and intento < intentos and (intento == 0 or restante is None or restante > 0):
+        sudoku = generar_sudoku(tablero_lleno, dificultad, solucion_unica=True, presupuesto_ms=restante,
+                                generador=generador)
+        if presupuesto_ms is not None:
+            restante = (limite_tiempo - time.perf_counter()) * 1000
+        nivel = profundizar_sudoku(sudoku, nivel_minimo, nivel_maximo, generador, restante)
+        coincide = nivel_minimo <= nivel <= nivel_maximo
+        if presupuesto_ms is not None:
+            restante = (limite_tiempo - time.perf_counter()) * 1000
+        intento += 1
+    return sudoku
+
+
+# ==============================
+# Partidas reproducibles por semilla
+# ==============================
+
+LETRAS_CODIGO = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def generar_partida(semilla:int, dificultad:str) -> tuple[list[list], list[list]]:
+    """
+    Genera una partida a partir de una semilla. Usa su propio random.Random (no toca el estado del
+    módulo random) y no aplica límites de tiempo, así que la misma semilla y dificultad dan siempre
+    la misma partida, en cualquier ejecución y en cualquier proceso.
+
+    Recibe:
+        semilla (int): Semilla de la partida.
+        dificultad (str): "Facil", "Medio" o "Dificil".
+
+    Retorno:
+        tuple[list[list], list[list]]: (tablero_lleno, sudoku).
+    """
+    generador = random.Random(semilla)
+    tablero_lleno = generar_tablero(generador)
+    sudoku = generar_sudoku_calificado(tablero_lleno, dificultad, presupuesto_ms=None, generador=generador)
+    return tablero_lleno, sudoku
+
+
+def codigo_partida(semilla:int, dificultad:str) -> str:
+    """
+    Arma un código corto para compartir una partida: la inicial de la dificultad seguida de la
+    semilla en base 36. Por ejemplo codigo_partida(123456, "Medio") devuelve "M2N9C".
+
+    Recibe:
+        semilla (int): Semilla de la partida (mayor o igual a 0).
+        dificultad (str): "Facil", "Medio" o "Dificil".
+
+    Retorno:
+        str: El código de la partida.
+
+    Excepciones:
+        ValueError: Si la semilla es negativa (el código no tiene signo y se leería como otra partida).
+    """
+    if semilla < 0:
+        raise ValueError(f"La semilla de una partida para compartir no puede ser negativa: {semilla}")
+    digitos = ""
+    while semilla > 0 or digitos == "":
+        semilla, resto = divmod(semilla, 36)
+        digitos = LETRAS_CODIGO[resto] + digitos
+    return dificultad[0] + digitos
+
+
+def leer_codigo_partida(codigo:str) -> tuple[int, str]:
+    """
+    Interpreta un código generado por codigo_partida.
+
+    Recibe:
+        codigo (str): El código de la partida.
+
+    Retorno:
+        tuple[int, str]: (semilla, dificultad).
+
+    Excepciones:
+        ValueError: Si el código no es válido.
+    """
+    dificultades = {"F": "Facil", "M": "Medio", "D": "Dificil"}
+    codigo = codigo.strip().upper()
+    if len(codigo) < 2 or codigo[0] not in dificultades:
+        raise ValueError(f"Código de partida inválido: {codigo}")
+    return int(codigo[1:], 36), dificultades[codigo[0]]
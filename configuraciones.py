@@ -2,12 +2,14 @@ import pygame
 pygame.init()
 from biblioteca import *
 from logica_sodoku import *
+from pool_partidas import *
+from sesion_juego import *
 
 
 # ==============================
 # Configuraciones del Tablero
 # ==============================
-TAMANIO_TABLERO = 9
+TAMANIO_TABLERO = 9 # Celdas por lado; el botón de tamaño del menú lo cambia a 16 o 25 (ver TAMANIOS_VALIDOS)
 MARGEN_IZQUIERDO = 150 # Margen de 50px para la izquierda del tablero
 MARGEN_SUPERIOR = 100 # Margen de 50px para arriba del tablero
 
@@ -15,9 +17,11 @@ MARGEN_SUPERIOR = 100 # Margen de 50px para arriba del tablero
 # ==============================
 # Configuraciones la Ventana
 # ==============================
-FONDO = pygame.image.load("fondo sudoku/Frame 2.jpeg") #se importa la imagen de fondo del juego de la carpeta de fondo sudoku
-FONDO_PANTALLA_GANADORES = pygame.image.load("fondo sudoku/PANTALLA_PUNTAJE.jpeg")
-FONDO_JUEGO = pygame.image.load("fondo sudoku/PANTALLA_JUEGO.jpeg")
+# Imágenes de fondo de cada pantalla, de la carpeta de fondo sudoku. Se cargan la primera vez que se
+# muestran, ya convertidas y del tamaño de la ventana (ver recursos.cargar_fondo)
+RUTA_FONDO = "fondo sudoku/Frame 2.jpeg"
+RUTA_FONDO_PANTALLA_GANADORES = "fondo sudoku/PANTALLA_PUNTAJE.jpeg"
+RUTA_FONDO_JUEGO = "fondo sudoku/PANTALLA_JUEGO.jpeg"
 ventana = pygame.display.set_mode((1280, 720))
 pygame.display.set_caption("Sudoku")
 TABLERO_ANCHO = 540
@@ -48,14 +52,19 @@ VERDE = (0, 255, 0)
 # ==============================
 # Configuraciones de las Celdas
 # ==============================
-tamanio_celda = TABLERO_ANCHO // 9
+tamanio_celda = TABLERO_ANCHO // TAMANIO_TABLERO # Se recalcula al cambiar el tamaño del tablero
 
 
 # ==============================
 # Configuración de Fuentes
 # ==============================
-fuente_numeros = pygame.font.Font('fondo sudoku/PatrickHandSC-Regular.ttf', 40)
+# Fuente de los números para cada tamaño de tablero (las celdas del 16x16 y del 25x25 son más chicas)
+FUENTES_NUMEROS = {9: pygame.font.Font('fondo sudoku/PatrickHandSC-Regular.ttf', 40),
+                   16: pygame.font.Font('fondo sudoku/PatrickHandSC-Regular.ttf', 26),
+                   25: pygame.font.Font('fondo sudoku/PatrickHandSC-Regular.ttf', 18)}
+fuente_numeros = FUENTES_NUMEROS[TAMANIO_TABLERO]
 fuente_texto = pygame.font.SysFont('fondo sudoku/PatrickHandSC-Regular.ttf',27)
+fuente_marcas = pygame.font.Font('fondo sudoku/PatrickHandSC-Regular.ttf', 19) # Candidatos (marcas de lápiz)
 
 
 # ==============================
@@ -67,13 +76,9 @@ VALOR_BORDER_RADIUS = 20
 # ==============================
 # Inicialización de Variables
 # ==============================
-temporizador = 0
-tablero = None
-contador_errores = 0
-celda_seleccionada = None
 dificultad = "Facil"
 ultimo_clic_dificultad = 0
-cambio_anterior = False
+mostrar_marcas = False # Se activa y desactiva con la barra espaciadora
 
 # ==============================
 # Variables para el pop-up
@@ -87,11 +92,7 @@ duracion_popup = 2000  # Duración del pop-up en milisegundos (2 segundos)
 # Variables para puntaje
 # ==============================
 
-puntaje_jugador = 0
-PUNTOS_BASE = 1000
-PENALIZACION_ERROR = 100
-PENALIZACION_TIEMPO = 30
-multiplicador_dificultad = None
+puntaje_jugador = 0 # PUNTOS_BASE y las penalizaciones están en sesion_juego
 
 
 
@@ -101,6 +102,9 @@ multiplicador_dificultad = None
 
 pygame.time.set_timer(pygame.USEREVENT, 1000)  # Evento personalizado cada 1 segundo
 DELAY_CLIC = 500  # 500 milisegundos de retraso entre clics
+FPS_MAXIMOS = 60  # Tope de cuadros por segundo del bucle principal (sin tope, el bucle ocupa un núcleo entero)
+reloj = pygame.time.Clock()
+ESPERA_REPOSO_MS = 500  # Si no pasa nada, el bucle duerme hasta el próximo evento, como mucho este tiempo (ver obtener_eventos)
 
 
 # ==============================
@@ -123,6 +127,8 @@ pantalla_actual = "menu"
 # Generación de Tablero y Sudoku
 # ==============================
 
-tablero_lleno = generar_tablero()
-sudoku = generar_sudoku(tablero_lleno, "Facil")
-matriz_booleana = generar_matriz_booleana(sudoku)
+RUTA_BANCO = "banco.bin"  # Banco binario opcional (python generar_banco.py --cantidad N --binario banco.bin)
+usar_banco(RUTA_BANCO, opcional=True)  # Si no existe, no se avisa: las partidas se generan
+iniciar_pool()  # Empieza a pre-generar partidas en segundo plano
+tablero_lleno, sudoku = obtener_partida("Facil")  # Mismo camino (y mismas métricas) que cualquier otra partida
+sesion = SesionJuego(tablero_lleno, sudoku, dificultad, candidatos=True) # Todo el estado de la partida en curso
@@ -0,0 +1,205 @@
+import pygame
+from biblioteca import *
+
+# ==============================
+# Dibujo por regiones de la pantalla de juego
+# ==============================
+#
+# mostrar_pantalla_juego dibuja la ventana entera y la manda entera a la pantalla. Eso alcanza para el
+# primer cuadro, pero en los siguientes casi nada cambia: el reloj una vez por segundo, una celda cuando
+# se escribe un número, el resaltado cuando cambia la selección, un botón cuando el cursor pasa por
+# encima. PantallaJuego recuerda lo que dibujó en el último cuadro, redibuja (con un área de recorte)
+# solo lo que cambió y actualiza solo esos rectángulos con pygame.display.update. Si no cambió nada,
+# el cuadro no dibuja nada.
+
+# Zonas de los textos del panel derecho (el recuadro blanco de cada uno es parte de FONDO_JUEGO)
+RECT_TEMPORIZADOR = pygame.Rect(1065, 68, 160, 28)
+RECT_ERRORES = pygame.Rect(1065, 154, 160, 28)
+RECT_RESTANTES = pygame.Rect(1065, 240, 160, 28)
+BOTONES_JUEGO = (("Reiniciar", pygame.Rect(1060, 530, 170, 60)), ("Volver", pygame.Rect(1060, 600, 170, 60)))
+
+
+def cursor_sobre(rect:pygame.Rect, cursor:tuple) -> bool:
+    '''
+    Devuelve True si el cursor está sobre el rectángulo, con el mismo criterio que usa mostrar_boton
+    para pintar el botón con el color de resaltado.
+    '''
+    return rect.x < cursor[0] < rect.right and rect.y < cursor[1] < rect.bottom
+
+
+def estados_celdas(sudoku:Tablero, marcas:bool) -> list[int]:
+    '''
+    Resume en un entero lo que se dibuja en cada celda (sin contar el resaltado de la selección):
+    el número, si coincide con la solución, si está repetido (ver Tablero.en_conflicto) y, si se
+    muestran las marcas de lápiz, sus candidatos. Dos cuadros con el mismo entero se ven igual.
+
+    Parámetros:
+        sudoku (Tablero): El tablero del jugador, con su solución.
+        marcas (bool): Si se dibujan las marcas de lápiz (solo en el 9x9).
+
+    Retorno:
+        list[int]: El estado de cada celda, en el orden de sudoku.celdas.
+    '''
+    solucion = sudoku.solucion.celdas
+    en_conflicto = sudoku.conflictos.en_conflicto if sudoku.conflictos is not None else None
+    mascaras = sudoku.candidatos.mascaras if marcas and sudoku.lado == 9 and sudoku.candidatos is not None else None
+    estados = []
+    for celda, num in enumerate(sudoku.celdas):
+        estado = num | (num == solucion[celda]) << 5
+        if en_conflicto is not None and en_conflicto(celda):
+            estado |= 1 << 6
+        if mascaras is not None:
+            estado |= mascaras[celda] << 7
+        estados.append(estado)
+    return estados
+
+
+class PantallaJuego:
+    """
+    Lo que se dibujó en el último cuadro de la pantalla de juego, para redibujar solo lo que cambió (ver dibujar).
+
+    Atributos:
+        sesion (SesionJuego): La sesión dibujada; si es otra (partida nueva), se dibuja todo de nuevo.
+        tamanio_celda (int): Tamaño de celda con el que se dibujó el tablero.
+        celdas (bytes): Copia de las celdas del tablero dibujado.
+        estados (list): Estado dibujado de cada celda (ver estados_celdas).
+        seleccionada (tuple): Celda seleccionada dibujada, o None.
+        marcas (bool): Si se dibujaron las marcas de lápiz.
+        textos (tuple): (segundos, errores, celdas restantes) dibujados en el panel.
+        botones (tuple): Para cada botón de BOTONES_JUEGO, si se dibujó resaltado (cursor encima).
+        completa (bool): False si el próximo cuadro se tiene que dibujar entero (ver invalidar).
+    """
+    __slots__ = ("sesion", "tamanio_celda", "celdas", "estados", "seleccionada", "marcas", "textos", "botones", "completa")
+
+    def __init__(self) -> None:
+        self.sesion = None
+        self.tamanio_celda = 0
+        self.celdas = b""
+        self.estados = []
+        self.seleccionada = None
+        self.marcas = False
+        self.textos = ()
+        self.botones = ()
+        self.completa = False
+
+    def invalidar(self) -> None:
+        """
+        Hace que el próximo cuadro se dibuje entero (por ejemplo, al volver a la pantalla de juego
+        después de otra pantalla que dibujó encima).
+        """
+        self.completa = False
+
+    def celdas_cambiadas(self, sudoku:Tablero, seleccionada:tuple, marcas:bool) -> set:
+        """
+        Compara el tablero con el último cuadro y devuelve los índices de las celdas que hay que
+        redibujar: las que cambiaron de estado y, si cambió la selección o la celda seleccionada,
+        la fila, columna y bloque resaltados antes y ahora. Si no cambiaron ni las celdas, ni la
+        selección ni las marcas, no recorre el tablero.
+        """
+        sucias = set()
+        if sudoku.celdas != self.celdas or marcas != self.marcas:
+            estados = estados_celdas(sudoku, marcas)
+            anteriores = self.estados
+            sucias.update(celda for celda, estado in enumerate(estados) if estado != anteriores[celda])
+            self.estados = estados
+            self.celdas = bytes(sudoku.celdas)
+            self.marcas = marcas
+
+        lado = sudoku.lado
+        resaltadas = celdas_resaltadas_de_tamanio(lado)
+        for celda in (self.seleccionada, seleccionada):
+            if celda is not None:
+                indice = celda[0] * lado + celda[1]
+                if seleccionada != self.seleccionada or indice in sucias:  # El color del resaltado depende de la celda seleccionada
+                    sucias.update(fila * lado + col for fila, col in resaltadas[indice])
+        self.seleccionada = seleccionada
+        return sucias
+
+    def dibujar(self, ventana:pygame.display, sesion:SesionJuego, fuente_numeros:pygame.font, fuente_texto:pygame.font,
+                BLANCO:tuple, FONDO_JUEGO:pygame.Surface, TABLERO_ANCHO:int, TABLERO_ALTO:int, MARGEN_IZQUIERDO:int,
+                MARGEN_SUPERIOR:int, CELESTE:tuple, AMARILLO_CLARO:tuple, GRIS_OSCURO:tuple, ROSA:tuple, ROSA_CLARO:tuple,
+                tamanio_celda:int, TAMANIO_TABLERO:int, NEGRO:tuple, ROJO:tuple, AZUL:tuple, VALOR_BORDER_RADIUS:int,
+                AMARILLO_OSCURO:tuple, fuente_marcas:pygame.font = None) -> list:
+        """
+        Dibuja un cuadro de la pantalla de juego. La primera vez (o después de invalidar, de cambiar
+        de sesión o de tamaño de celda) dibuja todo con mostrar_pantalla_juego; después, solo las
+        celdas, los textos y los botones que cambiaron, y actualiza solo esos rectángulos.
+
+        Parámetros:
+            sesion (SesionJuego): La partida en curso.
+            fuente_marcas (pygame.font): Fuente de las marcas de lápiz; si es None, no se dibujan.
+            El resto, igual que en mostrar_pantalla_juego.
+
+        Retorno:
+            list: Los rectángulos que se actualizaron (vacía si el cuadro no cambió nada).
+        """
+        sudoku = sesion.sudoku
+        cursor = pygame.mouse.get_pos()
+        textos = (sesion.segundos, sesion.errores, sudoku.celdas_restantes())
+        botones = tuple(cursor_sobre(rect, cursor) for texto, rect in BOTONES_JUEGO)
+        marcas = fuente_marcas is not None
+
+        if not self.completa or sesion is not self.sesion or tamanio_celda != self.tamanio_celda:
+            mostrar_pantalla_juego(sudoku, ventana, sesion.solucion, sesion.seleccionada, fuente_numeros, sesion.segundos,
+                                   sesion.errores, fuente_texto, BLANCO, FONDO_JUEGO, TABLERO_ANCHO, TABLERO_ALTO,
+                                   MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, AMARILLO_CLARO, GRIS_OSCURO, ROSA, ROSA_CLARO,
+                                   tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, VALOR_BORDER_RADIUS, AMARILLO_OSCURO,
+                                   fuente_marcas)
+            self.sesion = sesion
+            self.tamanio_celda = tamanio_celda
+            self.celdas = bytes(sudoku.celdas)
+            self.estados = estados_celdas(sudoku, marcas)
+            self.seleccionada = sesion.seleccionada
+            self.marcas = marcas
+            self.textos = textos
+            self.botones = botones
+            self.completa = True
+            return [ventana.get_rect()]
+
+        sucias = []
+
+        # Tablero: se redibuja recortado a las celdas que cambiaron (dibujar_tablero saltea los números fuera del recorte)
+        celdas = self.celdas_cambiadas(sudoku, sesion.seleccionada, marcas)
+        if celdas:
+            rectangulos = rectangulos_celdas(MARGEN_IZQUIERDO, MARGEN_SUPERIOR, tamanio_celda, sudoku.lado)
+            rects_celdas = [rectangulos[celda] for celda in celdas]
+            ventana.set_clip(rects_celdas[0].unionall(rects_celdas[1:]))
+            dibujar_tablero(ventana, sudoku, sesion.solucion, sesion.seleccionada, fuente_numeros, FONDO_JUEGO,
+                            TABLERO_ANCHO, TABLERO_ALTO, BLANCO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, AMARILLO_CLARO,
+                            GRIS_OSCURO, ROSA, ROSA_CLARO, tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, fuente_marcas)
+            sucias.extend(rects_celdas)
+
+        # Textos del panel: se repone el fondo de su zona y se escribe el valor nuevo
+        if textos != self.textos:
+            segundos, errores, restantes = textos
+            if segundos != self.textos[0]:
+                ventana.set_clip(RECT_TEMPORIZADOR)
+                ventana.blit(FONDO_JUEGO, RECT_TEMPORIZADOR, RECT_TEMPORIZADOR)
+                mostrar_temporizador(segundos, ventana, fuente_texto, NEGRO)
+                sucias.append(RECT_TEMPORIZADOR)
+            if errores != self.textos[1]:
+                ventana.set_clip(RECT_ERRORES)
+                ventana.blit(FONDO_JUEGO, RECT_ERRORES, RECT_ERRORES)
+                mostrar_contador_errores(errores, ventana, fuente_texto, NEGRO)
+                sucias.append(RECT_ERRORES)
+            if restantes != self.textos[2]:
+                ventana.set_clip(RECT_RESTANTES)
+                ventana.blit(FONDO_JUEGO, RECT_RESTANTES, RECT_RESTANTES)
+                mostrar_celdas_restantes(restantes, ventana, fuente_texto, NEGRO)
+                sucias.append(RECT_RESTANTES)
+            self.textos = textos
+
+        # Botones: solo el que cambió de resaltado
+        for (texto, rect), sobre, antes in zip(BOTONES_JUEGO, botones, self.botones):
+            if sobre != antes:
+                ventana.set_clip(rect)
+                ventana.blit(FONDO_JUEGO, rect, rect)
+                mostrar_boton(texto, rect.x, rect.y, rect.width, rect.height, ventana, fuente_texto, AMARILLO_CLARO,
+                              NEGRO, VALOR_BORDER_RADIUS, 1, AMARILLO_OSCURO)
+                sucias.append(rect)
+        self.botones = botones
+
+        ventana.set_clip(None)
+        if sucias:
+            pygame.display.update(sucias)
+        return sucias
@@ -0,0 +1,239 @@
+import argparse
+import json
+import os
+import time
+from multiprocessing import Pool, cpu_count
+from pool_partidas import *
+from banco_binario import *
+
+# ==============================
+# Generación masiva de partidas (línea de comandos)
+# ==============================
+#
+# Uso:
+#   python generar_banco.py --cantidad 10000 --salida banco
+#   python generar_banco.py --cantidad 10000 --salida banco --dificultades Dificil --procesos 4
+#   python generar_banco.py --cantidad 10000 --binario banco.bin
+#
+# Cada partida i de una dificultad usa una semilla propia (ver semilla_de_partida) y se genera con
+# calificador.generar_partida, así la partida de una semilla es la misma que se obtiene en el juego
+# con su código (ver codigo_partida), sin importar el proceso que la generó. Las semillas de las
+# dificultades se intercalan, así la partida i de Facil, Medio y Dificil no comparten el tablero resuelto.
+# Las partidas se guardan en lotes (un archivo JSON Lines por lote) dentro de salida/<dificultad>/.
+# Si el proceso se corta, al volver a ejecutarlo con los mismos parámetros se saltean los lotes que ya
+# están completos. Los parámetros se anotan en salida/manifiesto.json: con otros (otra semilla inicial,
+# otro tamaño de lote u otra cantidad) no se reanuda, porque los lotes existentes no coincidirían.
+# Con --binario, al terminar se empaquetan todos los lotes en un banco binario (ver banco_binario).
+
+TAMANIO_LOTE = 500
+NOMBRE_MANIFIESTO = "manifiesto.json"
+
+
+def semilla_de_partida(semilla_inicial:int, dificultad:str, i:int) -> int:
+    """
+    Devuelve la semilla de la partida número i de una dificultad. Las semillas de las tres
+    dificultades se intercalan (semilla_inicial + 3 * i + posición de la dificultad en DIFICULTADES),
+    así no se repiten entre dificultades y no dependen de cuáles se generen.
+
+    Recibe:
+        semilla_inicial (int): Semilla de la primera partida de Facil.
+        dificultad (str): "Facil", "Medio" o "Dificil".
+        i (int): Número de partida dentro de la dificultad (empieza en 0).
+
+    Retorno:
+        int: La semilla de la partida.
+    """
+    return semilla_inicial + len(DIFICULTADES) * i + DIFICULTADES.index(dificultad)
+
+
+def verificar_manifiesto(salida:str, cantidad:int, semilla_inicial:int, tamanio_lote:int) -> None:
+    """
+    Anota los parámetros del banco en salida/manifiesto.json o, si ya estaba, verifica que sean los
+    mismos antes de reanudar. Sin manifiesto pero con lotes ya escritos, tampoco se reanuda (no se
+    sabe con qué parámetros se generaron).
+
+    Recibe:
+        salida (str): Carpeta base del banco.
+        cantidad (int): Partidas por dificultad.
+        semilla_inicial (int): Semilla inicial (ver semilla_de_partida).
+        tamanio_lote (int): Partidas por archivo.
+
+    Excepciones:
+        ValueError: Si la carpeta tiene lotes generados con otros parámetros.
+    """
+    parametros = {"semilla_inicial": semilla_inicial, "tamanio_lote": tamanio_lote, "cantidad": cantidad}
+    ruta = os.path.join(salida, NOMBRE_MANIFIESTO)
+    if os.path.exists(ruta):
+        with open(ruta) as archivo:
+            anteriores = json.load(archivo)
+        if anteriores != parametros:
+            raise ValueError(f"{salida} tiene lotes generados con otros parámetros ({anteriores}): "
+                             f"se tiene que usar otra carpeta de salida o los mismos parámetros.")
+    else:
+        if any(os.path.exists(os.path.join(salida, dificultad)) and os.listdir(os.path.join(salida, dificultad))
+               for dificultad in DIFICULTADES):
+            raise ValueError(f"{salida} tiene lotes sin {NOMBRE_MANIFIESTO}: se tiene que usar otra carpeta de salida.")
+        os.makedirs(salida, exist_ok=True)
+        with open(ruta, "w") as archivo:
+            json.dump(parametros, archivo)
+
+
+def ruta_lote(salida:str, dificultad:str, numero_lote:int) -> str:
+    """
+    Devuelve la ruta del archivo de un lote.
+
+    Recibe:
+        salida (str): Carpeta base del banco.
+        dificultad (str): Dificultad del lote.
+        numero_lote (int): Número de lote (empieza en 0).
+
+    Retorno:
+        str: La ruta del archivo .jsonl del lote.
+    """
+    return os.path.join(salida, dificultad, f"lote_{numero_lote:06d}.jsonl")
+
+
+def generar_lote(tarea:tuple) -> tuple[int, float]:
+    """
+    Genera un lote de partidas y lo escribe en disco. Se ejecuta en los procesos del pool.
+    El archivo se escribe primero con extensión .tmp y se renombra al terminar, así un lote
+    cortado a la mitad nunca se confunde con uno completo.
+
+    Recibe:
+        tarea (tuple): (ruta, dificultad, semilla_inicial, primera partida del lote, cantidad)
+
+    Retorno:
+        tuple[int, float]: Cantidad de partidas generadas y segundos que tardó el proceso.
+    """
+    ruta, dificultad, semilla_inicial, desde, cantidad = tarea
+    inicio = time.perf_counter()
+    ruta_temporal = ruta + ".tmp"
+    with open(ruta_temporal, "w") as archivo:
+        for i in range(desde, desde + cantidad):
+            semilla = semilla_de_partida(semilla_inicial, dificultad, i)
+            tablero_lleno, sudoku = generar_partida(semilla, dificultad)
+            registro = {"semilla": semilla, "dificultad": dificultad,
+                        "tablero_lleno": tablero_a_texto(tablero_lleno), "sudoku": tablero_a_texto(sudoku)}
+            archivo.write(json.dumps(registro) + "\n")
+    os.replace(ruta_temporal, ruta)
+    return cantidad, time.perf_counter() - inicio
+
+
+def armar_tareas(salida:str, dificultades:list, cantidad:int, semilla_inicial:int, tamanio_lote:int) -> tuple[list, int]:
+    """
+    Arma la lista de lotes que faltan generar, salteando los que ya existen en disco (reanudación).
+    Se llama después de verificar_manifiesto, así los lotes existentes son de los mismos parámetros.
+
+    Recibe:
+        salida (str): Carpeta base del banco.
+        dificultades (list): Dificultades a generar.
+        cantidad (int): Partidas por dificultad.
+        semilla_inicial (int): Semilla inicial (ver semilla_de_partida).
+        tamanio_lote (int): Partidas por archivo.
+
+    Retorno:
+        tuple[list, int]: Las tareas pendientes y la cantidad de partidas que ya estaban generadas.
+    """
+    tareas = []
+    ya_generadas = 0
+    for dificultad in dificultades:
+        os.makedirs(os.path.join(salida, dificultad), exist_ok=True)
+        for numero_lote, desde in enumerate(range(0, cantidad, tamanio_lote)):
+            cantidad_lote = min(tamanio_lote, cantidad - desde)
+            ruta = ruta_lote(salida, dificultad, numero_lote)
+            if os.path.exists(ruta):
+                ya_generadas += cantidad_lote
+            else:
+                tareas.append((ruta, dificultad, semilla_inicial, desde, cantidad_lote))
+    return tareas, ya_generadas
+
+
+def leer_lotes(salida:str, dificultad:str, cantidad:int, tamanio_lote:int):
+    """
+    Recorre los lotes de una dificultad en orden, de a una partida.
+
+    Recibe:
+        salida (str): Carpeta base del banco.
+        dificultad (str): Dificultad a leer.
+        cantidad (int): Partidas de esa dificultad.
+        tamanio_lote (int): Partidas por archivo.
+
+    Devuelve (generador):
+        Cada partida como (tablero_lleno, sudoku).
+    """
+    for numero_lote in range((cantidad + tamanio_lote - 1) // tamanio_lote):
+        with open(ruta_lote(salida, dificultad, numero_lote)) as archivo:
+            for linea in archivo:
+                registro = json.loads(linea)
+                yield texto_a_tablero(registro["tablero_lleno"]), texto_a_tablero(registro["sudoku"])
+
+
+def generar_banco(salida:str, dificultades:list, cantidad:int, semilla_inicial:int = 0,
+                  procesos:int = None, tamanio_lote:int = TAMANIO_LOTE) -> None:
+    """
+    Genera el banco de partidas usando todos los núcleos y muestra el avance y el rendimiento.
+
+    Recibe:
+        salida (str): Carpeta base del banco.
+        dificultades (list): Dificultades a generar.
+        cantidad (int): Partidas por dificultad.
+        semilla_inicial (int): Semilla inicial (ver semilla_de_partida).
+        procesos (int): Cantidad de procesos (por defecto, uno por núcleo).
+        tamanio_lote (int): Partidas por archivo.
+
+    Excepciones:
+        ValueError: Si salida tiene lotes de otros parámetros (ver verificar_manifiesto).
+    """
+    if procesos is None:
+        procesos = cpu_count()
+
+    verificar_manifiesto(salida, cantidad, semilla_inicial, tamanio_lote)
+
+    tareas, ya_generadas = armar_tareas(salida, dificultades, cantidad, semilla_inicial, tamanio_lote)
+    total = cantidad * len(dificultades)
+    if ya_generadas:
+        print(f"Reanudando: {ya_generadas} de {total} partidas ya estaban generadas.")
+
+    generadas = 0
+    segundos_proceso = 0.0
+    inicio = time.perf_counter()
+    with Pool(procesos) as pool:
+        for cantidad_lote, segundos in pool.imap_unordered(generar_lote, tareas):
+            generadas += cantidad_lote
+            segundos_proceso += segundos
+            transcurrido = time.perf_counter() - inicio
+            print(f"{ya_generadas + generadas}/{total} partidas  "
+                  f"{generadas / transcurrido:.1f} partidas/s", flush=True)
+
+    transcurrido = time.perf_counter() - inicio
+    if generadas:
+        print(f"Generadas {generadas} partidas en {transcurrido:.1f} s con {procesos} procesos: "
+              f"{generadas / transcurrido:.1f} partidas/s en total, "
+              f"{generadas / segundos_proceso:.1f} partidas/s por núcleo.")
+    else:
+        print("No había partidas pendientes.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera un banco de partidas de Sudoku usando todos los núcleos.")
+    parser.add_argument("--cantidad", type=int, required=True, help="Partidas por dificultad.")
+    parser.add_argument("--salida", default="banco", help="Carpeta donde se guardan los lotes.")
+    parser.add_argument("--dificultades", nargs="+", default=list(DIFICULTADES), choices=DIFICULTADES)
+    parser.add_argument("--semilla-inicial", type=int, default=0, help="Semilla de la primera partida (ver semilla_de_partida).")
+    parser.add_argument("--procesos", type=int, default=None, help="Cantidad de procesos (por defecto, uno por núcleo).")
+    parser.add_argument("--tamanio-lote", type=int, default=TAMANIO_LOTE, help="Partidas por archivo.")
+    parser.add_argument("--binario", default=None, help="Archivo de banco binario a crear con todos los lotes.")
+    argumentos = parser.parse_args()
+
+    try:
+        generar_banco(argumentos.salida, argumentos.dificultades, argumentos.cantidad,
+                      argumentos.semilla_inicial, argumentos.procesos, argumentos.tamanio_lote)
+    except ValueError as error:
+        print(error)
+        raise SystemExit(1)
+
+    if argumentos.binario:
+        escribir_banco(argumentos.binario, {
+            dificultad: leer_lotes(argumentos.salida, dificultad, argumentos.cantidad, argumentos.tamanio_lote)
+            for dificultad in argumentos.dificultades})
+        print(f"Banco binario guardado en {argumentos.binario}.")
@@ -1,5 +1,86 @@
 import random
-import copy
+import time
+import hashlib
+from array import array
+from functools import lru_cache
+from math import isqrt
+from resolvedor_dlx import resolver, contar_soluciones, enumerar_soluciones
+
+TODOS_LOS_NUMEROS = 0b1111111110  # Máscara con los bits 1 a 9 encendidos
+PRESUPUESTO_GENERACION_MS = 5  # Tiempo máximo de generar_sudoku con solución única (solo el borrado de celdas, sin calificar)
+
+# Cantidad de números libres (bits 1 a 9 apagados) para cada máscara de números usados
+CANTIDAD_DE_CANDIDATOS = [9 - (usados & TODOS_LOS_NUMEROS).bit_count() for usados in range(1 << 10)]
+
+# ==============================
+# Tablas de índices
+# ==============================
+# Se arman una sola vez por tamaño de tablero (9x9, 16x16, 25x25) y son tuplas (no se pueden
+# modificar por error). Las usan la validación, los resolvedores, el calificador y el resaltado del
+# tablero, así nadie tiene que volver a calcular los límites de un bloque ni armar listas de celdas
+# en cada llamada. Las celdas se indican con su índice plano fila * lado + col, salvo en vecinos_fila_col.
+
+SIMBOLOS = "0123456789ABCDEFGHIJKLMNOP"  # Cómo se muestra cada número: del 10 en adelante son letras
+TAMANIOS_VALIDOS = (9, 16, 25)  # Lados de tablero soportados (bloques de 3x3, 4x4 y 5x5)
+
+
+@lru_cache(maxsize=None)
+def tablas_de_tamanio(lado:int) -> dict:
+    """
+    Arma las tablas de índices de un tablero de lado x lado (el lado tiene que ser un cuadrado perfecto).
+
+    Recibe:
+        lado (int): Cantidad de filas (y de columnas y de números) del tablero: 9, 16 o 25.
+
+    Retorna:
+        dict: Un diccionario con:
+            "subcuadro": lado de cada bloque (3 en el 9x9).
+            "todos": máscara con los bits 1 a lado encendidos.
+            "filas", "columnas", "bloques", "unidades": cada unidad como tupla de índices de celda.
+            "bloque_de_celda": bloque de cada celda (de izquierda a derecha y de arriba hacia abajo).
+            "unidades_de_celda": (fila, lado + columna, 2 * lado + bloque) de cada celda, como índices de "unidades".
+            "vecinos": las celdas distintas que comparten fila, columna o bloque con cada celda.
+            "vecinos_fila_col": los mismos vecinos como pares (fila, col).
+    """
+    subcuadro = isqrt(lado)
+    if subcuadro * subcuadro != lado:
+        raise ValueError(f"El lado del tablero tiene que ser un cuadrado perfecto: {lado}")
+    celdas = range(lado * lado)
+    filas = tuple(tuple(fila * lado + col for col in range(lado)) for fila in range(lado))
+    columnas = tuple(tuple(fila * lado + col for fila in range(lado)) for col in range(lado))
+    bloques = tuple(tuple((b // subcuadro * subcuadro + i // subcuadro) * lado + b % subcuadro * subcuadro + i % subcuadro
+                          for i in range(lado)) for b in range(lado))
+    unidades = filas + columnas + bloques
+    bloque_de_celda = tuple(celda // (lado * subcuadro) * subcuadro + celda % lado // subcuadro for celda in celdas)
+    unidades_de_celda = tuple((celda // lado, lado + celda % lado, 2 * lado + bloque_de_celda[celda]) for celda in celdas)
+    vecinos = tuple(tuple(sorted({c for u in unidades_de_celda[celda] for c in unidades[u]} - {celda})) for celda in celdas)
+    vecinos_fila_col = tuple(tuple(divmod(vecino, lado) for vecino in vecinos[celda]) for celda in celdas)
+    return {"subcuadro": subcuadro, "todos": (1 << (lado + 1)) - 2,
+            "filas": filas, "columnas": columnas, "bloques": bloques, "unidades": unidades,
+            "bloque_de_celda": bloque_de_celda, "unidades_de_celda": unidades_de_celda,
+            "vecinos": vecinos, "vecinos_fila_col": vecinos_fila_col}
+
+
+# Las tablas del 9x9, que son las que usan los resolvedores, el calificador y el banco de partidas
+TABLAS_9X9 = tablas_de_tamanio(9)
+
+# Unidades: 9 filas, 9 columnas y 9 bloques, cada una como tupla de índices de celda
+UNIDADES_FILAS = TABLAS_9X9["filas"]
+UNIDADES_COLUMNAS = TABLAS_9X9["columnas"]
+UNIDADES_BLOQUES = TABLAS_9X9["bloques"]
+UNIDADES = TABLAS_9X9["unidades"]
+
+# Bloque de cada celda (0 a 8, de izquierda a derecha y de arriba hacia abajo)
+BLOQUE_DE_CELDA = TABLAS_9X9["bloque_de_celda"]
+
+# Unidades de cada celda: (fila, 9 + columna, 18 + bloque), como índices de UNIDADES
+UNIDADES_DE_CELDA = TABLAS_9X9["unidades_de_celda"]
+
+# Vecinos de cada celda: las 20 celdas distintas que comparten fila, columna o bloque con ella
+VECINOS = TABLAS_9X9["vecinos"]
+
+# Los mismos vecinos como pares (fila, col), para las listas de listas y para dibujar
+VECINOS_FILA_COL = TABLAS_9X9["vecinos_fila_col"]
 
 def es_valido(tablero:list, fila:int, col:int, num:int):
     """
@@ -13,35 +94,105 @@ def es_valido(tablero:list, fila:int, col:int, num:int):
 
     Retorno:
         True si el número puede colocarse en la posición (fila, col) sin violar las reglas
-        False si el número ya está presente en la fila, la columna o el bloque 3x3 correspondiente
+        False si el número ya está presente en otra celda de la fila, la columna o el bloque 3x3 correspondiente
     """
     
     # Inicializa la bandera como True.
     bandera_retorno = True #(el número no está repetido en la fila, columna o bloque)
 
-    # Verifica si el numero ya está en la fila
-    if num in tablero[fila]:
-        bandera_retorno = False
-    
-    # Verifica si el numero ya está en la columna
-    for i in range(9):
-        if tablero[i][col] == num:
+    # Recorre los vecinos de la celda (fila, columna y bloque, sin repetir celdas)
+    lado = len(tablero)
+    for f, c in tablas_de_tamanio(lado)["vecinos_fila_col"][fila * lado + col]:
+        if tablero[f][c] == num:
             bandera_retorno = False
-    
-    # Verifica si el número ya está en el bloque 3x3 correspondiente
-    # Determina la fila y la columna inicial del bloque 3x3 al que pertenece la celda
-    bloque_fila = (fila // 3) * 3
-    bloque_col = (col // 3) * 3
-    
-    # Recorre las celdas del bloque 3x3
-    for i in range(bloque_fila, bloque_fila + 3):
-        for j in range(bloque_col, bloque_col + 3):
-            if tablero[i][j] == num:
-                bandera_retorno = False
-                break
+            break
     
     return bandera_retorno
 
+
+def inicializar_mascaras(tablero:list[list]) -> tuple[list, list, list]:
+    """
+    Construye las máscaras de bits de filas, columnas y bloques 3x3 a partir de un tablero.
+    El bit `num` de cada máscara está encendido si el número ya está usado en esa fila, columna o bloque.
+
+    Recibe:
+        tablero: La matriz 9x9 que representa el tablero de Sudoku (0 = celda vacía)
+
+    Retorno:
+        Una tupla (filas, columnas, bloques) con 9 enteros cada una
+
+    Excepciones:
+        ValueError: Si un número está repetido en una fila, columna o bloque (el tablero no es válido
+                    y las máscaras no podrían representarlo).
+    """
+    filas = [0] * 9
+    columnas = [0] * 9
+    bloques = [0] * 9
+    mascaras = (filas, columnas, bloques)
+    for fila in range(9):
+        for col in range(9):
+            num = tablero[fila][col]
+            if num != 0:
+                if not es_valido_mascara(mascaras, fila, col, num):
+                    raise ValueError(f"El tablero no es válido: el {num} de la celda ({fila}, {col}) está repetido.")
+                colocar_en_mascaras(mascaras, fila, col, num)
+    return mascaras
+
+
+def colocar_en_mascaras(mascaras:tuple, fila:int, col:int, num:int) -> None:
+    """
+    Marca el número `num` como usado en la fila, la columna y el bloque de la celda (fila, col).
+    Enciende el bit aunque ya estuviera encendido (para sacarlo, ver quitar_de_mascaras).
+
+    Recibe:
+        mascaras: La tupla (filas, columnas, bloques) generada por inicializar_mascaras
+        fila: El índice de la fila de la celda
+        col: El índice de la columna de la celda
+        num: El número que se coloca (1 a 9)
+    """
+    filas, columnas, bloques = mascaras
+    bit = 1 << num
+    filas[fila] |= bit
+    columnas[col] |= bit
+    bloques[BLOQUE_DE_CELDA[fila * 9 + col]] |= bit
+
+
+def quitar_de_mascaras(mascaras:tuple, fila:int, col:int, num:int) -> None:
+    """
+    Marca el número `num` como libre en la fila, la columna y el bloque de la celda (fila, col).
+    Es la operación inversa de colocar_en_mascaras.
+
+    Recibe:
+        mascaras: La tupla (filas, columnas, bloques) generada por inicializar_mascaras
+        fila: El índice de la fila de la celda
+        col: El índice de la columna de la celda
+        num: El número que se saca (1 a 9)
+    """
+    filas, columnas, bloques = mascaras
+    bit = ~(1 << num)
+    filas[fila] &= bit
+    columnas[col] &= bit
+    bloques[BLOQUE_DE_CELDA[fila * 9 + col]] &= bit
+
+
+def es_valido_mascara(mascaras:tuple, fila:int, col:int, num:int) -> bool:
+    """
+    Versión O(1) de es_valido: consulta las máscaras en lugar de recorrer el tablero.
+
+    Recibe:
+        mascaras: La tupla (filas, columnas, bloques) generada por inicializar_mascaras
+        fila: El índice de la fila donde se quiere colocar el número
+        col: El índice de la columna donde se quiere colocar el número
+        num: El número que se quiere verificar
+
+    Retorno:
+        True si el número no está usado en la fila, la columna ni el bloque de la celda
+    """
+    filas, columnas, bloques = mascaras
+    usados = filas[fila] | columnas[col] | bloques[BLOQUE_DE_CELDA[fila * 9 + col]]
+    return not usados & (1 << num)
+
+
 def inicializar_matriz(cant_filas:int, cant_columnas:int, valor_inicial:any)->list:
     """
     Inicializa una matriz con un valor específico en todas sus celdas.
@@ -61,63 +212,142 @@ def inicializar_matriz(cant_filas:int, cant_columnas:int, valor_inicial:any)->li
     return matriz
 
 
-def llenar_tablero(tablero: list[list]) -> bool:
+def llenar_tablero(tablero: list[list], generador = random) -> bool:
     """
     Llena un tablero de Sudoku usando backtracking, asegurándose de seguir las reglas del Sudoku.
+    Las reglas se verifican con máscaras de bits (ver inicializar_mascaras), por lo que
+    cada prueba de un candidato cuesta O(1) en lugar de recorrer fila, columna y bloque.
+
+    El backtracking es iterativo (usa una pila propia en lugar de recursión) y en cada paso
+    llena la celda vacía con menos candidatos posibles (la más restringida). Los candidatos de
+    cada celda se prueban en orden aleatorio, igual que antes, para que cada tablero sea distinto.
     
     Recibe:
         tablero: Una matriz 9x9 que representa el tablero de Sudoku con celdas vacías (0).
+        generador: Fuente de azar (el módulo random o una instancia de random.Random).
     
     Retorno:
         True si el tablero fue llenado completamente y es válido.
         False si no se pudo llenar el tablero.
+
+    Excepciones:
+        ValueError: Si el tablero ya tiene un número repetido (ver inicializar_mascaras).
     """
-    tablero_lleno = True  # Asume que el tablero está lleno
-    
+    filas, columnas, bloques = inicializar_mascaras(tablero)
+
+    # Lista de celdas vacías como (fila, col, bloque). Las celdas elegidas se sacan de la lista
+    # cambiándolas por la última y se reponen en orden inverso al retroceder.
+    vacias = []
     for fila in range(9):
         for col in range(9):
-            if tablero[fila][col] == 0:  # Encuentra una celda vacía
-                numeros = list(range(1, 10))
-                random.shuffle(numeros)  # Mezcla los números aleatoriamente
-                tablero_lleno = False  # Hay al menos una celda vacía, asume que no está lleno      
-                
-                for num in numeros:
-                    if es_valido(tablero, fila, col, num):
-                        tablero[fila][col] = num  # Coloca un número válido
-                        
-                        if llenar_tablero(tablero):  # Llama recursivamente
-                            tablero_lleno = True  # Si encuentra solución, marca como lleno   #Backtraking
-                            break
-                        
-                        tablero[fila][col] = 0  # Retrocede si no encuentra solución
-                break  # Sale si no puede colocar un número válido
-                
-        if not tablero_lleno:
-            break  # Sale del bucle externo si no puede llenar el tablero
-    
+            if tablero[fila][col] == 0:
+                vacias.append((fila, col, BLOQUE_DE_CELDA[fila * 9 + col]))
+
+    # Cada elemento de la pila es [fila, col, bloque, posicion_en_vacias, candidatos pendientes, numero colocado]
+    pila = []
+    tablero_lleno = True
+    elegir_celda = True  # True: hay que elegir una nueva celda; False: hay que probar otro candidato en la de arriba
+
+    while (vacias or not elegir_celda) and tablero_lleno:
+        if elegir_celda:
+            # Busca la celda vacía con menos candidatos (MRV)
+            mejor = 0
+            menor_cantidad = 10
+            for i in range(len(vacias)):
+                fila, col, bloque = vacias[i]
+                cantidad = CANTIDAD_DE_CANDIDATOS[filas[fila] | columnas[col] | bloques[bloque]]
+                if cantidad < menor_cantidad:
+                    mejor = i
+                    menor_cantidad = cantidad
+                    if cantidad <= 1:
+                        break
+
+            fila, col, bloque = vacias[mejor]
+            vacias[mejor] = vacias[-1]
+            vacias.pop()
+
+            usados = filas[fila] | columnas[col] | bloques[bloque]
+            candidatos = [num for num in range(1, 10) if not usados & (1 << num)]
+            generador.shuffle(candidatos)  # Mezcla los candidatos aleatoriamente
+            pila.append([fila, col, bloque, mejor, candidatos, 0])
+
+        # Prueba el siguiente candidato de la celda de arriba de la pila
+        marco = pila[-1]
+        fila, col, bloque, posicion, candidatos, anterior = marco
+        if anterior != 0:
+            bit = 1 << anterior  # Retrocede: saca el número que no llevó a una solución
+            filas[fila] ^= bit
+            columnas[col] ^= bit
+            bloques[bloque] ^= bit
+            tablero[fila][col] = 0
+
+        if candidatos:
+            num = candidatos.pop()
+            bit = 1 << num
+            filas[fila] ^= bit
+            columnas[col] ^= bit
+            bloques[bloque] ^= bit
+            tablero[fila][col] = num  # Coloca un número válido
+            marco[5] = num
+            elegir_celda = True
+        else:
+            # No quedan candidatos: repone la celda en la lista de vacías y retrocede a la anterior
+            pila.pop()
+            vacias.append((fila, col, bloque))
+            vacias[posicion], vacias[-1] = vacias[-1], vacias[posicion]
+            elegir_celda = False
+            tablero_lleno = len(pila) > 0  # Si se vació la pila, el tablero no tiene solución
+
     return tablero_lleno  # Devuelve el estado del tablero
 
 
-def generar_tablero() -> list[list]:
+def generar_tablero(generador = random, lado:int = 9) -> list[list]:
     """
     Genera un tablero de Sudoku válido, con todos los números colocados siguiendo las reglas.
 
+    El 9x9 se llena con llenar_tablero. Los tableros de 16x16 y 25x25 parten de tablero_patron y se
+    mezclan con una transformación de simetría al azar (ver transformacion_aleatoria): el backtracking
+    con 256 o 625 celdas puede tardar segundos, y el patrón mezclado da un tablero distinto cada vez en O(lado²).
+
+    Recibe:
+        generador: Fuente de azar (el módulo random o una instancia de random.Random).
+        lado (int): Tamaño del tablero: 9, 16 o 25.
+
     Retorno:
-        Una matriz 9x9 que representa el tablero de Sudoku completo y resuelto.
+        Una matriz lado x lado que representa el tablero de Sudoku completo y resuelto.
         Si no se puede generar un tablero válido, devuelve una matriz vacía.
     """
-    tablero = inicializar_matriz(9, 9, 0)  # Inicializa un tablero vacío
-    tablero_lleno = llenar_tablero(tablero)
-    
-    if not tablero_lleno:
-        tablero = []
-    
+    if lado != 9:
+        tablero = aplicar_transformacion(tablero_patron(lado), transformacion_aleatoria(generador.getrandbits(64), lado))
+    else:
+        tablero = inicializar_matriz(9, 9, 0)  # Inicializa un tablero vacío
+        tablero_lleno = llenar_tablero(tablero, generador)
+
+        if not tablero_lleno:
+            tablero = []
+
     return tablero
 
 
-    
+def tablero_patron(lado:int) -> list[list]:
+    """
+    Arma un tablero resuelto de lado x lado con el patrón clásico: cada fila es la anterior corrida
+    un bloque (y una posición al pasar a la siguiente banda), así ninguna fila, columna ni bloque repite números.
+
+    Recibe:
+        lado (int): Tamaño del tablero (un cuadrado perfecto).
+
+    Retorno:
+        Una matriz lado x lado completa y válida (siempre la misma para cada lado).
+    """
+    subcuadro = tablas_de_tamanio(lado)["subcuadro"]
+    return [[(subcuadro * (fila % subcuadro) + fila // subcuadro + col) % lado + 1 for col in range(lado)]
+            for fila in range(lado)]
+
+
 # Funcion auxiliar que cambia numeros por ceros segun la dificultad
-def generar_sudoku(tablero_lleno:list[list], dificultad:str) -> list[list]:
+def generar_sudoku(tablero_lleno:list[list], dificultad:str, solucion_unica:bool = False,
+                   presupuesto_ms:float = PRESUPUESTO_GENERACION_MS, generador = random) -> list[list]:
     """
     Elimina números del tablero según la dificultad.
     
@@ -125,9 +355,21 @@ def generar_sudoku(tablero_lleno:list[list], dificultad:str) -> list[list]:
     Medio: 40% de las celdas vacías.
     Difícil: 60% de las celdas vacías.
 
+    Con solucion_unica=True solo se borra una celda si el sudoku sigue teniendo una única solución
+    (se verifica con tiene_otra_solucion). Así la solución del jugador
+    siempre coincide con tablero_lleno. Si se agota presupuesto_ms antes de llegar al porcentaje,
+    se devuelve el sudoku con las celdas borradas hasta ese momento (sigue teniendo solución única,
+    pero es más fácil de lo que indica la dificultad). El presupuesto solo acota este borrado: la
+    calificación por técnicas tiene su propio límite (ver calificador.generar_sudoku_calificado).
+    En los tableros de 16x16 y 25x25 la unicidad se asegura con eliminar_celdas_forzadas.
+
     Recibe:
-    tablero_lleno (list[list]) : Tablero completo sin borrar numeros
+    tablero_lleno (list[list]) : Tablero completo sin borrar numeros (9x9, 16x16 o 25x25)
     dificultad (str): Recibe la dificultad seleccionada.
+    solucion_unica (bool): Si es True, garantiza que el sudoku generado tenga una sola solución.
+    presupuesto_ms (float): Tiempo máximo en milisegundos para el modo de solución única.
+                            Con None no hay límite y el resultado depende solo del estado del generador.
+    generador: Fuente de azar (el módulo random o una instancia de random.Random).
     
     Retorna:
     sudoku_final(list[list]): Sudoku con celdas igualadas a 0 para que no se muestren en pantalla.
@@ -135,7 +377,7 @@ def generar_sudoku(tablero_lleno:list[list], dificultad:str) -> list[list]:
     """
     
     # Crear una copia profunda del tablero para no modificar el original
-    sudoku_final = copy.deepcopy(tablero_lleno) #para que no modifique tablero lleno tambien
+    sudoku_final = [fila[:] for fila in tablero_lleno] #para que no modifique tablero lleno tambien
     
     if dificultad == "Facil":
         porcentaje = 0.2
@@ -144,54 +386,1001 @@ def generar_sudoku(tablero_lleno:list[list], dificultad:str) -> list[list]:
     elif dificultad == "Dificil":
         porcentaje = 0.6
 
-    celdas_a_eliminar = int(9 * 9 * porcentaje)
+    lado = len(tablero_lleno)
+    celdas_a_eliminar = int(lado * lado * porcentaje)
     #celdas_a_eliminar = 1
-    while celdas_a_eliminar > 0:
-        fila = random.randint(0, 8)
-        col = random.randint(0, 8)
-        if sudoku_final[fila][col] != 0:
-            sudoku_final[fila][col] = 0
-            celdas_a_eliminar -= 1
+    if solucion_unica and lado != 9:
+        eliminar_celdas_forzadas(sudoku_final, celdas_a_eliminar, generador)
+    elif solucion_unica:
+        eliminar_celdas_unica(sudoku_final, celdas_a_eliminar, presupuesto_ms, generador)
+    else:
+        while celdas_a_eliminar > 0:
+            fila = generador.randint(0, lado - 1)
+            col = generador.randint(0, lado - 1)
+            if sudoku_final[fila][col] != 0:
+                sudoku_final[fila][col] = 0
+                celdas_a_eliminar -= 1
     
     return sudoku_final
 
 
-def generar_matriz_booleana(sudoku:list[list]) -> list[list[bool]]:
+def eliminar_celdas_forzadas(sudoku:list[list], celdas_a_eliminar:int, generador = random) -> int:
+    """
+    Borra celdas en orden aleatorio, pero solo si el número borrado se puede deducir de nuevo con
+    las celdas que quedan: porque es el único candidato de su celda (naked single) o porque es el único
+    lugar de su fila, columna o bloque donde entra ese número (hidden single). Sirve para cualquier lado
+    y no necesita un resolvedor: deshaciendo los borrados en orden inverso se reconstruye tablero_lleno
+    paso a paso, así que el sudoku tiene solución única. En los tableros grandes se llega a borrar
+    alrededor de la mitad de las celdas; si la dificultad pide más, se devuelve lo que se pudo borrar.
+    Modifica el sudoku recibido.
+
+    Recibe:
+        sudoku: Tablero completo de lado x lado.
+        celdas_a_eliminar: Cantidad de celdas que se quieren dejar en 0.
+        generador: Fuente de azar (el módulo random o una instancia de random.Random).
+
+    Retorno:
+        La cantidad de celdas que efectivamente se borraron.
+    """
+    lado = len(sudoku)
+    tablas = tablas_de_tamanio(lado)
+    unidades = tablas["unidades"]
+    unidades_de_celda = tablas["unidades_de_celda"]
+    todos = tablas["todos"]
+
+    # usados[u]: números presentes en la unidad u (fila, columna o bloque, como en tablas_de_tamanio)
+    usados = [0] * (3 * lado)
+    for celda in range(lado * lado):
+        num = sudoku[celda // lado][celda % lado]
+        if num != 0:
+            for u in unidades_de_celda[celda]:
+                usados[u] |= 1 << num
+
+    posiciones = list(range(lado * lado))
+    generador.shuffle(posiciones)  # Orden aleatorio en el que se intentan borrar las celdas
+
+    borradas = 0
+    i = 0
+    while borradas < celdas_a_eliminar and i < len(posiciones):
+        celda = posiciones[i]
+        fila, col = divmod(celda, lado)
+        num = sudoku[fila][col]
+        if num != 0:
+            bit = 1 << num
+            u_fila, u_col, u_bloque = unidades_de_celda[celda]
+            sudoku[fila][col] = 0
+            usados[u_fila] ^= bit
+            usados[u_col] ^= bit
+            usados[u_bloque] ^= bit
+
+            # Naked single: todos los demás números ya están en la fila, la columna o el bloque
+            forzada = (usados[u_fila] | usados[u_col] | usados[u_bloque] | bit) == todos
+            # Hidden single: en alguna unidad ninguna otra celda vacía admite el número
+            for u in (u_fila, u_col, u_bloque):
+                if not forzada:
+                    forzada = True
+                    for otra in unidades[u]:
+                        f, c = divmod(otra, lado)
+                        if otra != celda and sudoku[f][c] == 0:
+                            otra_fila, otra_col, otro_bloque = unidades_de_celda[otra]
+                            if not (usados[otra_fila] | usados[otra_col] | usados[otro_bloque]) & bit:
+                                forzada = False
+                                break
+
+            if forzada:
+                borradas += 1
+            else:
+                sudoku[fila][col] = num  # No se puede deducir: se restaura
+                usados[u_fila] ^= bit
+                usados[u_col] ^= bit
+                usados[u_bloque] ^= bit
+        i += 1
+
+    return borradas
+
+
+def eliminar_celdas_unica(sudoku:list[list], celdas_a_eliminar:int, presupuesto_ms:float, generador = random) -> int:
+    """
+    Borra celdas en orden aleatorio, pero solo mantiene el borrado si el sudoku sigue teniendo solución única.
+    Modifica el sudoku recibido.
+
+    Recibe:
+        sudoku: Tablero completo (o parcialmente borrado) con solución única.
+        celdas_a_eliminar: Cantidad de celdas que se quieren dejar en 0.
+        presupuesto_ms: Tiempo máximo en milisegundos; al superarlo deja de borrar. None = sin límite.
+        generador: Fuente de azar (el módulo random o una instancia de random.Random).
+
+    Retorno:
+        La cantidad de celdas que efectivamente se borraron.
+    """
+    limite_tiempo = float("inf")
+    if presupuesto_ms is not None:
+        limite_tiempo = time.perf_counter() + presupuesto_ms / 1000
+    posiciones = list(range(81))
+    generador.shuffle(posiciones)  # Orden aleatorio en el que se intentan borrar las celdas
+
+    borradas = 0
+    i = 0
+    while borradas < celdas_a_eliminar and i < 81 and time.perf_counter() < limite_tiempo:
+        fila = posiciones[i] // 9
+        col = posiciones[i] % 9
+        valor = sudoku[fila][col]
+        if valor != 0:
+            sudoku[fila][col] = 0
+            if tiene_otra_solucion(sudoku, fila, col, valor):
+                sudoku[fila][col] = valor  # Con esta celda vacía habría más de una solución
+            else:
+                borradas += 1
+        i += 1
+
+    return borradas
+
+
+def tiene_otra_solucion(sudoku:list[list], fila:int, col:int, valor:int) -> bool:
+    """
+    Verifica si al vaciar la celda (fila, col) aparece una solución distinta de la original.
+    Como el sudoku tenía solución única antes de vaciar la celda, cualquier otra solución
+    tiene que poner en esa celda un número distinto de `valor`; alcanza con buscar una
+    sola solución para cada uno de esos números (contar_desde_mascaras con límite 1).
+
+    Recibe:
+        sudoku: Tablero con la celda (fila, col) ya vaciada.
+        fila: Fila de la celda vaciada.
+        col: Columna de la celda vaciada.
+        valor: Número que tenía la celda en la solución original.
+
+    Retorno:
+        True si existe otra solución, False si la solución sigue siendo única.
+    """
+    mascaras = inicializar_mascaras(sudoku)
+    filas, columnas, bloques = mascaras
+    bloque = BLOQUE_DE_CELDA[fila * 9 + col]
+    vacias = []
+    for f in range(9):
+        for c in range(9):
+            if sudoku[f][c] == 0 and (f != fila or c != col):
+                vacias.append((f, c, BLOQUE_DE_CELDA[f * 9 + c]))
+
+    candidatos = TODOS_LOS_NUMEROS & ~(filas[fila] | columnas[col] | bloques[bloque] | (1 << valor))
+    otra_solucion = False
+    while candidatos and not otra_solucion:
+        bit = candidatos & -candidatos
+        candidatos ^= bit
+        filas[fila] ^= bit
+        columnas[col] ^= bit
+        bloques[bloque] ^= bit
+        otra_solucion = contar_desde_mascaras(mascaras, vacias, 1) > 0
+        filas[fila] ^= bit
+        columnas[col] ^= bit
+        bloques[bloque] ^= bit
+
+    return otra_solucion
+
+
+def contar_desde_mascaras(mascaras:tuple, vacias:list, limite:int) -> int:
+    """
+    Cuenta soluciones con backtracking sobre máscaras de bits, deteniéndose al llegar a `limite`.
+    En cada nivel elige la celda vacía con menos candidatos (la más restringida) y prueba cada candidato.
+    Es más liviano que el resolvedor de Dancing Links para búsquedas cortas como las de tiene_otra_solucion.
+
+    Recibe:
+        mascaras: La tupla (filas, columnas, bloques) del estado actual.
+        vacias: Lista de celdas vacías como (fila, col, bloque). Se reordena pero se devuelve con los mismos elementos.
+        limite: Cantidad de soluciones a partir de la cual se deja de buscar.
+
+    Retorno:
+        La cantidad de soluciones encontradas (como máximo `limite`).
+    """
+    if not vacias:
+        return 1
+
+    filas, columnas, bloques = mascaras
+
+    # Busca la celda con menos candidatos
+    mejor = 0
+    mejores_candidatos = 0
+    menor_cantidad = 10
+    for i in range(len(vacias)):
+        fila, col, bloque = vacias[i]
+        candidatos = TODOS_LOS_NUMEROS & ~(filas[fila] | columnas[col] | bloques[bloque])
+        cantidad = candidatos.bit_count()
+        if cantidad < menor_cantidad:
+            mejor = i
+            mejores_candidatos = candidatos
+            menor_cantidad = cantidad
+            if cantidad <= 1:
+                break
+
+    soluciones = 0
+    if menor_cantidad > 0:
+        # Saca la celda elegida de la lista (la cambia por la última) y la repone al final
+        fila, col, bloque = vacias[mejor]
+        vacias[mejor] = vacias[-1]
+        vacias.pop()
+
+        while mejores_candidatos and soluciones < limite:
+            bit = mejores_candidatos & -mejores_candidatos  # Candidato más bajo
+            mejores_candidatos ^= bit
+            filas[fila] ^= bit
+            columnas[col] ^= bit
+            bloques[bloque] ^= bit
+            soluciones += contar_desde_mascaras(mascaras, vacias, limite - soluciones)
+            filas[fila] ^= bit
+            columnas[col] ^= bit
+            bloques[bloque] ^= bit
+
+        vacias.append((fila, col, bloque))
+        vacias[mejor], vacias[-1] = vacias[-1], vacias[mejor]
+
+    return soluciones
+
+
+# ==============================
+# Tablero plano para la partida en juego
+# ==============================
+# La generación, el calificador y el resolvedor trabajan con listas de listas, pero la partida en
+# juego se guarda en un Tablero: las 81 celdas en un bytearray (la celda (fila, col) está en
+# fila * 9 + col) y las celdas fijas en un solo entero usado como conjunto de bits.
+# Copiarlo son 81 bytes y un entero, en lugar de las 10 listas que arma copy.deepcopy.
+# Si el Tablero conoce su solución, lleva la cuenta de las celdas correctas a medida que se escriben,
+# así saber si la partida está ganada es comparar un entero y no recorrer las 81 celdas.
+# Del mismo modo, si tiene Candidatos, cada cambio actualiza solo la celda y sus 20 vecinos.
+
+class Tablero:
+    """
+    Tablero de lado x lado (9x9, 16x16 o 25x25) guardado en forma plana. Se indexa con tablero[fila, col].
+
+    Atributos:
+        celdas (bytearray): Los lado * lado valores, fila por fila (0 = celda vacía).
+        lado (int): Cantidad de filas y de columnas.
+        fijas (int): El bit fila * lado + col está encendido si la celda es fija (viene dada en el sudoku).
+        solucion (Tablero): El tablero resuelto, o None si no se conoce.
+        correctas (int): Cantidad de celdas que coinciden con la solución (0 si no hay solución).
+        candidatos (Candidatos): Marcas de lápiz de cada celda, o None si no se usan (ver activar_candidatos).
+        historial (Historial): Jugadas para deshacer y rehacer, o None si no se guardan (ver activar_historial).
+        conflictos (Conflictos): Números repetidos en filas, columnas y bloques, o None (ver activar_conflictos).
+    """
+    __slots__ = ("celdas", "lado", "fijas", "solucion", "correctas", "candidatos", "historial", "conflictos")
+
+    def __init__(self, celdas:bytearray = None, fijas:int = 0, solucion:"Tablero" = None, lado:int = 9) -> None:
+        self.celdas = bytearray(lado * lado) if celdas is None else celdas
+        self.lado = isqrt(len(self.celdas))
+        self.fijas = fijas
+        self.solucion = solucion
+        self.correctas = 0
+        self.candidatos = None
+        self.historial = None
+        self.conflictos = None
+        if solucion is not None:
+            self.correctas = sum(1 for num, correcto in zip(self.celdas, solucion.celdas) if num == correcto)
+
+    @classmethod
+    def desde_matriz(cls, matriz:list[list], marcar_fijas:bool = False, solucion:"Tablero" = None) -> "Tablero":
+        """
+        Crea un Tablero a partir de una matriz de lado x lado.
+
+        Recibe:
+            matriz (list[list]): Tablero como lista de listas.
+            marcar_fijas (bool): Si es True, las celdas distintas de 0 quedan marcadas como fijas.
+            solucion (Tablero): El tablero resuelto, para llevar la cuenta de celdas correctas.
+
+        Retorna:
+            Tablero: El tablero nuevo (no comparte memoria con la matriz).
+        """
+        celdas = bytearray(num for fila in matriz for num in fila)
+        fijas = 0
+        if marcar_fijas:
+            for i, num in enumerate(celdas):
+                if num != 0:
+                    fijas |= 1 << i
+        return cls(celdas, fijas, solucion)
+
+    def a_matriz(self) -> list[list]:
+        """
+        Devuelve el tablero como lista de listas (para el resolvedor, el calificador o el banco).
+        """
+        celdas = self.celdas
+        lado = self.lado
+        return [list(celdas[i:i + lado]) for i in range(0, len(celdas), lado)]
+
+    def copia(self) -> "Tablero":
+        """
+        Devuelve una copia independiente: un bytearray nuevo, el mismo entero de fijas y la
+        misma solución (que no se copia, porque no cambia). La copia empieza sin historial.
+        """
+        copia = Tablero.__new__(Tablero)
+        copia.celdas = bytearray(self.celdas)
+        copia.lado = self.lado
+        copia.fijas = self.fijas
+        copia.solucion = self.solucion
+        copia.correctas = self.correctas
+        copia.candidatos = None
+        copia.historial = None
+        copia.conflictos = None
+        if self.candidatos is not None:
+            copia.activar_candidatos()
+        if self.conflictos is not None:
+            copia.activar_conflictos()
+        return copia
+
+    def activar_candidatos(self) -> "Candidatos":
+        """
+        Calcula los candidatos de todas las celdas; desde ahí se mantienen actualizados en cada cambio.
+
+        Retorna:
+            Candidatos: Los candidatos del tablero.
+        """
+        self.candidatos = Candidatos(self.celdas, self.lado)
+        return self.candidatos
+
+    def activar_historial(self) -> "Historial":
+        """
+        Empieza a guardar cada cambio del tablero para poder deshacerlo y rehacerlo.
+
+        Retorna:
+            Historial: El historial (vacío) del tablero.
+        """
+        self.historial = Historial()
+        return self.historial
+
+    def activar_conflictos(self) -> "Conflictos":
+        """
+        Cuenta los números de cada fila, columna y bloque; desde ahí la cuenta se mantiene en cada cambio.
+
+        Retorna:
+            Conflictos: Los conflictos del tablero.
+        """
+        self.conflictos = Conflictos(self.celdas, self.lado)
+        return self.conflictos
+
+    def deshacer(self) -> tuple:
+        """
+        Deshace la última jugada del historial en O(1). La cuenta de celdas correctas y los candidatos
+        se actualizan igual que en cualquier cambio, así resuelto() sigue siendo correcto.
+
+        Retorna:
+            tuple: (fila, col) de la celda que cambió, o None si no hay nada para deshacer.
+        """
+        resultado = None
+        jugada = self.historial.deshacer() if self.historial is not None else None
+        if jugada is not None:
+            celda, anterior, num = jugada
+            self.escribir_celda(celda, anterior)
+            resultado = divmod(celda, self.lado)
+        return resultado
+
+    def rehacer(self) -> tuple:
+        """
+        Vuelve a aplicar la última jugada deshecha en O(1).
+
+        Retorna:
+            tuple: (fila, col) de la celda que cambió, o None si no hay nada para rehacer.
+        """
+        resultado = None
+        jugada = self.historial.rehacer() if self.historial is not None else None
+        if jugada is not None:
+            celda, anterior, num = jugada
+            self.escribir_celda(celda, num)
+            resultado = divmod(celda, self.lado)
+        return resultado
+
+    def escribir_celda(self, i:int, num:int) -> None:
+        """
+        Escribe un número en la celda de índice plano i, actualizando la cuenta de correctas, los
+        candidatos y los conflictos, pero sin anotarlo en el historial (lo usan __setitem__, deshacer y rehacer).
+        """
+        anterior = self.celdas[i]
+        if self.solucion is not None:
+            correcto = self.solucion.celdas[i]
+            self.correctas += (num == correcto) - (anterior == correcto)
+        self.celdas[i] = num
+        if self.candidatos is not None:
+            self.candidatos.cambiar(i, anterior, num)
+        if self.conflictos is not None:
+            self.conflictos.cambiar(i, anterior, num)
+
+    def es_fija(self, fila:int, col:int) -> bool:
+        """
+        Devuelve True si la celda viene dada en el sudoku y no se puede modificar.
+        """
+        return (self.fijas >> (fila * self.lado + col)) & 1 == 1
+
+    def resuelto(self) -> bool:
+        """
+        Devuelve True si todas las celdas coinciden con la solución, en O(1).
+        """
+        return self.correctas == len(self.celdas)
+
+    def en_conflicto(self, fila:int, col:int) -> bool:
+        """
+        Devuelve True si el número de la celda está repetido en su fila, su columna o su bloque, en O(1).
+        Requiere los conflictos activados (ver activar_conflictos).
+        """
+        return self.conflictos.en_conflicto(fila * self.lado + col)
+
+    def celdas_restantes(self) -> int:
+        """
+        Devuelve cuántas celdas faltan completar correctamente.
+        """
+        return len(self.celdas) - self.correctas
+
+    def __getitem__(self, posicion:tuple) -> int:
+        fila, col = posicion
+        return self.celdas[fila * self.lado + col]
+
+    def __setitem__(self, posicion:tuple, num:int) -> None:
+        fila, col = posicion
+        i = fila * self.lado + col
+        anterior = self.celdas[i]
+        if anterior != num:  # manejar_entrada vuelve a escribir el mismo número mientras la tecla siga apretada
+            if self.historial is not None:
+                self.historial.anotar(i, anterior, num)
+            self.escribir_celda(i, num)
+
+    def __eq__(self, otro:object) -> bool:
+        # Dos tableros son iguales si tienen los mismos números, sin importar cuáles son fijos
+        return isinstance(otro, Tablero) and self.celdas == otro.celdas
+
+    __hash__ = None  # Es mutable
+
+    def __repr__(self) -> str:
+        return f"Tablero('{''.join(SIMBOLOS[num] for num in self.celdas)}')"
+
+
+class Candidatos:
+    """
+    Candidatos (marcas de lápiz) de cada celda de un Tablero, como máscaras de lado bits
+    (bit n encendido = el número n todavía se puede poner en la celda, 0 si la celda está llena).
+
+    Para poder borrar números se cuenta cuántas veces aparece cada número en cada unidad (el jugador
+    puede haber repetido un número por error): el bit de la unidad se apaga recién cuando la cuenta
+    llega a 0. Cada cambio recalcula solo la celda y sus vecinos (20 en el 9x9).
+
+    Atributos:
+        celdas (bytearray): Las celdas del Tablero (compartidas, no es una copia).
+        lado (int): Cantidad de filas y de columnas del tablero.
+        tablas (dict): Las tablas de índices de ese lado (ver tablas_de_tamanio).
+        mascaras (array): Las máscaras de candidatos de cada celda.
+        usados (list): Para cada una de las 3 * lado unidades, máscara de los números que ya tiene.
+        conteos (bytearray): Veces que aparece cada número en cada unidad (posición unidad * (lado + 1) + num).
+    """
+    __slots__ = ("celdas", "lado", "tablas", "mascaras", "usados", "conteos")
+
+    def __init__(self, celdas:bytearray, lado:int = 9) -> None:
+        self.celdas = celdas
+        self.lado = lado
+        self.tablas = tablas_de_tamanio(lado)
+        self.mascaras = array("L", [0]) * len(celdas)  # "L" tiene al menos 32 bits: alcanza para 25 números
+        self.usados = [0] * (3 * lado)
+        self.conteos = bytearray(3 * lado * (lado + 1))
+        unidades_de_celda = self.tablas["unidades_de_celda"]
+        for celda, num in enumerate(celdas):
+            if num != 0:
+                for unidad in unidades_de_celda[celda]:
+                    self.conteos[unidad * (lado + 1) + num] += 1
+                    self.usados[unidad] |= 1 << num
+        for celda in range(len(celdas)):
+            self.recalcular(celda)
+
+    def recalcular(self, celda:int) -> None:
+        """
+        Recalcula la máscara de una celda a partir de los números usados en sus tres unidades.
+        """
+        if self.celdas[celda] != 0:
+            self.mascaras[celda] = 0
+        else:
+            fila, col, bloque = self.tablas["unidades_de_celda"][celda]
+            usados = self.usados
+            self.mascaras[celda] = self.tablas["todos"] & ~(usados[fila] | usados[col] | usados[bloque])
+
+    def cambiar(self, celda:int, anterior:int, num:int) -> None:
+        """
+        Actualiza los candidatos después de que el número de una celda pasó de `anterior` a `num`
+        (0 = vacía). Se llama desde Tablero.__setitem__, con la celda ya escrita.
+        """
+        conteos = self.conteos
+        usados = self.usados
+        numeros = self.lado + 1
+        for unidad in self.tablas["unidades_de_celda"][celda]:
+            if anterior != 0:
+                conteos[unidad * numeros + anterior] -= 1
+                if conteos[unidad * numeros + anterior] == 0:
+                    usados[unidad] &= ~(1 << anterior)
+            if num != 0:
+                conteos[unidad * numeros + num] += 1
+                usados[unidad] |= 1 << num
+        self.recalcular(celda)
+        for vecino in self.tablas["vecinos"][celda]:
+            self.recalcular(vecino)
+
+    def de_celda(self, fila:int, col:int) -> list[int]:
+        """
+        Devuelve los números candidatos de una celda, de menor a mayor (lista vacía si está llena).
+        """
+        mascara = self.mascaras[fila * self.lado + col]
+        return [num for num in range(1, self.lado + 1) if mascara & (1 << num)]
+
+    def pista(self) -> tuple:
+        """
+        Busca la próxima jugada forzada usando solo las máscaras: primero una celda con un único
+        candidato (single desnudo) y si no hay, un número que solo entra en una celda de alguna
+        fila, columna o bloque (single oculto). Si el jugador cometió errores, la pista se calcula
+        a partir de lo que hay en el tablero y puede no coincidir con la solución.
+
+        Retorna:
+            tuple: (fila, col, num), o None si no hay ninguna jugada forzada de estos dos tipos.
+        """
+        mascaras = self.mascaras
+        lado = self.lado
+        for celda in range(len(mascaras)):
+            mascara = mascaras[celda]
+            if mascara != 0 and mascara & (mascara - 1) == 0:
+                return celda // lado, celda % lado, mascara.bit_length() - 1
+
+        for unidad in self.tablas["unidades"]:
+            una_vez = 0
+            varias_veces = 0
+            for celda in unidad:
+                varias_veces |= una_vez & mascaras[celda]
+                una_vez |= mascaras[celda]
+            unicos = una_vez & ~varias_veces
+            if unicos != 0:
+                num = (unicos & -unicos).bit_length() - 1
+                for celda in unidad:
+                    if mascaras[celda] & (1 << num):
+                        return celda // lado, celda % lado, num
+        return None
+
+
+class Conflictos:
+    """
+    Cuenta de cuántas veces aparece cada número en cada fila, columna y bloque de un Tablero, para saber
+    en O(1) si una celda choca con otra (ver en_conflicto) sin recorrer sus vecinos en cada cuadro.
+    Cada cambio de una celda actualiza solo los 3 contadores de sus unidades.
+
+    Atributos:
+        celdas (bytearray): Las celdas del Tablero (compartidas, no es una copia).
+        lado (int): Cantidad de filas y de columnas del tablero.
+        unidades_de_celda (tuple): Fila, columna y bloque de cada celda (ver tablas_de_tamanio).
+        conteos (bytearray): Veces que aparece cada número en cada unidad (posición unidad * (lado + 1) + num).
+        repetidos (int): Cantidad de pares (unidad, número) que aparecen más de una vez; 0 si no hay conflictos.
+    """
+    __slots__ = ("celdas", "lado", "unidades_de_celda", "conteos", "repetidos")
+
+    def __init__(self, celdas:bytearray, lado:int = 9) -> None:
+        self.celdas = celdas
+        self.lado = lado
+        self.unidades_de_celda = tablas_de_tamanio(lado)["unidades_de_celda"]
+        self.conteos = bytearray(3 * lado * (lado + 1))
+        self.repetidos = 0
+        for celda, num in enumerate(celdas):
+            if num != 0:
+                self.cambiar(celda, 0, num)
+
+    def cambiar(self, celda:int, anterior:int, num:int) -> None:
+        """
+        Actualiza las cuentas después de que el número de una celda pasó de `anterior` a `num`
+        (0 = vacía). Se llama desde Tablero.escribir_celda.
+        """
+        conteos = self.conteos
+        numeros = self.lado + 1
+        for unidad in self.unidades_de_celda[celda]:
+            if anterior != 0:
+                posicion = unidad * numeros + anterior
+                conteos[posicion] -= 1
+                if conteos[posicion] == 1:  # Dejó de estar repetido
+                    self.repetidos -= 1
+            if num != 0:
+                posicion = unidad * numeros + num
+                conteos[posicion] += 1
+                if conteos[posicion] == 2:  # Empezó a estar repetido
+                    self.repetidos += 1
+
+    def en_conflicto(self, celda:int) -> bool:
+        """
+        Devuelve True si el número de la celda (índice plano) aparece más de una vez en alguna de sus unidades.
+        """
+        num = self.celdas[celda]
+        if num == 0:
+            return False
+        numeros = self.lado + 1
+        fila, col, bloque = self.unidades_de_celda[celda]
+        conteos = self.conteos
+        return conteos[fila * numeros + num] > 1 or conteos[col * numeros + num] > 1 or conteos[bloque * numeros + num] > 1
+
+    def hay_conflictos(self) -> bool:
+        """
+        Devuelve True si hay algún número repetido en el tablero, en O(1).
+        """
+        return self.repetidos > 0
+
+
+class Historial:
+    """
+    Historial de jugadas de un Tablero para deshacer y rehacer. Cada jugada se guarda como un solo
+    entero (celda, número anterior y número nuevo empaquetados) en un array, no como una copia del
+    tablero: cada jugada ocupa lo mismo (un elemento del array) aunque la partida sea muy larga.
+
+    Las jugadas deshechas quedan después de `posicion` hasta que se hace una jugada nueva, que las descarta.
+    Deshacer no descuenta errores: el contador de errores cuenta los números equivocados que se
+    escribieron (ver SesionJuego.colocar), y rehacer tampoco los vuelve a contar.
+
+    Atributos:
+        jugadas (array): Las jugadas empaquetadas, de la más vieja a la más nueva.
+        posicion (int): Cantidad de jugadas aplicadas; las que siguen son las que se pueden rehacer.
+    """
+    __slots__ = ("jugadas", "posicion")
+
+    BITS_NUMERO = 5  # Alcanza para los números del 0 al 25
+    MASCARA_NUMERO = (1 << BITS_NUMERO) - 1
+
+    def __init__(self) -> None:
+        self.jugadas = array("L")  # "L" tiene al menos 32 bits: celda (10 bits) y dos números (5 bits cada uno)
+        self.posicion = 0
+
+    def anotar(self, celda:int, anterior:int, num:int) -> None:
+        """
+        Guarda una jugada nueva. Si había jugadas deshechas, se descartan (ya no se pueden rehacer).
+        """
+        if self.posicion < len(self.jugadas):
+            del self.jugadas[self.posicion:]
+        self.jugadas.append((celda << (2 * self.BITS_NUMERO)) | (anterior << self.BITS_NUMERO) | num)
+        self.posicion += 1
+
+    def desempaquetar(self, jugada:int) -> tuple[int, int, int]:
+        """
+        Separa una jugada empaquetada en (celda, anterior, num).
+        """
+        return (jugada >> (2 * self.BITS_NUMERO), (jugada >> self.BITS_NUMERO) & self.MASCARA_NUMERO,
+                jugada & self.MASCARA_NUMERO)
+
+    def deshacer(self) -> tuple:
+        """
+        Retrocede una jugada.
+
+        Retorna:
+            tuple: (celda, anterior, num) de la jugada deshecha, o None si no hay jugadas.
+        """
+        resultado = None
+        if self.posicion > 0:
+            self.posicion -= 1
+            resultado = self.desempaquetar(self.jugadas[self.posicion])
+        return resultado
+
+    def rehacer(self) -> tuple:
+        """
+        Avanza una jugada que se había deshecho.
+
+        Retorna:
+            tuple: (celda, anterior, num) de la jugada rehecha, o None si no hay nada para rehacer.
+        """
+        resultado = None
+        if self.posicion < len(self.jugadas):
+            resultado = self.desempaquetar(self.jugadas[self.posicion])
+            self.posicion += 1
+        return resultado
+
+    def __len__(self) -> int:
+        return self.posicion
+
+
+def tablero_a_texto(tablero:list[list]) -> str:
     '''
-    A partir del sudoku original genera una matriz con valores booleanos donde cada posición tiene False si es 0(cero), True si tiene valor asignado.
-    
+    Convierte un tablero 9x9 en un texto de 81 dígitos (fila por fila, 0 = celda vacía).
+    Sirve para guardar tableros en archivos de forma compacta.
+
     Recibe:
-        sudoku: matriz generada con la dificultad aplicada
-    Devuelve:
-        matriz_booleana: matriz con valores booleanos generada a partir de los valores del sudoku
-    
-    False = 0
-    True = 1 - 9
+    tablero (list[list]): Tablero a convertir.
+
+    Retorna:
+    str: Texto de 81 caracteres.
     '''
-    matriz_booleana = []
-    for fila in sudoku: #recorre el sudoku que tiene 0
-        fila_booleana = [] #genera la misma lista pero booleana
-        for celda in fila:
-            fila_booleana.append(celda != 0) # Coloca true si la celda no es cero, False si es cero
-        matriz_booleana.append(fila_booleana)
+    return "".join(str(num) for fila in tablero for num in fila)
+
+
+def texto_a_tablero(texto:str) -> list[list]:
+    '''
+    Convierte un texto de 81 dígitos (generado por tablero_a_texto) en un tablero 9x9.
+
+    Recibe:
+    texto (str): Texto de 81 caracteres.
 
-    return matriz_booleana
+    Retorna:
+    list[list]: El tablero 9x9.
+    '''
+    return [[int(texto[fila * 9 + col]) for col in range(9)] for fila in range(9)]
 
 
 def comprobar_igualdad_celda(sudoku, tablero_lleno, fila, col) -> bool:
     '''
-    Comprueba sudoku[fila][col] contra tablero_lleno[fila][col] y si los numeros en esas coordenadas son identicos, devuelve True.
+    Comprueba sudoku[fila, col] contra tablero_lleno[fila, col] y si los numeros en esas coordenadas son identicos, devuelve True.
     Se utiliza para corroborar que el numero ingresado es correcto
     
     Recibe:
-    sudoku (list[list]): Sudoku con 0 incluidos
-    tablero_lleno (list[list]): Sudoku sin 0
+    sudoku (Tablero): Sudoku con 0 incluidos
+    tablero_lleno (Tablero): Sudoku sin 0
     fila (int): Fila del sudoku
     col (int): Columna del sudoku
     '''
     bandera_igualdad = False
-    if sudoku[fila][col] == tablero_lleno[fila][col] or sudoku[fila][col] == 0:
+    if sudoku[fila, col] == tablero_lleno[fila, col] or sudoku[fila, col] == 0:
         bandera_igualdad = True
         
     return bandera_igualdad
 
+
+# ==============================
+# Variantes por simetría
+# ==============================
+# Reordenar dígitos, filas dentro de una banda, columnas dentro de una pila, bandas, pilas,
+# transponer y rotar el tablero siempre da otro Sudoku válido (y con la misma cantidad de soluciones).
+# Así, a partir de una sola partida generada se obtienen muchísimas partidas distintas en O(81).
+
+def transformacion_aleatoria(semilla:int, lado:int = 9) -> dict:
+    """
+    Elige una transformación de simetría al azar, usando un generador propio inicializado con la semilla
+    (no modifica el estado del módulo random).
+
+    Recibe:
+        semilla (int): Semilla de la transformación. La misma semilla siempre da la misma transformación.
+        lado (int): Tamaño de los tableros a los que se va a aplicar (9, 16 o 25).
+
+    Retorna:
+        dict: {"digitos": lista de lado + 1 con el nuevo número para cada número (digitos[0] = 0),
+               "filas": orden de las filas, "columnas": orden de las columnas,
+               "transponer": bool, "rotaciones": cantidad de giros de 90° en sentido horario (0 a 3)}
+    """
+    generador = random.Random(semilla)
+
+    subcuadro = tablas_de_tamanio(lado)["subcuadro"]
+
+    digitos = list(range(1, lado + 1))
+    generador.shuffle(digitos)
+
+    ordenes = []
+    for _ in range(2):  # Primero filas (bandas), después columnas (pilas)
+        grupos = list(range(subcuadro))
+        generador.shuffle(grupos)
+        orden = []
+        for grupo in grupos:
+            dentro = [grupo * subcuadro + i for i in range(subcuadro)]
+            generador.shuffle(dentro)
+            orden += dentro
+        ordenes.append(orden)
+
+    return {"digitos": [0] + digitos, "filas": ordenes[0], "columnas": ordenes[1],
+            "transponer": generador.random() < 0.5, "rotaciones": generador.randrange(4)}
+
+
+def aplicar_transformacion(tablero:list[list], transformacion:dict) -> list[list]:
+    """
+    Aplica una transformación de simetría a un tablero y devuelve un tablero nuevo (no modifica el original).
+    El orden es: reordenar filas y columnas, transponer, rotar y por último renombrar los dígitos.
+
+    Recibe:
+        tablero (list[list]): Tablero de lado x lado (puede tener ceros, que se mantienen como celdas vacías).
+        transformacion (dict): Transformación generada por transformacion_aleatoria.
+
+    Retorna:
+        list[list]: El tablero transformado.
+    """
+    digitos = transformacion["digitos"]
+    filas = transformacion["filas"]
+    columnas = transformacion["columnas"]
+    transponer = transformacion["transponer"]
+    rotaciones = transformacion["rotaciones"]
+
+    lado = len(tablero)
+    ultimo = lado - 1
+    nuevo = inicializar_matriz(lado, lado, 0)
+    for fila in range(lado):
+        for col in range(lado):
+            # Deshace la rotación: girar 90° en sentido horario lleva (f, c) a (c, ultimo - f)
+            f, c = fila, col
+            for _ in range(rotaciones):
+                f, c = ultimo - c, f
+            if transponer:
+                f, c = c, f
+            nuevo[fila][col] = digitos[tablero[filas[f]][columnas[c]]]
+    return nuevo
+
+
+def transformar_partida(tablero_lleno:list[list], sudoku:list[list], semilla:int) -> tuple[list[list], list[list]]:
+    """
+    Deriva una partida nueva (tablero_lleno, sudoku) a partir de una existente aplicando la misma
+    transformación de simetría a los dos tableros.
+
+    Recibe:
+        tablero_lleno (list[list]): Solución de la partida original.
+        sudoku (list[list]): Sudoku con celdas vacías de la partida original.
+        semilla (int): Semilla que elige la transformación.
+
+    Retorna:
+        tuple[list[list], list[list]]: La nueva partida (tablero_lleno, sudoku).
+    """
+    transformacion = transformacion_aleatoria(semilla, len(tablero_lleno))
+    return aplicar_transformacion(tablero_lleno, transformacion), aplicar_transformacion(sudoku, transformacion)
+
+
+# ==============================
+# Forma canónica y hash (9x9)
+# ==============================
+# Dos partidas son equivalentes si una se obtiene de la otra con transformaciones de simetría:
+# transponer, reordenar bandas, filas dentro de una banda, pilas, columnas dentro de una pila y
+# renombrar los dígitos (2 * 6^8 * 9! transformaciones). La forma canónica elige un representante
+# fijo de cada clase: primero se lleva la solución a su forma mínima (la menor lectura fila por fila)
+# y entre las transformaciones que la dejan mínima (suele haber una sola) se elige la que deja el
+# sudoku mínimo. Como la solución determina casi todo, no hace falta probar todas las transformaciones.
+
+
+def solucion_minima(tablero_lleno:list[list]) -> tuple[tuple, list]:
+    """
+    Busca la forma mínima de un tablero resuelto 9x9 bajo las transformaciones de simetría.
+
+    Para cada elección de transposición y de las tres primeras filas (36 casos), la primera fila
+    renombrada siempre es 123456789, así que el orden de las columnas solo se decide mirando la segunda
+    fila: se arma posición por posición, quedándose en cada paso solo con las opciones que dan el menor
+    número. Con las columnas fijas, las otras dos bandas se ordenan directamente.
+
+    Recibe:
+        tablero_lleno (list[list]): Tablero 9x9 completo y válido.
+
+    Retorna:
+        tuple[tuple, list]: (mínima, transformaciones), donde mínima son los 81 números de la forma
+        mínima y cada transformación es (transponer, filas, columnas, digitos): las filas y columnas
+        originales en el orden en que quedan y el nuevo número de cada número (digitos[0] = 0).
+    """
+    transpuesto = [list(columna) for columna in zip(*tablero_lleno)]
+    minima = None
+    transformaciones = []
+    for transponer, grilla in ((False, tablero_lleno), (True, transpuesto)):
+        for banda in range(3):
+            filas_banda = (banda * 3, banda * 3 + 1, banda * 3 + 2)
+            for fila0 in filas_banda:
+                for fila1 in filas_banda:
+                    if fila1 == fila0:
+                        continue
+                    fila2 = filas_banda[3 - fila0 % 3 - fila1 % 3]  # La que queda de la banda
+                    columna_de = [0] * 10  # Columna de cada número en la primera fila
+                    for col, num in enumerate(grilla[fila0]):
+                        columna_de[num] = col
+                    siguiente = [columna_de[num] for num in grilla[fila1]]
+                    # Si la segunda fila no puede igualar a la de la mejor forma encontrada, el caso se descarta
+                    cota = None if minima is None else [num - 1 for num in minima[9:18]]
+                    for nuevo_a_viejo, viejo_a_nuevo in ordenes_de_columnas(siguiente, cota):
+                        digitos = [0] * 10
+                        for num in range(1, 10):
+                            digitos[num] = viejo_a_nuevo[columna_de[num]] + 1
+                        filas_renombradas = {fila: tuple(digitos[grilla[fila][col]] for col in nuevo_a_viejo)
+                                             for fila in range(9)}
+                        # Las otras dos bandas: cada una con sus filas ordenadas, y las bandas ordenadas entre sí
+                        otras = sorted(sorted((b * 3 + i for i in range(3)), key=filas_renombradas.get)
+                                       for b in range(3) if b != banda)
+                        otras.sort(key=lambda filas: filas_renombradas[filas[0]])
+                        orden_filas = [fila0, fila1, fila2] + otras[0] + otras[1]
+                        candidata = tuple(num for fila in orden_filas for num in filas_renombradas[fila])
+                        if minima is None or candidata < minima:
+                            minima = candidata
+                            transformaciones = []
+                        if candidata == minima:
+                            transformaciones.append((transponer, orden_filas, nuevo_a_viejo, digitos))
+    return minima, transformaciones
+
+
+def ordenes_de_columnas(siguiente:list, cota:list = None) -> list:
+    """
+    Busca los órdenes de columnas (respetando las pilas) que hacen mínima la segunda fila renombrada.
+    Si la primera fila queda 123456789, el número de la segunda fila en la posición j es la nueva
+    posición (más uno) de la columna siguiente[columna que va en j]; se elige posición por posición
+    la opción que da el menor número y se guardan todas las que empatan.
+
+    Recibe:
+        siguiente (list): Para cada columna, la columna donde está en la primera fila el número que la
+                          segunda fila tiene en esa columna.
+        cota (list): Segunda fila (con números de 0 a 8) de la mejor forma encontrada hasta ahora. Si la
+                     segunda fila de este caso resulta mayor, se abandona la búsqueda apenas se nota.
+
+    Retorna:
+        list: Pares (nuevo_a_viejo, viejo_a_nuevo) de listas de 9 con cada orden de columnas óptimo
+        (lista vacía si se superó la cota).
+    """
+    # Estado: (nuevo_a_viejo, viejo_a_nuevo, pila_nueva_a_vieja, pila_vieja_a_nueva); -1 = sin decidir
+    estados = [([-1] * 9, [-1] * 9, [-1] * 3, [-1] * 3)]
+    for posicion in range(9):
+        pila_nueva = posicion // 3
+        mejor = 10
+        proximos = []
+        for nuevo_a_viejo, viejo_a_nuevo, pila_nueva_a_vieja, pila_vieja_a_nueva in estados:
+            if nuevo_a_viejo[posicion] != -1:
+                opciones = (nuevo_a_viejo[posicion],)
+            elif pila_nueva_a_vieja[pila_nueva] != -1:
+                pila = pila_nueva_a_vieja[pila_nueva]
+                opciones = tuple(col for col in range(pila * 3, pila * 3 + 3) if viejo_a_nuevo[col] == -1)
+            else:
+                opciones = tuple(col for col in range(9) if pila_vieja_a_nueva[col // 3] == -1)
+            for col in opciones:
+                # Primero calcula el número que quedaría en esta posición, sin copiar el estado
+                destino = siguiente[col]
+                valor = viejo_a_nuevo[destino]
+                if valor == -1:
+                    # La columna referenciada iría al primer lugar libre de su pila (o de la primera pila libre).
+                    # Nunca es la pila de `col`, así que ubicar `col` no cambia ese lugar.
+                    pila = pila_vieja_a_nueva[destino // 3]
+                    if pila == -1:
+                        pila = min(p for p in range(3) if pila_nueva_a_vieja[p] == -1 and p != pila_nueva)
+                    valor = nuevo_a_viejo.index(-1, pila * 3, pila * 3 + 3)
+                if valor <= mejor:
+                    if valor < mejor:
+                        mejor = valor
+                        proximos = []
+                    estado = (nuevo_a_viejo[:], viejo_a_nuevo[:], pila_nueva_a_vieja[:], pila_vieja_a_nueva[:])
+                    ubicar_columna(estado, col, posicion)
+                    if estado[1][destino] == -1:
+                        ubicar_columna(estado, destino, valor)
+                    proximos.append(estado)
+        estados = proximos
+        if cota is not None:
+            if mejor > cota[posicion]:
+                estados = []
+                break
+            if mejor < cota[posicion]:
+                cota = None  # A partir de acá este caso ya es menor que la cota
+    return [(estado[0], estado[1]) for estado in estados]
+
+
+def ubicar_columna(estado:tuple, col:int, posicion:int) -> None:
+    """
+    Anota en un estado de ordenes_de_columnas que la columna original `col` va en la nueva `posicion`
+    (y que su pila va en la pila de esa posición). Modifica el estado recibido.
+    """
+    nuevo_a_viejo, viejo_a_nuevo, pila_nueva_a_vieja, pila_vieja_a_nueva = estado
+    nuevo_a_viejo[posicion] = col
+    viejo_a_nuevo[col] = posicion
+    pila_nueva_a_vieja[posicion // 3] = col // 3
+    pila_vieja_a_nueva[col // 3] = posicion // 3
+
+
+def forma_canonica(sudoku:list[list], tablero_lleno:list[list] = None) -> str:
+    """
+    Devuelve la forma canónica de un sudoku 9x9: el mismo texto de 81 dígitos (ver tablero_a_texto)
+    para todas las partidas equivalentes por simetría, y textos distintos para las que no lo son.
+
+    Recibe:
+        sudoku (list[list]): Sudoku con celdas vacías (0). También acepta un Tablero.
+        tablero_lleno (list[list]): Su solución. Si no se indica, se calcula con el resolvedor DLX
+                                    (el sudoku tiene que tener solución única).
+
+    Retorna:
+        str: El sudoku transformado a su forma canónica.
+    """
+    if isinstance(sudoku, Tablero):
+        sudoku = sudoku.a_matriz()
+    if isinstance(tablero_lleno, Tablero):
+        tablero_lleno = tablero_lleno.a_matriz()
+    if tablero_lleno is None:
+        tablero_lleno = resolver(sudoku)
+    transpuesto = [list(columna) for columna in zip(*sudoku)]
+    mejor = None
+    for transponer, filas, columnas, digitos in solucion_minima(tablero_lleno)[1]:
+        grilla = transpuesto if transponer else sudoku
+        candidata = "".join(str(digitos[grilla[fila][col]]) for fila in filas for col in columnas)
+        if mejor is None or candidata < mejor:
+            mejor = candidata
+    return mejor
+
+
+def hash_canonico(sudoku:list[list], tablero_lleno:list[list] = None, bits:int = 64) -> int:
+    """
+    Hash estable (el mismo en cualquier ejecución y máquina, a diferencia de hash()) de la forma
+    canónica de un sudoku: sirve como clave para detectar partidas repetidas o equivalentes y para
+    guardar calificaciones o soluciones.
+
+    Recibe:
+        sudoku, tablero_lleno: Ver forma_canonica.
+        bits (int): Tamaño del hash: 64 o 128.
+
+    Retorna:
+        int: El hash (BLAKE2b de la forma canónica).
+    """
+    resumen = hashlib.blake2b(forma_canonica(sudoku, tablero_lleno).encode(), digest_size=bits // 8)
+    return int.from_bytes(resumen.digest(), "big")
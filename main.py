@@ -3,13 +3,17 @@ import pygame
 from configuraciones  import *
 from logica_sodoku import *
 from puntaje import *
+from dibujo_por_regiones import *
+from recursos import *
 
 
 # Inicializar pygame
 pygame.init()
+pantalla_juego = PantallaJuego()  # Recuerda el último cuadro del juego para redibujar solo lo que cambia
 
 while corriendo:
-    for evento in pygame.event.get():
+    # Sin eventos, el bucle espera al próximo en lugar de dar vueltas (salvo con el pop-up, que se cierra solo a los 2 segundos)
+    for evento in obtener_eventos(not mostrar_popup, ESPERA_REPOSO_MS):
         if evento.type == pygame.QUIT:
             salir()
 
@@ -17,55 +21,61 @@ while corriendo:
 
         # Manejo de eventos del temporizador
         if evento.type == pygame.USEREVENT:  # Evento personalizado cada segundo
-            temporizador += 1  # Incrementa el tiempo en segundos                        
+            sesion.avanzar_reloj()  # Incrementa el tiempo en segundos                        
                             
+        # Teclas de la pantalla de juego (los números y las letras se leen en manejar_entrada)
+        if evento.type == pygame.KEYDOWN and pantalla_actual == "juego":
+            if evento.key == pygame.K_TAB:  # Pista: completa la próxima jugada forzada
+                sesion.pista()
+            elif evento.key == pygame.K_SPACE:  # Muestra u oculta las marcas de lápiz
+                mostrar_marcas = not mostrar_marcas
+            elif evento.key in (pygame.K_z, pygame.K_y) and evento.mod & pygame.KMOD_CTRL:  # Deshacer / rehacer
+                if evento.key == pygame.K_z:  # La sesión selecciona la celda que cambió
+                    sesion.deshacer()
+                else:
+                    sesion.rehacer()
+
         # Manejo de clics según la pantalla actual
         if evento.type == pygame.MOUSEBUTTONDOWN:
             if pantalla_actual == "menu":
                 if evento_click(565, 220, 150, 50):  # Botón "Jugar"
-                    temporizador = 0 # Reincia temporizador
                     pantalla_actual = "juego"
-                    tablero_lleno = generar_tablero()
-                    sudoku = jugar(tablero_lleno, dificultad,ventana,tablero_lleno, celda_seleccionada, matriz_booleana, fuente_numeros, 
-                                    temporizador, contador_errores, fuente_texto, BLANCO, FONDO_JUEGO, TABLERO_ANCHO, TABLERO_ALTO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, 
+                    pantalla_juego.invalidar()  # El menú dibujó encima: el primer cuadro del juego va entero
+                    sesion = jugar(dificultad,ventana, fuente_numeros, fuente_texto, BLANCO, cargar_fondo(RUTA_FONDO_JUEGO), TABLERO_ANCHO, TABLERO_ALTO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, 
                                     AMARILLO_CLARO, GRIS_OSCURO, ROSA, ROSA_CLARO, tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, VALOR_BORDER_RADIUS,AMARILLO_OSCURO)
-                    matriz_booleana = generar_matriz_booleana(sudoku)
                     
                 elif evento_click(565, 280, 150, 50):  # Botón "Puntajes"
                     pantalla_actual = "puntajes"
-                    ver_puntajes(ventana, fuente_texto, FONDO_PANTALLA_GANADORES, NEGRO, AZUL_CLARO, VALOR_BORDER_RADIUS, AMARILLO_OSCURO,"nombre_ganadores.json", BLANCO)
+                    ver_puntajes(ventana, fuente_texto, cargar_fondo(RUTA_FONDO_PANTALLA_GANADORES), NEGRO, AZUL_CLARO, VALOR_BORDER_RADIUS, AMARILLO_OSCURO,"nombre_ganadores.json", BLANCO)
 
                 elif evento_click(565, 340, 150, 50):  # Botón "Dificultad"
                     dificultad =  cambiar_dificultad(ultimo_clic_dificultad,dificultad, DELAY_CLIC, ventana, BLANCO, GRIS, VALOR_BORDER_RADIUS,fuente_texto, NEGRO)
-                    tablero_lleno = generar_tablero()
-                    sudoku = jugar(tablero_lleno, dificultad,ventana,tablero_lleno, celda_seleccionada, matriz_booleana, fuente_numeros, 
-                                    temporizador, contador_errores, fuente_texto, BLANCO, FONDO_JUEGO, TABLERO_ANCHO, TABLERO_ALTO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, 
+                    sesion = jugar(dificultad,ventana, fuente_numeros, fuente_texto, BLANCO, cargar_fondo(RUTA_FONDO_JUEGO), TABLERO_ANCHO, TABLERO_ALTO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, 
                                         AMARILLO_CLARO, GRIS_OSCURO, ROSA, ROSA_CLARO, tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, VALOR_BORDER_RADIUS,AMARILLO_OSCURO)
-                    matriz_booleana = generar_matriz_booleana(sudoku)
 
-                elif evento_click(565, 400, 150, 50):  # Botón "Salir"
+                elif evento_click(565, 400, 150, 50):  # Botón de tamaño del tablero (9x9, 16x16, 25x25)
+                    TAMANIO_TABLERO = cambiar_tamanio(TAMANIO_TABLERO)
+                    tamanio_celda = TABLERO_ANCHO // TAMANIO_TABLERO
+                    fuente_numeros = FUENTES_NUMEROS[TAMANIO_TABLERO]
+
+                elif evento_click(565, 460, 150, 50):  # Botón "Salir"
                     salir()
             elif pantalla_actual == "juego": 
                 x, y = pygame.mouse.get_pos()
-                if MARGEN_IZQUIERDO <= x <= MARGEN_IZQUIERDO + TABLERO_ANCHO and MARGEN_SUPERIOR <= y <= MARGEN_SUPERIOR + TABLERO_ALTO: #Mouse adentro del tablero
+                if MARGEN_IZQUIERDO <= x < MARGEN_IZQUIERDO + TAMANIO_TABLERO * tamanio_celda and MARGEN_SUPERIOR <= y < MARGEN_SUPERIOR + TAMANIO_TABLERO * tamanio_celda: #Mouse adentro del tablero
                     col = (x - MARGEN_IZQUIERDO) // tamanio_celda
                     fila = (y - MARGEN_SUPERIOR) // tamanio_celda
-                    celda_seleccionada = (fila, col) # Genera tupla de la celda seleccionada a partir de las coordenada del get_pos
+                    sesion.seleccionar(fila, col) # Selecciona la celda a partir de las coordenadas del get_pos
 
                 elif evento_click(1060, 530, 170, 60): #Botón "Reiniciar"
-                    tablero_lleno = generar_tablero()
-                    sudoku = jugar(tablero_lleno, dificultad,ventana,tablero_lleno, celda_seleccionada, matriz_booleana, fuente_numeros, 
-                                    temporizador, contador_errores, fuente_texto, BLANCO, FONDO_JUEGO, TABLERO_ANCHO, TABLERO_ALTO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, 
-                                    AMARILLO_CLARO, GRIS_OSCURO, ROSA, ROSA_CLARO, tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, VALOR_BORDER_RADIUS,AMARILLO_OSCURO)
-                    matriz_booleana = generar_matriz_booleana(sudoku)
-                    contador_errores = 0 # Reinicia contador de errores
-                    temporizador = 0 # Reincia temporizador
+                    sesion = jugar(dificultad,ventana, fuente_numeros, fuente_texto, BLANCO, cargar_fondo(RUTA_FONDO_JUEGO), TABLERO_ANCHO, TABLERO_ALTO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, 
+                                    AMARILLO_CLARO, GRIS_OSCURO, ROSA, ROSA_CLARO, tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, VALOR_BORDER_RADIUS,AMARILLO_OSCURO) # Errores y tiempo en 0
 
                 elif evento_click(1060, 600, 170, 60):  # Botón "Volver" dentro de la pantalla juego
                     pantalla_actual = "menu"
 
                 else:
-                    celda_seleccionada = None #Si hace click en un lugar que no sea una celda o botón, saca el click de la celda o no marca nada.
+                    sesion.seleccionar() #Si hace click en un lugar que no sea una celda o botón, saca el click de la celda o no marca nada.
 
             elif pantalla_actual == "puntajes":
 
@@ -74,13 +84,10 @@ while corriendo:
             
     # Actualizar la pantalla según el estado
     if pantalla_actual == "menu":
-        mostrar_menu_principal(ventana, dificultad, FONDO, NEGRO, fuente_texto,AMARILLO_CLARO, VALOR_BORDER_RADIUS, AMARILLO_OSCURO,BLANCO)
-        contador_errores = 0 #para que funcione el pop up de errores
+        mostrar_menu_principal(ventana, dificultad, cargar_fondo(RUTA_FONDO), NEGRO, fuente_texto,AMARILLO_CLARO, VALOR_BORDER_RADIUS, AMARILLO_OSCURO,BLANCO, TAMANIO_TABLERO)
     elif pantalla_actual == "juego":
-        if contador_errores == None:
-            contador_errores = 0
-        contador_errores, cambio_anterior = sumar_errores(celda_seleccionada, sudoku, tablero_lleno, contador_errores, cambio_anterior, matriz_booleana)
-        if contador_errores > 3 and not mostrar_popup: #porque sino se repite en el bucle muchas veces el pop up
+        manejar_entrada(sesion) # Números y DELETE en la celda seleccionada; la sesión cuenta los errores
+        if sesion.perdida() and not mostrar_popup: #porque sino se repite en el bucle muchas veces el pop up
             mostrar_popup = True
             tiempo_inicio_popup = pygame.time.get_ticks()
     # Si hay un pop-up activo, dibujarlo
@@ -92,12 +99,13 @@ while corriendo:
                 pantalla_actual = "menu"  # Cambiar al menú principal
                 mostrar_popup = False
         else:
-            mostrar_pantalla_juego(sudoku, ventana, tablero_lleno, celda_seleccionada, matriz_booleana, fuente_numeros, temporizador, contador_errores, fuente_texto, BLANCO,
-                            FONDO_JUEGO, TABLERO_ANCHO, TABLERO_ALTO, MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, AMARILLO_CLARO, GRIS_OSCURO,
-                            ROSA, ROSA_CLARO, tamanio_celda, TAMANIO_TABLERO, NEGRO, ROJO, AZUL, VALOR_BORDER_RADIUS, AMARILLO_OSCURO)
-            minutos = mostrar_temporizador(temporizador, ventana,fuente_texto, NEGRO)  # Mostrar el temporizador solo en la pantalla del juego
-        if sudoku == tablero_lleno:
-            puntaje_jugador = calcular_puntaje(dificultad, PUNTOS_BASE, contador_errores, PENALIZACION_ERROR, minutos, PENALIZACION_TIEMPO)
+            # Solo se redibujan y se actualizan las celdas, textos y botones que cambiaron desde el cuadro anterior
+            pantalla_juego.dibujar(ventana, sesion, fuente_numeros, fuente_texto, BLANCO, cargar_fondo(RUTA_FONDO_JUEGO), TABLERO_ANCHO, TABLERO_ALTO,
+                            MARGEN_IZQUIERDO, MARGEN_SUPERIOR, CELESTE, AMARILLO_CLARO, GRIS_OSCURO, ROSA, ROSA_CLARO, tamanio_celda,
+                            TAMANIO_TABLERO, NEGRO, ROJO, AZUL, VALOR_BORDER_RADIUS, AMARILLO_OSCURO,
+                            fuente_marcas if mostrar_marcas else None)
+        if sesion.ganada():  # O(1): el Tablero lleva la cuenta de celdas correctas
+            puntaje_jugador = sesion.puntaje()
             pantalla_actual = "ganaste"  # Cambiar al estado de ganaste
     elif pantalla_actual == "ganaste":
     # Mostrar pop-up para ingresar el nombre
@@ -105,8 +113,9 @@ while corriendo:
             pantalla_actual = "puntajes"  # Cambiar al estado de puntajes
 
     elif pantalla_actual == "puntajes":
-        ver_puntajes(ventana, fuente_texto, FONDO_PANTALLA_GANADORES, NEGRO, AZUL_CLARO, VALOR_BORDER_RADIUS, AMARILLO_OSCURO, "nombre_ganadores.json", BLANCO)
+        ver_puntajes(ventana, fuente_texto, cargar_fondo(RUTA_FONDO_PANTALLA_GANADORES), NEGRO, AZUL_CLARO, VALOR_BORDER_RADIUS, AMARILLO_OSCURO, "nombre_ganadores.json", BLANCO)
 
-    pygame.display.update()
+    # Cada pantalla ya actualiza lo que dibujó; acá solo se limita la velocidad del bucle
+    reloj.tick(FPS_MAXIMOS)
 
 pygame.quit()
\ No newline at end of file
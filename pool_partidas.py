@@ -0,0 +1,295 @@
+import threading
+from collections import deque
+from logica_sodoku import *
+from banco_binario import *
+from calificador import *
+
+# ==============================
+# Pool de partidas pre-generadas
+# ==============================
+#
+# Un hilo en segundo plano mantiene, para cada dificultad y tamaño de tablero, algunas partidas
+# (tablero_lleno, sudoku) ya generadas. Los botones del juego solo tienen que sacar una del pool, sin
+# esperar a generar_tablero ni a generar_sudoku dentro del bucle de eventos. Si un pool se vacía
+# (por ejemplo, con varios clics seguidos en "Reiniciar"), el hilo lo rellena antes que los demás.
+
+DIFICULTADES = ("Facil", "Medio", "Dificil")
+TAMANIO_POOL = 3  # Partidas listas que se intentan mantener por dificultad y tamaño
+ESPERA_POOL_MS = 15  # Lo que obtener_partida espera al hilo si el pool está vacío, antes de generar una partida rápida
+CAPACIDAD_FILTRO = 10000  # Partidas recientes que se recuerdan para no repetirlas (ver FiltroRepetidos)
+INTENTOS_SIN_REPETIR = 5  # Veces que se vuelve a generar (o a sacar del banco) una partida repetida antes de aceptarla
+
+# Los pools se identifican con (dificultad, lado); los de 9x9 van primero, así el hilo los llena antes
+partidas_listas = {(dificultad, lado): deque() for lado in TAMANIOS_VALIDOS for dificultad in DIFICULTADES}
+metricas = {clave: {"aciertos": 0, "fallos": 0, "generadas": 0, "repetidas": 0} for clave in partidas_listas}
+pedidas = deque()  # Pools que obtener_partida encontró vacíos, en orden: el hilo los rellena primero
+en_curso = None  # Pool para el que el hilo está generando una partida en este momento
+condicion_pool = threading.Condition()  # Protege partidas_listas, metricas y pedidas; despierta al hilo y a obtener_partida
+hilo_pool = None
+error_pool_reportado = False  # El primer error del hilo se muestra; los siguientes no, para no llenar la consola
+banco_activo = None  # Banco binario (ver banco_binario) del que se sacan partidas en lugar de generarlas
+generador_banco = random.Random()  # Elige las partidas del banco sin tocar el estado del módulo random
+
+
+class FiltroRepetidos:
+    """
+    Conjunto acotado de claves (hash_canonico de las partidas ya entregadas): cuando se llena, olvida
+    la clave más vieja. Sirve para no entregar dos veces la misma partida, ni una equivalente por simetría.
+
+    Atributos:
+        capacidad (int): Cantidad máxima de claves que se recuerdan.
+        claves (set): Las claves recordadas.
+        orden (deque): Las mismas claves en el orden en que se agregaron.
+    """
+    __slots__ = ("capacidad", "claves", "orden")
+
+    def __init__(self, capacidad:int = CAPACIDAD_FILTRO) -> None:
+        self.capacidad = capacidad
+        self.claves = set()
+        self.orden = deque()
+
+    def agregar(self, clave:int) -> bool:
+        """
+        Agrega una clave.
+
+        Retorno:
+            bool: True si la clave era nueva, False si ya estaba (la partida es repetida).
+        """
+        nueva = clave not in self.claves
+        if nueva:
+            self.claves.add(clave)
+            self.orden.append(clave)
+            if len(self.orden) > self.capacidad:
+                self.claves.discard(self.orden.popleft())
+        return nueva
+
+    def __contains__(self, clave:int) -> bool:
+        return clave in self.claves
+
+    def __len__(self) -> int:
+        return len(self.orden)
+
+
+partidas_vistas = FiltroRepetidos()  # Se usa con condicion_pool tomada
+
+
+def generar_partida_completa(dificultad:str, semilla:int = None, lado:int = 9,
+                             presupuesto_ms:float = None) -> tuple[list[list], list[list]]:
+    """
+    Genera una partida nueva: el tablero resuelto y el sudoku con celdas vacías (con solución única
+    y con la dificultad medida por técnicas, ver calificador.generar_sudoku_calificado).
+    Si hay un banco activo (ver usar_banco) con partidas de esa dificultad, la saca del banco al azar.
+
+    Recibe:
+        dificultad (str): "Facil", "Medio" o "Dificil".
+        semilla (int): Si se indica, la partida se genera con calificador.generar_partida, que usa su
+                       propio random.Random: la misma semilla siempre da la misma partida y no se
+                       altera el estado del módulo random que usa el resto del juego.
+        lado (int): Tamaño del tablero: 9, 16 o 25. Los de 16x16 y 25x25 no se califican por técnicas ni
+                    salen del banco (que es de 9x9): se generan con generar_tablero y generar_sudoku.
+        presupuesto_ms (float): Límite de tiempo de generar_sudoku_calificado (None = sin límite). Con
+                                límite la partida puede quedar más fácil que la dificultad pedida.
+
+    Sin semilla, las partidas de 9x9 pasan por el filtro de repetidas (ver registrar_partida): si sale
+    una partida ya entregada, o equivalente por simetría a una ya entregada, se busca otra (hasta
+    INTENTOS_SIN_REPETIR veces, por si el banco tiene pocas partidas).
+
+    Retorno:
+        Una tupla (tablero_lleno, sudoku).
+    """
+    if semilla is not None:
+        tablero_lleno, sudoku = generar_partida(semilla, dificultad)
+    elif lado != 9:
+        tablero_lleno = generar_tablero(random, lado)
+        sudoku = generar_sudoku(tablero_lleno, dificultad, solucion_unica=True)
+    else:
+        repetida = True
+        intentos = 0
+        while repetida and intentos < INTENTOS_SIN_REPETIR:
+            if banco_activo is not None and cantidad_partidas(banco_activo, dificultad) > 0:
+                tablero_lleno, sudoku = partida_aleatoria(banco_activo, dificultad, generador_banco)
+            else:
+                tablero_lleno = generar_tablero()
+                sudoku = generar_sudoku_calificado(tablero_lleno, dificultad, presupuesto_ms=presupuesto_ms)
+            repetida = not registrar_partida(tablero_lleno, sudoku, dificultad)
+            intentos += 1
+    return tablero_lleno, sudoku
+
+
+def registrar_partida(tablero_lleno:list[list], sudoku:list[list], dificultad:str) -> bool:
+    """
+    Anota una partida en el filtro de repetidas, usando el hash de su forma canónica (ver hash_canonico).
+
+    Recibe:
+        tablero_lleno (list[list]): Solución de la partida (9x9).
+        sudoku (list[list]): Sudoku con celdas vacías.
+        dificultad (str): Dificultad de la partida (para las métricas).
+
+    Retorno:
+        bool: True si la partida es nueva, False si ya se había entregado (ella o una equivalente).
+    """
+    clave = hash_canonico(sudoku, tablero_lleno)
+    with condicion_pool:
+        nueva = partidas_vistas.agregar(clave)
+        if not nueva:
+            metricas[(dificultad, 9)]["repetidas"] += 1
+    return nueva
+
+
+def usar_banco(ruta:str, opcional:bool = False) -> bool:
+    """
+    Activa un banco binario para que las partidas se saquen de ahí en lugar de generarse en el momento.
+    Si el banco no se puede abrir, las partidas se siguen generando; un banco inválido (ver abrir_banco)
+    siempre se informa, y uno que no existe solo si no es opcional.
+
+    Recibe:
+        ruta (str): Archivo del banco generado con generar_banco.py --binario.
+        opcional (bool): True si el banco puede no existir (por ejemplo, el que se busca al iniciar el juego).
+
+    Retorno:
+        bool: True si el banco se pudo abrir.
+    """
+    global banco_activo
+    resultado = False
+    try:
+        banco_activo = abrir_banco(ruta)
+        resultado = True
+    except FileNotFoundError:
+        if not opcional:
+            print(f"El banco {ruta} no existe, las partidas se generan en el momento.")
+    except ValueError as error:
+        print(error)
+    return resultado
+
+
+def pool_a_rellenar() -> tuple:
+    """
+    Elige el próximo pool a rellenar: primero los que obtener_partida encontró vacíos (ver pedidas),
+    en el orden en que se pidieron; si no hay, el que tiene menos partidas listas y todavía no llegó a
+    TAMANIO_POOL. Se debe llamar con condicion_pool tomada.
+
+    Retorno:
+        El pool a rellenar como (dificultad, lado), o None si todos están llenos.
+    """
+    while pedidas and partidas_listas[pedidas[0]]:
+        pedidas.popleft()  # Ya tiene una partida para el próximo pedido
+    elegido = pedidas[0] if pedidas else None
+    if elegido is None:
+        for clave in partidas_listas:
+            cantidad = len(partidas_listas[clave])
+            if cantidad < TAMANIO_POOL and (elegido is None or cantidad < len(partidas_listas[elegido])):
+                elegido = clave
+    return elegido
+
+
+def rellenar_pool() -> None:
+    """
+    Bucle del hilo en segundo plano: genera partidas mientras falten y duerme cuando los pools están llenos.
+    La generación se hace fuera del lock para que obtener_partida nunca tenga que esperarla. Cada partida
+    nueva se avisa con notify_all, por si obtener_partida está esperando justo esa.
+
+    Si generar una partida falla (por ejemplo, un registro corrupto del banco hace que partida_aleatoria
+    lance ValueError), el error se informa una vez, se deja de usar el banco y el hilo sigue generando
+    las partidas en el momento, en lugar de morir sin aviso.
+    """
+    global banco_activo, error_pool_reportado, en_curso
+    while True:
+        with condicion_pool:
+            en_curso = None
+            clave = pool_a_rellenar()
+            while clave is None:
+                condicion_pool.wait()
+                clave = pool_a_rellenar()
+            en_curso = clave
+
+        dificultad, lado = clave
+        try:
+            partida = generar_partida_completa(dificultad, lado=lado)
+        except Exception as error:
+            partida = None
+            if not error_pool_reportado:
+                print(f"Error al generar una partida {dificultad} para el pool: {error!r}. Se siguen generando sin el banco.")
+                error_pool_reportado = True
+            with condicion_pool:
+                banco_activo = None  # La próxima vuelta genera la partida en el momento
+
+        if partida is not None:
+            with condicion_pool:
+                partidas_listas[clave].append(partida)
+                metricas[clave]["generadas"] += 1
+                condicion_pool.notify_all()
+
+
+def iniciar_pool() -> None:
+    """
+    Inicia el hilo que rellena el pool, si todavía no está corriendo (la primera vez, o de nuevo si
+    el hilo terminó por un error). El hilo es daemon, así que no impide que el programa termine al cerrar el juego.
+    """
+    global hilo_pool
+    if hilo_pool is None or not hilo_pool.is_alive():
+        hilo_pool = threading.Thread(target=rellenar_pool, name="pool_partidas", daemon=True)
+        hilo_pool.start()
+
+
+def obtener_partida(dificultad:str, lado:int = 9) -> tuple[list[list], list[list]]:
+    """
+    Devuelve una partida lista de la dificultad y el tamaño pedidos y avisa al hilo para que genere otra.
+
+    Si ese pool está vacío, lo pone primero en la cola del hilo y, si el hilo ya está generando una
+    partida para ese pool, espera como mucho ESPERA_POOL_MS a que termine. Si no llega, la genera en el
+    momento con generar_partida_completa (que pasa por el filtro de repetidas) y un presupuesto de
+    PRESUPUESTO_GENERACION_MS: unos 12 ms, o hasta unos 40 ms si el hilo está generando al mismo tiempo
+    (comparten el GIL), en lugar de los 45 ms de media de una partida Dificil calificada sin límite. Esa
+    partida puede ser más fácil que la dificultad pedida. Los tableros de 16x16 y 25x25 no tienen
+    presupuesto: generarlos tarda entre 1 y 6 ms (16x16) y entre 2 y 20 ms (25x25). Con el pool, todo
+    esto solo pasa si se piden partidas más rápido de lo que el hilo las genera.
+    (No se deriva una variante por simetría de la última partida: sería la misma partida con otros números.)
+
+    Recibe:
+        dificultad (str): "Facil", "Medio" o "Dificil".
+        lado (int): Tamaño del tablero: 9, 16 o 25.
+
+    Retorno:
+        Una tupla (tablero_lleno, sudoku).
+    """
+    if hilo_pool is not None and not hilo_pool.is_alive():  # Si el hilo se había iniciado y terminó, se vuelve a iniciar
+        iniciar_pool()
+
+    clave = (dificultad, lado)
+    with condicion_pool:
+        listas = partidas_listas[clave]
+        if not listas and hilo_pool is not None:
+            if clave not in pedidas:
+                pedidas.append(clave)
+            condicion_pool.notify_all()
+            if en_curso == clave:  # Si el hilo está generando otro pool, esperarlo no sirve
+                condicion_pool.wait_for(lambda: listas, ESPERA_POOL_MS / 1000)
+        if listas:
+            partida = listas.popleft()
+            metricas[clave]["aciertos"] += 1
+        else:
+            partida = None
+            metricas[clave]["fallos"] += 1
+        condicion_pool.notify_all()
+
+    if partida is None:
+        partida = generar_partida_completa(dificultad, lado=lado, presupuesto_ms=PRESUPUESTO_GENERACION_MS)
+
+    return partida
+
+
+def metricas_pool() -> dict:
+    """
+    Devuelve una copia de las métricas de cada pool.
+
+    Retorno:
+        Un diccionario {(dificultad, lado): {"profundidad", "aciertos", "fallos", "generadas", "repetidas"}},
+        donde profundidad es la cantidad de partidas listas en este momento, fallos cuántas partidas
+        se tuvieron que generar en el momento y repetidas cuántas partidas descartó el filtro.
+    """
+    with condicion_pool:
+        resultado = {}
+        for clave in partidas_listas:
+            resultado[clave] = dict(metricas[clave])
+            resultado[clave]["profundidad"] = len(partidas_listas[clave])
+    return resultado
@@ -0,0 +1,48 @@
+import pygame
+from functools import lru_cache
+
+# ==============================
+# Carga de imágenes
+# ==============================
+#
+# Las imágenes se cargan recién la primera vez que se usan (la pantalla de puntajes no se carga si nadie
+# la abre), se convierten al formato de la ventana y se guardan. Un JPEG recién cargado tiene 24 bits
+# por pixel y la ventana 32: sin convert(), cada blit de un fondo convierte los 921.600 píxeles de nuevo.
+
+@lru_cache(maxsize=None)
+def cargar_imagen(ruta:str, tamanio:tuple = None) -> pygame.Surface:
+    '''
+    Carga una imagen una sola vez, la escala si hace falta y la convierte al formato de la ventana
+    (con convert_alpha si tiene transparencia). Las siguientes llamadas devuelven la misma superficie.
+
+    Necesita que la ventana ya esté creada (pygame.display.set_mode).
+
+    Parámetros:
+    ruta (str): Ruta del archivo de imagen.
+    tamanio (tuple): (ancho, alto) al que se escala la imagen, o None para dejarla como está.
+
+    Devuelve:
+    pygame.Surface: La imagen lista para dibujar (no se debe modificar: es compartida).
+    '''
+    imagen = pygame.image.load(ruta)
+    if tamanio is not None and imagen.get_size() != tamanio:
+        imagen = pygame.transform.smoothscale(imagen, tamanio)
+    if imagen.get_flags() & pygame.SRCALPHA:
+        imagen = imagen.convert_alpha()
+    else:
+        imagen = imagen.convert()
+    return imagen
+
+
+def cargar_fondo(ruta:str) -> pygame.Surface:
+    '''
+    Devuelve una imagen de fondo escalada al tamaño de la ventana (ver cargar_imagen). Se puede llamar
+    en cada cuadro: después de la primera vez es solo buscarla en la caché.
+
+    Parámetros:
+    ruta (str): Ruta del archivo de imagen.
+
+    Devuelve:
+    pygame.Surface: El fondo del tamaño de la ventana.
+    '''
+    return cargar_imagen(ruta, pygame.display.get_surface().get_size())
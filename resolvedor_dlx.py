@@ -0,0 +1,305 @@
+# ==============================
+# Resolvedor de Sudoku con Dancing Links (Algoritmo X de Knuth)
+# ==============================
+#
+# El Sudoku se representa como un problema de cobertura exacta:
+#   - 729 filas: una por cada candidato (fila, columna, número).
+#   - 324 columnas (restricciones): cada celda tiene un número, cada fila, columna y bloque
+#     tiene cada número exactamente una vez.
+# Cada candidato cubre exactamente 4 restricciones. La matriz se guarda como listas doblemente
+# enlazadas en arreglos (izquierda, derecha, arriba, abajo) para poder "cubrir" y "descubrir"
+# columnas en O(1) por nodo durante el backtracking.
+
+CANTIDAD_RESTRICCIONES = 324
+RAIZ = 0  # Nodo cabecera de la lista de columnas
+
+
+def construir_plantilla() -> tuple:
+    """
+    Construye la matriz de cobertura exacta vacía (sin números dados). Se llama una sola vez
+    al importar el módulo; cada búsqueda trabaja sobre una copia.
+
+    Retorno:
+        Una tupla (izquierda, derecha, arriba, abajo, columna, tamanio, candidato) con los arreglos de nodos.
+        Los nodos 1 a 324 son las cabeceras de columna; desde el 325 están los nodos de los candidatos.
+    """
+    total_nodos = 1 + CANTIDAD_RESTRICCIONES + 729 * 4
+    izquierda = [0] * total_nodos
+    derecha = [0] * total_nodos
+    arriba = list(range(total_nodos))
+    abajo = list(range(total_nodos))
+    columna = [0] * total_nodos
+    tamanio = [0] * (CANTIDAD_RESTRICCIONES + 1)
+    candidato = [-1] * total_nodos
+
+    # Encadena la raíz con las cabeceras de columna en una lista circular
+    for i in range(CANTIDAD_RESTRICCIONES + 1):
+        izquierda[i] = i - 1 if i > 0 else CANTIDAD_RESTRICCIONES
+        derecha[i] = i + 1 if i < CANTIDAD_RESTRICCIONES else 0
+        columna[i] = i
+
+    nodo = CANTIDAD_RESTRICCIONES + 1
+    for fila in range(9):
+        for col in range(9):
+            bloque = (fila // 3) * 3 + col // 3
+            for num in range(9):
+                id_candidato = (fila * 9 + col) * 9 + num
+                restricciones = (1 + fila * 9 + col,
+                                 1 + 81 + fila * 9 + num,
+                                 1 + 162 + col * 9 + num,
+                                 1 + 243 + bloque * 9 + num)
+                primero = nodo
+                for cabecera in restricciones:
+                    # Agrega el nodo al final de la columna
+                    columna[nodo] = cabecera
+                    candidato[nodo] = id_candidato
+                    arriba[nodo] = arriba[cabecera]
+                    abajo[nodo] = cabecera
+                    abajo[arriba[cabecera]] = nodo
+                    arriba[cabecera] = nodo
+                    tamanio[cabecera] += 1
+                    # Lo encadena con los otros nodos del mismo candidato
+                    izquierda[nodo] = nodo - 1
+                    derecha[nodo] = nodo + 1
+                    nodo += 1
+                izquierda[primero] = nodo - 1
+                derecha[nodo - 1] = primero
+
+    return izquierda, derecha, arriba, abajo, columna, tamanio, candidato
+
+
+PLANTILLA = construir_plantilla()
+
+# Primer nodo de cada candidato, para poder seleccionar los números dados sin buscarlos
+PRIMER_NODO = [CANTIDAD_RESTRICCIONES + 1 + i * 4 for i in range(729)]
+
+
+def cubrir(matriz:tuple, c:int) -> None:
+    """
+    Quita la columna c de la lista de cabeceras y todas las filas que la usan de las demás columnas.
+
+    Recibe:
+        matriz: La tupla de arreglos de la matriz enlazada.
+        c: La cabecera de la columna a cubrir.
+    """
+    izquierda, derecha, arriba, abajo, columna, tamanio, _ = matriz
+    derecha[izquierda[c]] = derecha[c]
+    izquierda[derecha[c]] = izquierda[c]
+    i = abajo[c]
+    while i != c:
+        j = derecha[i]
+        while j != i:
+            abajo[arriba[j]] = abajo[j]
+            arriba[abajo[j]] = arriba[j]
+            tamanio[columna[j]] -= 1
+            j = derecha[j]
+        i = abajo[i]
+
+
+def descubrir(matriz:tuple, c:int) -> None:
+    """
+    Deshace cubrir(matriz, c), restaurando los enlaces en el orden inverso.
+
+    Recibe:
+        matriz: La tupla de arreglos de la matriz enlazada.
+        c: La cabecera de la columna a descubrir.
+    """
+    izquierda, derecha, arriba, abajo, columna, tamanio, _ = matriz
+    i = arriba[c]
+    while i != c:
+        j = izquierda[i]
+        while j != i:
+            tamanio[columna[j]] += 1
+            abajo[arriba[j]] = j
+            arriba[abajo[j]] = j
+            j = izquierda[j]
+        i = arriba[i]
+    derecha[izquierda[c]] = c
+    izquierda[derecha[c]] = c
+
+
+def preparar_matriz(tablero:list[list]):
+    """
+    Copia la plantilla y selecciona los candidatos correspondientes a los números dados del tablero.
+
+    Recibe:
+        tablero: La matriz 9x9 del sudoku (0 = celda vacía).
+
+    Retorno:
+        Una tupla (matriz, elegidos) con la matriz lista para buscar y la lista de candidatos ya elegidos,
+        o None si los números dados se contradicen entre sí.
+    """
+    izquierda, derecha, arriba, abajo, columna, tamanio, candidato = PLANTILLA
+    # Solo se copian los arreglos que la búsqueda modifica; columna y candidato se comparten
+    matriz = (izquierda[:], derecha[:], arriba[:], abajo[:], columna, tamanio[:], candidato)
+    derecha, columna = matriz[1], matriz[4]
+    cubiertas = [False] * (CANTIDAD_RESTRICCIONES + 1)
+    elegidos = []
+    valido = True
+
+    for fila in range(9):
+        for col in range(9):
+            num = tablero[fila][col]
+            if num != 0 and valido:
+                id_candidato = (fila * 9 + col) * 9 + num - 1
+                nodo = PRIMER_NODO[id_candidato]
+                for _ in range(4):
+                    if cubiertas[columna[nodo]]:
+                        valido = False  # Dos números dados usan la misma restricción
+                    nodo = derecha[nodo]
+                if valido:
+                    for _ in range(4):
+                        cubiertas[columna[nodo]] = True
+                        cubrir(matriz, columna[nodo])
+                        nodo = derecha[nodo]
+                    elegidos.append(id_candidato)
+
+    resultado = None
+    if valido:
+        resultado = (matriz, elegidos)
+    return resultado
+
+
+def buscar(matriz:tuple, elegidos:list):
+    """
+    Algoritmo X: genera (de a una, a medida que se piden) todas las coberturas exactas.
+    En cada paso elige la columna con menos nodos, como propone Knuth.
+    Las operaciones de cubrir/descubrir están escritas en línea (ver cubrir y descubrir)
+    porque son el 90% del tiempo de búsqueda y así se evita una llamada por columna.
+
+    Recibe:
+        matriz: La matriz enlazada preparada con preparar_matriz.
+        elegidos: Lista de candidatos elegidos hasta el momento (se modifica y se restaura).
+
+    Devuelve (generador):
+        La lista `elegidos` cada vez que se completa una solución.
+    """
+    izquierda, derecha, arriba, abajo, columna, tamanio, candidato = matriz
+
+    if derecha[RAIZ] == RAIZ:
+        yield elegidos
+    else:
+        # Elige la columna con menos candidatos
+        c = derecha[RAIZ]
+        mejor = c
+        menor = tamanio[c]
+        while c != RAIZ and menor > 1:
+            if tamanio[c] < menor:
+                mejor = c
+                menor = tamanio[c]
+            c = derecha[c]
+
+        if menor > 0:
+            cubrir(matriz, mejor)
+            r = abajo[mejor]
+            while r != mejor:
+                elegidos.append(candidato[r])
+                # Cubre las otras columnas del candidato r
+                j = derecha[r]
+                while j != r:
+                    c = columna[j]
+                    derecha[izquierda[c]] = derecha[c]
+                    izquierda[derecha[c]] = izquierda[c]
+                    i = abajo[c]
+                    while i != c:
+                        k = derecha[i]
+                        while k != i:
+                            abajo[arriba[k]] = abajo[k]
+                            arriba[abajo[k]] = arriba[k]
+                            tamanio[columna[k]] -= 1
+                            k = derecha[k]
+                        i = abajo[i]
+                    j = derecha[j]
+
+                yield from buscar(matriz, elegidos)
+
+                # Descubre las columnas en orden inverso
+                j = izquierda[r]
+                while j != r:
+                    c = columna[j]
+                    i = arriba[c]
+                    while i != c:
+                        k = izquierda[i]
+                        while k != i:
+                            tamanio[columna[k]] += 1
+                            abajo[arriba[k]] = k
+                            arriba[abajo[k]] = k
+                            k = izquierda[k]
+                        i = arriba[i]
+                    derecha[izquierda[c]] = c
+                    izquierda[derecha[c]] = c
+                    j = izquierda[j]
+                elegidos.pop()
+                r = abajo[r]
+            descubrir(matriz, mejor)
+
+
+def candidatos_a_tablero(elegidos:list) -> list[list]:
+    """
+    Convierte una lista de 81 candidatos elegidos en una matriz 9x9.
+
+    Recibe:
+        elegidos: Los identificadores de candidato ((fila * 9 + col) * 9 + num - 1) de una solución.
+
+    Retorno:
+        La matriz 9x9 resuelta.
+    """
+    tablero = [[0] * 9 for _ in range(9)]
+    for id_candidato in elegidos:
+        celda, num = divmod(id_candidato, 9)
+        tablero[celda // 9][celda % 9] = num + 1
+    return tablero
+
+
+def enumerar_soluciones(tablero:list[list]):
+    """
+    Genera las soluciones de un sudoku de a una (de forma perezosa), sin modificar el tablero recibido.
+
+    Recibe:
+        tablero: La matriz 9x9 del sudoku (0 = celda vacía).
+
+    Devuelve (generador):
+        Cada solución como una nueva matriz 9x9.
+    """
+    preparado = preparar_matriz(tablero)
+    if preparado is not None:
+        matriz, elegidos = preparado
+        for solucion in buscar(matriz, elegidos):
+            yield candidatos_a_tablero(solucion)
+
+
+def resolver(tablero:list[list]) -> list[list]:
+    """
+    Resuelve un sudoku usando Dancing Links.
+
+    Recibe:
+        tablero: La matriz 9x9 del sudoku (0 = celda vacía).
+
+    Retorno:
+        La matriz 9x9 resuelta (la primera solución encontrada).
+        Si el sudoku no tiene solución, devuelve una matriz vacía.
+    """
+    return next(enumerar_soluciones(tablero), [])
+
+
+def contar_soluciones(tablero:list[list], limite:int = 2) -> int:
+    """
+    Cuenta las soluciones de un sudoku, deteniéndose al llegar a `limite`.
+    Con limite=2 alcanza para saber si la solución es única (devuelve 1) o no (devuelve 2).
+
+    Recibe:
+        tablero: La matriz 9x9 del sudoku (0 = celda vacía).
+        limite: Cantidad de soluciones a partir de la cual se deja de buscar.
+
+    Retorno:
+        La cantidad de soluciones encontradas (como máximo `limite`).
+    """
+    soluciones = 0
+    preparado = preparar_matriz(tablero)
+    if preparado is not None:
+        matriz, elegidos = preparado
+        for _ in buscar(matriz, elegidos):
+            soluciones += 1
+            if soluciones >= limite:
+                break
+    return soluciones
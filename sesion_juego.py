@@ -0,0 +1,231 @@
+from logica_sodoku import *
+from calificador import *
+from pool_partidas import *
+
+# ==============================
+# Sesión de juego (sin pygame)
+# ==============================
+#
+# Todo el estado de una partida (tablero, celdas fijas, errores, tiempo, dificultad y puntaje) vive en
+# un objeto SesionJuego. Este módulo no importa pygame: la interfaz (biblioteca y main) traduce clics
+# y teclas en llamadas a seleccionar, colocar y borrar, y dibuja lo que hay en la sesión. Así se pueden
+# simular y medir miles de partidas por segundo sin abrir una ventana (ver benchmark.benchmark_sesiones).
+
+PUNTOS_BASE = 1000
+PENALIZACION_ERROR = 100
+PENALIZACION_TIEMPO = 30
+ERRORES_PERMITIDOS = 3  # Con un error más que estos, la partida se pierde
+
+
+def calcular_puntaje(dificultad:str, PUNTOS_BASE:int, contador_errores:int, PENALIZACION_ERROR:int, minutos:int, PENALIZACION_TIEMPO:int) -> int:
+    '''
+    Calcula el puntaje dependiendo la cantidad de errores, el tiempo tardado y la dificultad seleccionada
+
+    Puntaje = (Puntos Base - (Errores x Penalización por Error) - (Tiempo Transcurrido en Minutos x Penalización por Tiempo)) x Dificultad
+    Puntaje = (Puntos Base - (Errores x Penalización por Error) - (Tiempo Transcurrido en Minutos x
+    Penalización por Tiempo)) x Dificultad
+    Parametros:
+    PUNTOS_BASE (int): Es el puntaje inicial que se le da al jugador al comenzar la partida. Por ej 1000 puntos.
+    contador_errores(int): Es la cantidad de errores cometidos por el jugador durante la partida.
+    PENALIZACION_ERROR(int): Un valor que se resta por cada error. Por ejemplo, 50 puntos por error.
+    minutos(int): Tiempo transcurrido entre el inicio y la finalización de la partida.
+    PENALIZACION_TIEMPO(int): Un valor que se resta por cada minuto. Por ejemplo, 10 puntos por minuto.
+    dificultad(str): Un multiplicador en función de la dificultad seleccionada.
+
+    Devuelve: El calculo mencionado en la documentación
+
+    '''
+
+    if dificultad == "Facil":
+        multiplicador_dificultad = 1
+    elif dificultad == "Medio":
+        multiplicador_dificultad = 1.5
+    else:
+        multiplicador_dificultad = 2
+
+
+
+    puntaje_final = (PUNTOS_BASE - (contador_errores * PENALIZACION_ERROR) - (minutos * PENALIZACION_TIEMPO)) * multiplicador_dificultad
+
+    if puntaje_final < 0:
+        puntaje_final = 0
+
+    return int(puntaje_final)
+
+
+class SesionJuego:
+    """
+    Una partida en curso: el sudoku que se está completando, su solución, la celda seleccionada,
+    los errores, el tiempo y la dificultad.
+
+    Atributos:
+        sudoku (Tablero): El tablero del jugador, con las celdas dadas marcadas como fijas y el historial y los conflictos activados.
+        solucion (Tablero): El tablero resuelto.
+        dificultad (str): "Facil", "Medio" o "Dificil".
+        errores (int): Cantidad de números equivocados que escribió el jugador.
+        segundos (int): Tiempo de juego en segundos (ver avanzar_reloj).
+        seleccionada (tuple): (fila, col) de la celda seleccionada, o None.
+    """
+    __slots__ = ("sudoku", "solucion", "dificultad", "errores", "segundos", "seleccionada")
+
+    def __init__(self, tablero_lleno, sudoku, dificultad:str, candidatos:bool = False) -> None:
+        """
+        Recibe:
+            tablero_lleno: La solución, como lista de listas o como Tablero.
+            sudoku: El sudoku con celdas vacías (0), como lista de listas o como Tablero; no se modifica.
+            dificultad (str): "Facil", "Medio" o "Dificil".
+            candidatos (bool): Si es True, se calculan los candidatos (marcas de lápiz) desde el principio.
+                               Si no, se calculan recién cuando se pide una pista.
+        """
+        if isinstance(tablero_lleno, Tablero):
+            tablero_lleno = tablero_lleno.a_matriz()
+        if isinstance(sudoku, Tablero):
+            sudoku = sudoku.a_matriz()
+        self.solucion = Tablero.desde_matriz(tablero_lleno)
+        self.sudoku = Tablero.desde_matriz(sudoku, marcar_fijas=True, solucion=self.solucion)
+        self.sudoku.activar_historial()
+        self.sudoku.activar_conflictos()  # Para resaltar los números repetidos sin recorrer el tablero
+        if candidatos:
+            self.sudoku.activar_candidatos()
+        self.dificultad = dificultad
+        self.errores = 0
+        self.segundos = 0
+        self.seleccionada = None
+
+    @classmethod
+    def nueva(cls, dificultad:str, lado:int = 9, semilla:int = None, candidatos:bool = False) -> "SesionJuego":
+        """
+        Empieza una partida nueva: la saca del pool (ver obtener_partida) o, si se indica una semilla,
+        la genera con calificador.generar_partida (siempre la misma para la misma semilla).
+
+        Recibe:
+            dificultad (str): "Facil", "Medio" o "Dificil".
+            lado (int): Tamaño del tablero: 9, 16 o 25 (las partidas con semilla son de 9x9).
+            semilla (int): Semilla de la partida, o None para una partida al azar.
+            candidatos (bool): Ver __init__.
+
+        Retorna:
+            SesionJuego: La sesión nueva, con los errores y el tiempo en 0.
+        """
+        if semilla is not None:
+            tablero_lleno, sudoku = generar_partida(semilla, dificultad)
+        else:
+            tablero_lleno, sudoku = obtener_partida(dificultad, lado)
+        return cls(tablero_lleno, sudoku, dificultad, candidatos)
+
+    def seleccionar(self, fila:int = None, col:int = None) -> tuple:
+        """
+        Selecciona una celda. Sin argumentos, o con una posición fuera del tablero, quita la selección.
+
+        Retorna:
+            tuple: La celda seleccionada (fila, col), o None.
+        """
+        lado = self.sudoku.lado
+        if fila is not None and col is not None and 0 <= fila < lado and 0 <= col < lado:
+            self.seleccionada = (fila, col)
+        else:
+            self.seleccionada = None
+        return self.seleccionada
+
+    def colocar(self, num:int, fila:int = None, col:int = None) -> bool:
+        """
+        Escribe un número en una celda (por defecto, en la seleccionada). Las celdas fijas no se
+        modifican. Si el número cambia y no coincide con la solución, se suma un error; volver a escribir
+        el mismo número (por ejemplo, mientras la tecla sigue apretada) no cuenta de nuevo.
+
+        Recibe:
+            num (int): Número del 1 al lado del tablero.
+            fila, col (int): Celda a modificar; si no se indican, se usa la seleccionada.
+
+        Retorna:
+            bool: True si la celda cambió.
+        """
+        cambio = False
+        if (fila is None or col is None) and self.seleccionada is not None:
+            fila, col = self.seleccionada
+        if fila is not None and col is not None and not self.sudoku.es_fija(fila, col) and self.sudoku[fila, col] != num:
+            self.sudoku[fila, col] = num
+            if num != 0 and num != self.solucion[fila, col]:
+                self.errores += 1
+            cambio = True
+        return cambio
+
+    def borrar(self, fila:int = None, col:int = None) -> bool:
+        """
+        Vacía una celda (por defecto, la seleccionada). Las celdas fijas no se modifican.
+
+        Retorna:
+            bool: True si la celda cambió.
+        """
+        return self.colocar(0, fila, col)
+
+    def pista(self) -> tuple:
+        """
+        Completa la próxima jugada forzada (ver Candidatos.pista) y selecciona esa celda.
+
+        Retorna:
+            tuple: (fila, col, num) de la pista, o None si no hay ninguna.
+        """
+        if self.sudoku.candidatos is None:
+            self.sudoku.activar_candidatos()
+        pista = self.sudoku.candidatos.pista()
+        if pista is not None:
+            fila, col, num = pista
+            self.seleccionada = (fila, col)
+            self.sudoku[fila, col] = num
+        return pista
+
+    def deshacer(self) -> tuple:
+        """
+        Deshace la última jugada y selecciona la celda que cambió (ver Tablero.deshacer).
+        Los errores no se descuentan.
+        """
+        celda = self.sudoku.deshacer()
+        if celda is not None:
+            self.seleccionada = celda
+        return celda
+
+    def rehacer(self) -> tuple:
+        """
+        Rehace la última jugada deshecha y selecciona la celda que cambió (ver Tablero.rehacer).
+        """
+        celda = self.sudoku.rehacer()
+        if celda is not None:
+            self.seleccionada = celda
+        return celda
+
+    def avanzar_reloj(self, segundos:int = 1) -> None:
+        """
+        Suma tiempo de juego (la interfaz lo llama una vez por segundo).
+        """
+        self.segundos += segundos
+
+    def minutos(self) -> int:
+        """
+        Devuelve los minutos completos de juego.
+        """
+        return self.segundos // 60
+
+    def ganada(self) -> bool:
+        """
+        Devuelve True si el sudoku está completo y correcto, en O(1).
+        """
+        return self.sudoku.resuelto()
+
+    def perdida(self) -> bool:
+        """
+        Devuelve True si el jugador superó los ERRORES_PERMITIDOS.
+        """
+        return self.errores > ERRORES_PERMITIDOS
+
+    def terminado(self) -> bool:
+        """
+        Devuelve True si la partida terminó, ganada o perdida.
+        """
+        return self.ganada() or self.perdida()
+
+    def puntaje(self) -> int:
+        """
+        Calcula el puntaje con los errores, los minutos y la dificultad de la sesión (ver calcular_puntaje).
+        """
+        return calcular_puntaje(self.dificultad, PUNTOS_BASE, self.errores, PENALIZACION_ERROR, self.minutos(), PENALIZACION_TIEMPO)
@@ -0,0 +1,228 @@
+import argparse
+import time
+import numpy as np
+from logica_sodoku import *
+from banco_binario import *
+
+# ==============================
+# Validación de muchos tableros a la vez (NumPy)
+# ==============================
+#
+# Uso:
+#   python validador_lote.py banco.bin            Audita todas las partidas de un banco binario
+#   python validador_lote.py --benchmark 1000000  Mide cuántos tableros por segundo se validan
+#
+# Los tableros se reciben como un arreglo (N, 9, 9) de enteros. Cada número se convierte en un bit
+# (1 << num, igual que las máscaras de logica_sodoku) y se hace un OR por fila, por columna y por
+# bloque para los N tableros a la vez. Una unidad no tiene repetidos si la cantidad de bits
+# encendidos del OR es igual a la cantidad de celdas no vacías; en un tablero lleno alcanza con
+# que el OR tenga los 9 bits. NumPy es necesario solo para este módulo; el juego no lo usa.
+
+TAMANIO_TANDA = 1 << 16  # Tableros que se procesan juntos, para no crear arreglos intermedios enormes
+BITS_ENCENDIDOS = np.array([bin(mascara).count("1") for mascara in range(1 << 10)], dtype=np.uint8)
+
+
+def reducir_unidades(celdas:np.ndarray, operacion:np.ufunc) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aplica una reducción (por ejemplo np.bitwise_or o np.add) a cada fila, columna y bloque.
+
+    Recibe:
+        celdas (np.ndarray): Arreglo (N, 9, 9).
+        operacion (np.ufunc): Operación con la que se reduce cada unidad.
+
+    Retorna:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: (filas, columnas, bloques), tres arreglos (N, 9).
+        Los bloques se numeran de izquierda a derecha y de arriba hacia abajo, como en inicializar_mascaras.
+    """
+    bandas = celdas.reshape(celdas.shape[0], 3, 3, 3, 3)  # (N, banda, fila, pila, col)
+    return (operacion.reduce(celdas, axis=2), operacion.reduce(celdas, axis=1),
+            operacion.reduce(bandas, axis=(2, 4)).reshape(celdas.shape[0], 9))
+
+
+def bits_de_celdas(tableros:np.ndarray) -> np.ndarray:
+    """
+    Convierte cada número en su bit (1 << num). Las celdas vacías y los valores fuera de 1..9
+    no encienden ningún bit.
+    """
+    valores = np.minimum(np.asarray(tableros).astype(np.uint16), 10)  # Negativos y mayores a 9 pasan a 10
+    return np.left_shift(np.uint16(1), valores) & np.uint16(TODOS_LOS_NUMEROS)
+
+
+def unidades_invalidas(tableros:np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Busca números repetidos (o fuera de rango) en cada fila, columna y bloque de cada tablero.
+    Las celdas en 0 se consideran vacías y no cuentan como repetidas.
+
+    Recibe:
+        tableros (np.ndarray): Arreglo (N, 9, 9) de enteros.
+
+    Retorna:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: (filas, columnas, bloques), tres arreglos (N, 9) de
+        bool con True en las unidades inválidas.
+    """
+    tableros = np.asarray(tableros)
+    ocupadas = (tableros != 0).view(np.uint8)  # Celdas no vacías, incluidas las que están fuera de rango
+    resultado = []
+    for mascara, cantidad in zip(reducir_unidades(bits_de_celdas(tableros), np.bitwise_or),
+                                 reducir_unidades(ocupadas, np.add)):
+        resultado.append(BITS_ENCENDIDOS[mascara] != cantidad)
+    return tuple(resultado)
+
+
+def validar_lote(tableros:np.ndarray, completos:bool = True) -> np.ndarray:
+    """
+    Valida muchos tableros a la vez: ninguna fila, columna ni bloque puede tener números repetidos.
+    Es la versión en lote de aplicar es_valido a cada celda de cada tablero.
+
+    Recibe:
+        tableros (np.ndarray): Arreglo (N, 9, 9) de enteros.
+        completos (bool): Si es True (tableros resueltos), además exige que no haya celdas vacías.
+
+    Retorna:
+        np.ndarray: Arreglo (N,) de bool con True en los tableros válidos.
+    """
+    tableros = np.asarray(tableros)
+    validos = np.empty(tableros.shape[0], dtype=bool)
+    for desde in range(0, tableros.shape[0], TAMANIO_TANDA):
+        tanda = tableros[desde:desde + TAMANIO_TANDA]
+        if completos:
+            # En un tablero lleno, cada unidad tiene 9 celdas: es válida solo si su OR tiene los 9 bits
+            ok = np.ones(tanda.shape[0], dtype=bool)
+            for mascara in reducir_unidades(bits_de_celdas(tanda), np.bitwise_or):
+                ok &= (mascara == TODOS_LOS_NUMEROS).all(axis=1)
+        else:
+            filas, columnas, bloques = unidades_invalidas(tanda)
+            ok = ~(filas.any(axis=1) | columnas.any(axis=1) | bloques.any(axis=1))
+        validos[desde:desde + TAMANIO_TANDA] = ok
+    return validos
+
+
+def comparar_con_solucion(sudokus:np.ndarray, soluciones:np.ndarray) -> np.ndarray:
+    """
+    Versión en lote de comprobar_igualdad_celda: compara cada celda de cada sudoku con su solución.
+
+    Recibe:
+        sudokus (np.ndarray): Arreglo (N, 9, 9) con los sudokus (0 = celda vacía).
+        soluciones (np.ndarray): Arreglo (N, 9, 9) con los tableros resueltos.
+
+    Retorna:
+        np.ndarray: Arreglo (N, 9, 9) de bool, True si la celda está vacía o coincide con la solución.
+    """
+    sudokus = np.asarray(sudokus)
+    return (sudokus == 0) | (sudokus == np.asarray(soluciones))
+
+
+def validar_partidas(sudokus:np.ndarray, soluciones:np.ndarray) -> np.ndarray:
+    """
+    Valida partidas completas: la solución tiene que ser un tablero válido y lleno, y cada número dado
+    del sudoku tiene que coincidir con la solución.
+
+    Recibe:
+        sudokus (np.ndarray): Arreglo (N, 9, 9) con los sudokus (0 = celda vacía).
+        soluciones (np.ndarray): Arreglo (N, 9, 9) con los tableros resueltos.
+
+    Retorna:
+        np.ndarray: Arreglo (N,) de bool con True en las partidas válidas.
+    """
+    sudokus = np.asarray(sudokus)
+    soluciones = np.asarray(soluciones)
+    validas = validar_lote(soluciones)
+    for desde in range(0, sudokus.shape[0], TAMANIO_TANDA):
+        hasta = desde + TAMANIO_TANDA
+        validas[desde:hasta] &= comparar_con_solucion(sudokus[desde:hasta], soluciones[desde:hasta]).all(axis=(1, 2))
+    return validas
+
+
+def tableros_a_arreglo(tableros:list) -> np.ndarray:
+    """
+    Convierte una lista de tableros (listas de listas o Tablero) en un arreglo (N, 9, 9) de uint8.
+    """
+    filas = [tablero.celdas if isinstance(tablero, Tablero) else bytes(num for fila in tablero for num in fila)
+             for tablero in tableros]
+    return np.frombuffer(b"".join(filas), dtype=np.uint8).reshape(len(filas), 9, 9)
+
+
+def banco_a_arreglos(banco:dict, dificultad:str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decodifica todas las partidas de una dificultad de un banco binario directamente desde el mmap,
+    sin pasar por texto_a_tablero.
+
+    Recibe:
+        banco (dict): Banco abierto con abrir_banco.
+        dificultad (str): "Facil", "Medio" o "Dificil".
+
+    Retorna:
+        tuple[np.ndarray, np.ndarray]: (sudokus, soluciones), dos arreglos (N, 9, 9) de uint8.
+    """
+    primero, cantidad = banco["indice"].get(dificultad, (0, 0))
+    registros = np.frombuffer(banco["datos"], dtype=np.uint8, count=cantidad * TAMANIO_REGISTRO,
+                              offset=banco["inicio"] + primero * TAMANIO_REGISTRO).reshape(cantidad, TAMANIO_REGISTRO)
+    # Cada byte tiene dos celdas: la primera en los 4 bits altos (ver empaquetar_tablero)
+    celdas = np.empty((cantidad, 2 * TAMANIO_REGISTRO), dtype=np.uint8)
+    celdas[:, 0::2] = registros >> 4
+    celdas[:, 1::2] = registros & 0x0F
+    sudokus = celdas[:, :81].reshape(cantidad, 9, 9)
+    soluciones = celdas[:, 2 * BYTES_TABLERO:2 * BYTES_TABLERO + 81].reshape(cantidad, 9, 9)
+    return sudokus, soluciones
+
+
+def auditar_banco(ruta:str) -> bool:
+    """
+    Valida todas las partidas de un banco binario e imprime el resultado por dificultad.
+
+    Recibe:
+        ruta (str): Archivo del banco.
+
+    Retorna:
+        bool: True si todas las partidas son válidas.
+    """
+    banco = abrir_banco(ruta)
+    todo_valido = True
+    for dificultad in banco["indice"]:
+        inicio = time.perf_counter()
+        sudokus, soluciones = banco_a_arreglos(banco, dificultad)
+        soluciones_validas = validar_lote(soluciones)
+        validas = validar_partidas(sudokus, soluciones)
+        duracion = time.perf_counter() - inicio
+        cantidad = validas.shape[0]
+        print(f"{dificultad}: {cantidad} partidas, {cantidad - int(soluciones_validas.sum())} soluciones inválidas, "
+              f"{int(soluciones_validas.sum() - validas.sum())} con números dados que no coinciden "
+              f"({duracion:.2f} s)")
+        if not validas.all():
+            todo_valido = False
+            print(f"    Primeras partidas inválidas: {np.flatnonzero(~validas)[:10].tolist()}")
+    cerrar_banco(banco)
+    return todo_valido
+
+
+def benchmark_validador(cantidad:int) -> None:
+    """
+    Valida `cantidad` tableros (copias de 1000 tableros generados, con uno de cada mil alterado)
+    e imprime cuántos tableros por segundo se validan.
+    """
+    random.seed(0)
+    base = tableros_a_arreglo([generar_tablero() for _ in range(1000)])
+    tableros = np.tile(base, ((cantidad + 999) // 1000, 1, 1))[:cantidad].copy()
+    alterados = np.arange(0, cantidad, 1000)
+    tableros[alterados, 0, 0] = tableros[alterados, 0, 1]  # Repite un número en la primera fila
+
+    inicio = time.perf_counter()
+    validos = validar_lote(tableros)
+    duracion = time.perf_counter() - inicio
+    print(f"validar_lote: {cantidad} tableros en {duracion:.2f} s ({cantidad / duracion:,.0f} tableros/s), "
+          f"{cantidad - int(validos.sum())} inválidos (se alteraron {alterados.shape[0]})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Valida muchos tableros de Sudoku a la vez con NumPy.")
+    parser.add_argument("banco", nargs="?", help="Banco binario a auditar.")
+    parser.add_argument("--benchmark", type=int, default=None, metavar="N", help="Mide la validación de N tableros.")
+    argumentos = parser.parse_args()
+
+    if argumentos.benchmark:
+        benchmark_validador(argumentos.benchmark)
+    if argumentos.banco:
+        if not auditar_banco(argumentos.banco):
+            raise SystemExit(1)
+    if not argumentos.benchmark and not argumentos.banco:
+        parser.print_help()